@@ -1,8 +1,3 @@
-import os
-
-from importlib import import_module
-
-
 from fastapi import Depends, FastAPI
 
 from fastapi.responses import FileResponse
@@ -21,9 +16,20 @@ from core.database import SessionAsync
 
 import asyncio
 from core.config.globals import settings
-import os
-import asyncio
-from typing import List, Dict, Any
+from core.utils.module_registry import registry
+from typing import Any, Awaitable, Callable, Dict, List
+
+
+# Startup hooks of the admin modules (InitTemplate.startup), run by the lifespan
+admin_startup: List[Callable[[], Awaitable[Any]]] = []
+
+
+async def run_admin_startup():
+    for startup in admin_startup:
+        try:
+            await startup()
+        except Exception as e:
+            print(f"Error running admin startup {startup.__qualname__}: {e}")
 
 
 def init_admin(templates: Jinja2Templates, app: FastAPI) -> List[Dict[str, Any]]:
@@ -33,20 +39,21 @@ def init_admin(templates: Jinja2Templates, app: FastAPI) -> List[Dict[str, Any]]
 
         return FileResponse("admin/static/favicon.ico")
 
-    module_names = [f for f in os.listdir("admin/templates")]
+    for entry in registry.discover("admin/templates", "controller.py", recursive=False):
 
-    for module_name in module_names:
+        module_name = entry.name
 
         try:
 
-            if module_name.find(".py") != -1 or module_name.find("pycache") != -1:
-                continue
-
-            module = import_module(f"admin.templates.{module_name}.controller")
+            module = registry.load(entry)
 
             print(f"Importing ADMIN module {module_name}")
 
-            router: APIRouter = module.InitTemplate(templates).add_all()
+            template = module.InitTemplate(templates)
+            router: APIRouter = template.add_all()
+
+            if hasattr(template, "startup"):
+                admin_startup.append(template.startup)
 
             # Apply dependencies when including the router, not after
             # if mode develoment not apply role verify cookie
@@ -8,6 +8,7 @@ from core.database import get_async_db
 from app.modules.users.models import User
 from app.modules.auth.otp import generate_otp_secret, get_otp_provisioning_uri, generate_qr_code_base64, verify_otp_code
 from core.middlewares.role_verify_cookie import ROLE_VERIFY_COOKIE
+from core.tasks import run_cpu
 
 class InitTemplate:
     def __init__(self, templates: Jinja2Templates):
@@ -47,7 +48,7 @@ class InitTemplate:
             
             secret = generate_otp_secret()
             uri = get_otp_provisioning_uri(secret, user.username)
-            qr_code = generate_qr_code_base64(uri)
+            qr_code = await run_cpu(generate_qr_code_base64, uri)
             
             return self.templates.TemplateResponse(
                 "partials/account/2fa_setup.html",
@@ -92,7 +93,7 @@ class InitTemplate:
                         # Use hx-target to replace the modal body.
                          "error": "Invalid Code",
                          # We need to regenerate QR to show it again if we replace the whole body
-                         "qr_code": generate_qr_code_base64(get_otp_provisioning_uri(secret, user.username))
+                         "qr_code": await run_cpu(generate_qr_code_base64, get_otp_provisioning_uri(secret, user.username))
                     }
                 )
 
@@ -3,6 +3,8 @@ from fastapi.responses import RedirectResponse
 from fastapi.routing import APIRouter
 from fastapi.templating import Jinja2Templates
 
+from app.modules.auth.services import revoke_token
+
 
 class InitTemplate:
     def __init__(self, templates: Jinja2Templates):
@@ -12,8 +14,11 @@ class InitTemplate:
     def add_all(self) -> APIRouter:
         @self.router.get("")
         async def logout(request: Request):
+            await revoke_token(request.cookies.get("access_token"))
+            await revoke_token(request.cookies.get("refresh_token"))
             response = RedirectResponse(url="/admin/sign-in", status_code=302)
             response.delete_cookie(key="access_token")
+            response.delete_cookie(key="refresh_token", path="/auth/refresh")
             return response
 
         return self.router
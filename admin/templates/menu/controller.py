@@ -1,4 +1,4 @@
-from fastapi import Request, Depends
+from fastapi import Request, Depends, Response
 from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.routing import APIRouter
 from fastapi.templating import Jinja2Templates
@@ -7,7 +7,6 @@ from core.database import get_async_db, SessionAsync
 from admin.templates.menu.services import MenuService
 from admin.templates.menu.seed import ensure_default_menu
 from fastapi import Depends
-import asyncio
 
 # Menu Controller
 class InitTemplate:
@@ -16,6 +15,8 @@ class InitTemplate:
         try:
             async with SessionAsync() as session:
                 await ensure_default_menu(session)
+                warmed = await MenuService().warm(session)
+                print(f"[v] Menu cache warmed for {warmed} roles")
                 await session.close()
         except Exception as e:
             print(f"Error initializing menu: {e}")
@@ -24,7 +25,10 @@ class InitTemplate:
     def __init__(self, templates: Jinja2Templates):
         self.templates = templates
         self.router = APIRouter()
-        asyncio.ensure_future(self.init_menu())
+
+    async def startup(self):
+        # Run from the application lifespan (see run_admin_startup)
+        await self.init_menu()
 
 
     def add_page(self):
@@ -51,7 +55,11 @@ class InitTemplate:
                 return []
             
             user = request.state.user
-            return await service.get_menu(user, session)
+            # Served pre-serialized from the menu cache, skipping re-encoding
+            return Response(
+                content=await service.get_menu_json(user, session),
+                media_type="application/json",
+            )
 
 
     def add_all(self):
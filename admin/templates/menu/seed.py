@@ -1,12 +1,15 @@
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.modules.permissions.models import Permission
+from app.modules.permissions.bitset import permission_index
 from app.modules.permissions.meta.models import MetaPermissions
+from app.modules.permissions.meta.services import bump_meta_generation
 from .const import DEFAULT_MENU
 
 async def ensure_default_menu(session: AsyncSession):
     # Check if any menu permission exists (to avoid duplicates or re-seeding)
     
+    changed = False
     try:
         for item in DEFAULT_MENU:
             stmt = select(Permission).where(Permission.name == item["name"])
@@ -17,6 +20,7 @@ async def ensure_default_menu(session: AsyncSession):
                 perm = Permission(name=item["name"], action=item["action"], type=item["type"], description=item["desc"])
                 session.add(perm)
                 await session.flush() # get ID
+                changed = True
             
             # Check/Add Meta for both new and existing permissions
             for k, v in item["meta"].items(): # type: ignore
@@ -31,8 +35,12 @@ async def ensure_default_menu(session: AsyncSession):
                 if not existing_meta:
                     meta = MetaPermissions(ref_permission=perm.id, key=k, value=v)
                     session.add(meta)
+                    changed = True
         
         await session.commit()
+        if changed:
+            await permission_index.invalidate()
+            await bump_meta_generation()
     except Exception as e:
         await session.rollback()
         raise e
@@ -1,13 +1,19 @@
-from typing import List, Dict, Any
+import hashlib
+import json
+from typing import List, Dict, Any, Sequence
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.modules.permissions.meta.models import MetaPermissions
-from app.modules.users.models import User
-from core.database import get_async_db
-from app.modules.permissions.models import Permission
-from app.modules.role_permissions.models import RolePermission
+from app.modules.permissions.meta.services import get_meta_generation
+from app.modules.roles.models import Role
+from app.modules.role_permissions.services import get_role_permission_set
 from app.modules.users.schemas import RSUserTokenData
+from core.cache import cache
+
+
+MENU_CACHE_TTL = 60 * 60
+EMPTY_MENU = "[]"
 
 
 class MenuService:
@@ -18,23 +24,51 @@ class MenuService:
         """
         Generates the sidebar menu for the user based on their permissions and meta data.
         """
+        return json.loads(await self.get_menu_json(user, session))
+
+    async def get_menu_json(self, user: RSUserTokenData, session: AsyncSession) -> str:
+        """
+        Returns the menu of the user's role already serialized to JSON.
+        """
         if not user.role:
-            return []
+            return EMPTY_MENU
+        return await self.get_role_menu_json(user.role, session)
 
-        stmt = select(RolePermission.permission_id).where(
-            RolePermission.role_id == user.role
-        )
-        result = await session.execute(stmt)
-        role_permissions_ids = result.scalars().all()
+    async def get_role_menu_json(self, role_id: int | str, session: AsyncSession) -> str:
+        """
+        The menu only depends on the role's permissions and on meta_permissions,
+        so it is cached under the meta generation and a digest of the role
+        bitmap: grants, revokes and meta writes all land on a new key, and
+        roles with the same permissions share the entry.
+        """
+        role_permissions = await get_role_permission_set(session, role_id)
+        if not role_permissions:
+            return EMPTY_MENU
 
-        if not role_permissions_ids:
-            return []
+        digest = hashlib.sha1(role_permissions.dumps().encode()).hexdigest()[:16]
+        key = f"menu:{await get_meta_generation()}:{digest}"
+
+        cached = await cache.get(key)
+        if cached:
+            return cached
 
+        menu_json = json.dumps(await self.compile_menu(role_permissions.ids(), session))
+        await cache.set(key, menu_json, ttl=MENU_CACHE_TTL)
+        return menu_json
+
+    async def compile_menu(
+        self, permission_ids: Sequence[int], session: AsyncSession
+    ) -> List[Dict[str, Any]]:
+        """
+        Groups the menu meta of the given permissions into sorted menu items.
+        """
+        if not permission_ids:
+            return []
 
         #type ignore is needed IDE antigravity doesn't recognize the in_ method xd
         stmt = (
             select(MetaPermissions)
-            .where(MetaPermissions.ref_permission.in_(role_permissions_ids)) # type: ignore
+            .where(MetaPermissions.ref_permission.in_(permission_ids)) # type: ignore
         )
         
         result = await session.execute(stmt)
@@ -69,3 +103,13 @@ class MenuService:
         menu_items.sort(key=lambda x: int(x.get("order", 999)))
 
         return menu_items
+
+    async def warm(self, session: AsyncSession) -> int:
+        """
+        Compiles and caches the menu of every existing role.
+        """
+        result = await session.execute(select(Role.id).where(Role.is_deleted == False))
+        role_ids = result.scalars().all()
+        for role_id in role_ids:
+            await self.get_role_menu_json(role_id, session)
+        return len(role_ids)
@@ -5,6 +5,7 @@ from fastapi.templating import Jinja2Templates
 
 from core.database import BaseAsync
 from core.utils.mermaid import generate_mermaid_diagram
+from core.tasks import run_in_thread
 
 
 class InitTemplate:
@@ -16,7 +17,8 @@ class InitTemplate:
         @self.router.get("", response_class=HTMLResponse)
         async def models_diagram_page(request: Request):
             # Generate the Mermaid diagram syntax
-            diagram_syntax = generate_mermaid_diagram(BaseAsync)
+            # Walks every mapper; the declarative base can't be sent to a process
+            diagram_syntax = await run_in_thread(generate_mermaid_diagram, BaseAsync)
 
             return self.templates.TemplateResponse(
                 "pages/models_diagram.html",
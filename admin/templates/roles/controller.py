@@ -9,6 +9,8 @@ from core.database import get_async_db
 from app.modules.roles.models import Role
 from app.modules.permissions.models import Permission
 from core.database import SessionAsync
+from app.modules.role_permissions.services import set_role_permissions
+from app.modules.roles.services import invalidate_role, invalidate_role_level
 
 
 class InitTemplate:
@@ -62,14 +64,16 @@ class InitTemplate:
         ):
             try:
                 # Create role with selected permissions
+                # Grants live in the pivot table; roles.permissions is derived from it
                 role = Role(
                     name=name,
                     description=description,
                     level=level,
-                    permissions=permissions if permissions else [],
+                    permissions=[],
                     disabled=False,
                 )
                 await role.save(db)
+                await set_role_permissions(db, role.id, permissions)
 
                 # Get all permissions for re-rendering form
                 all_perms = await Permission.find_all(db, status="exists")
@@ -141,9 +145,11 @@ class InitTemplate:
                         "name": name,
                         "description": description,
                         "level": level,
-                        "permissions": permissions if permissions else [],
                     },
                 )
+                await invalidate_role_level(role.id)
+                await set_role_permissions(db, role.id, permissions)
+                await db.refresh(role)
 
                 all_perms = await Permission.find_all(db, status="exists")
                 all_permissions = [p for p in all_perms]
@@ -188,6 +194,7 @@ class InitTemplate:
         ):
             try:
                 await Role.delete(db, role_id)
+                await invalidate_role(role_id)
                 return HTMLResponse(content="", status_code=200)
             except Exception as e:
                 print(e)
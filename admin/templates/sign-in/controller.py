@@ -15,7 +15,10 @@ from app.modules.auth.services import (
     create_token,
     create_refresh_token,
     REFRESH_TOKEN_EXPIRE_MINUTES,
+    SIGN_IN_RATE_LIMIT,
+    VERIFY_OTP_RATE_LIMIT,
 )
+from app.modules.role_permissions.services import role_permissions_claim
 from .services import has_permission
 
 
@@ -37,7 +40,11 @@ class InitTemplate:
 
     def add_partials(self):
 
-        @self.router.post("/partial/sign-in", response_class=HTMLResponse)
+        @self.router.post(
+            "/partial/sign-in",
+            response_class=HTMLResponse,
+            dependencies=[Depends(SIGN_IN_RATE_LIMIT)],
+        )
         async def admin_sign_in(
             request: Request,
             username: Annotated[str, Form()],
@@ -85,6 +92,7 @@ class InitTemplate:
                         "role": user.role,
                         "full_name": user.full_name,
                         "id": user.id,
+                        **await role_permissions_claim(db, user.role),
                     },
                     expires_time=expires_time,
                 )
@@ -127,7 +135,11 @@ class InitTemplate:
                 )
                 return response
 
-        @self.router.post("/partial/verify-otp", response_class=HTMLResponse)
+        @self.router.post(
+            "/partial/verify-otp",
+            response_class=HTMLResponse,
+            dependencies=[Depends(VERIFY_OTP_RATE_LIMIT)],
+        )
         async def admin_verify_otp(
             request: Request,
             otp_code: Annotated[str, Form()],
@@ -166,6 +178,7 @@ class InitTemplate:
                         "role": user.role_ref,
                         "full_name": user.full_name,
                         "id": user.id,
+                        **await role_permissions_claim(db, user.role_ref),
                     },
                     expires_time=expires_time,
                 )
@@ -3,6 +3,7 @@ from sqlalchemy.future import select
 from app.modules.permissions.models import Permission
 from app.modules.roles.models import Role
 from app.modules.permissions.const import admin_type
+from app.modules.role_permissions.services import role_has_permission
 
 from core.database import get_async_db
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -26,15 +27,6 @@ async def has_permission(db: AsyncSession, role_id: int, route_name: str, method
             return False
         
 
-        role = await Role.find_one(db, role_id)
-
-        if role is None:
-            return False
-        
-
-        if permission.id in set(role.permissions):
-            return True
-        
-        return False
+        return await role_has_permission(db, role_id, permission.id)
     except Exception as e:
         return False
@@ -26,7 +26,9 @@ class InitTemplate:
             # Get all users with roles
             users = await User.find_some(db, status="exists", pag=pag, ord=ord)
 
-            roles_in_users = await Role.find_all(db)
+            # Only the roles referenced by this page, in one query
+            role_ids = list({user.role_ref for user in users})
+            roles_in_users, _ = await Role.find_many(db, role_ids)
 
             roles_by_id = {}
 
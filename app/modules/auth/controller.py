@@ -20,9 +20,14 @@ from .services import (
     get_user,
     get_user,
     REFRESH_TOKEN_EXPIRE_MINUTES,
-    get_current_user
+    get_current_user,
+    revoke_token,
+    SIGN_IN_RATE_LIMIT,
+    VERIFY_OTP_RATE_LIMIT,
 )
+from app.modules.role_permissions.services import role_permissions_claim
 from .otp import generate_otp_secret, verify_otp_code, get_otp_provisioning_uri, generate_qr_code_base64
+from core.tasks import run_cpu
 from pydantic import BaseModel
 
 # prefix /auth
@@ -37,7 +42,7 @@ def token(token: str = Depends(oauth2_schema)):
     return token
 
 
-@router.post("/sign-in", tags=[tag])
+@router.post("/sign-in", tags=[tag], dependencies=[Depends(SIGN_IN_RATE_LIMIT)])
 async def sign_in(user_data: RQUserLogin, db: AsyncSession = Depends(get_async_db)):
     try:
         user = await authenticade_user(
@@ -82,6 +87,7 @@ async def sign_in(user_data: RQUserLogin, db: AsyncSession = Depends(get_async_d
                 "full_name": user.full_name,
                 "id": user.id,
                 "uid": user.uid,
+                **await role_permissions_claim(db, user.role),
             }
         )
 
@@ -185,11 +191,47 @@ async def refresh_token_endpoint(
     return response
 
 
+@router.post("/logout", tags=[tag])
+async def logout(
+    request: Request,
+    access_token: Optional[str] = Cookie(None),
+    refresh_token: Optional[str] = Cookie(None),
+):
+    # Bearer clients send the access token in the header instead of the cookie
+    authorization = request.headers.get("Authorization", "")
+    if authorization.lower().startswith("bearer "):
+        access_token = authorization[7:]
+
+    await revoke_token(access_token)
+    await revoke_token(refresh_token or request.headers.get("refresh-token"))
+
+    response = JSONResponse(content={"message": "Signed out"})
+    response.delete_cookie(key="access_token")
+    response.delete_cookie(key="refresh_token", path="/auth/refresh")
+    return response
+
+
+class RQRevokeToken(BaseModel):
+    token: str
+
+
+@router.post("/revoke", tags=[tag])
+async def revoke(request: RQRevokeToken):
+    """
+    Revokes any still valid token, e.g. a leaked refresh token.
+    Holding the token is what authorizes its revocation.
+    """
+    payload = await revoke_token(request.token)
+    if not payload:
+        raise HTTPException(status_code=400, detail="Invalid token")
+    return {"message": "Token revoked", "jti": payload.jti}
+
+
 class OTPVerifyRequest(BaseModel):
     otp_code: str
     temp_token: str
 
-@router.post("/verify-otp", tags=[tag])
+@router.post("/verify-otp", tags=[tag], dependencies=[Depends(VERIFY_OTP_RATE_LIMIT)])
 async def verify_otp(request: OTPVerifyRequest, db: AsyncSession = Depends(get_async_db)):
     # Decode temp token
     payload = decode_token(request.temp_token)
@@ -217,10 +259,11 @@ async def verify_otp(request: OTPVerifyRequest, db: AsyncSession = Depends(get_a
             data={
                 "sub": user.username,
                 "email": user.email,
-                "role": user.role,
+                "role": user.role_ref,
                 "full_name": user.full_name,
                 "id": user.id,
                 "uid": user.uid,
+                **await role_permissions_claim(db, user.role_ref),
             }
         )
     
@@ -228,7 +271,7 @@ async def verify_otp(request: OTPVerifyRequest, db: AsyncSession = Depends(get_a
             data={
                 "sub": user.username,
                 "email": user.email,
-                "role": user.role,
+                "role": user.role_ref,
                 "full_name": user.full_name,
                 "id": user.uid,
             }
@@ -265,7 +308,7 @@ async def verify_otp(request: OTPVerifyRequest, db: AsyncSession = Depends(get_a
 async def setup_2fa(current_user=Depends(get_current_user)):
     secret = generate_otp_secret()
     uri = get_otp_provisioning_uri(secret, current_user.username)
-    qr_b64 = generate_qr_code_base64(uri)
+    qr_b64 = await run_cpu(generate_qr_code_base64, uri)
     
     return {
         "secret": secret,
@@ -276,18 +319,16 @@ async def setup_2fa(current_user=Depends(get_current_user)):
 @router.post("/2fa/enable", tags=[tag])
 async def enable_2fa(request: OTPEnableRequest, current_user=Depends(get_current_user), db: AsyncSession = Depends(get_async_db)):
     if verify_otp_code(request.secret, request.otp_code):
-        current_user.otp_secret = request.secret
-        current_user.otp_enabled = True
-        await current_user.save(db)
+        await User.update(
+            db, current_user.id, {"otp_secret": request.secret, "otp_enabled": True}
+        )
         return {"message": "2FA enabled successfully"}
     else:
         raise HTTPException(status_code=400, detail="Invalid OTP code")
 
 @router.post("/2fa/disable", tags=[tag])
 async def disable_2fa(current_user=Depends(get_current_user), db: AsyncSession = Depends(get_async_db)):
-    current_user.otp_enabled = False
-    current_user.otp_secret = None
-    await current_user.save(db)
+    await User.update(db, current_user.id, {"otp_enabled": False, "otp_secret": None})
     return {"message": "2FA disabled successfully"}
 
 
@@ -0,0 +1,198 @@
+import asyncio
+import hashlib
+import math
+import time
+from typing import Dict, Optional
+
+import redis.asyncio as redis
+
+from core.config.globals import settings
+
+from .types import TokenData
+
+
+REVOKED_TOKENS_KEY = "revoked_tokens"
+REVOKED_TOKENS_CHANNEL = "revoked_tokens:events"
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over a bytearray. ``k`` bit positions are
+    derived from one BLAKE2b digest with double hashing.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        capacity = max(1, capacity)
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, value: str):
+        digest = hashlib.blake2b(value.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hashes):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, value: str) -> None:
+        for position in self._positions(value):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, value: str) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(value)
+        )
+
+
+class RevocationStore:
+    """
+    Revoked token ids (``jti``) with their expiry.
+
+    Redis holds the shared list in a sorted set scored by expiry, so
+    entries age out with the tokens they revoke. Every worker mirrors it
+    in memory and hears new revocations through pub/sub, with a periodic
+    resync as a safety net. ``is_revoked`` never leaves the process: the
+    Bloom filter answers the common "not revoked" case and the exact mirror
+    settles the rare positives.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(RevocationStore, cls).__new__(cls)
+            cls._instance._initialize()
+        return cls._instance
+
+    def _initialize(self):
+        self.capacity = settings.TOKEN_REVOCATION_CAPACITY
+        self.resync_interval = settings.TOKEN_REVOCATION_RESYNC_SECONDS
+        self._revoked: Dict[str, float] = {}
+        self._bloom = BloomFilter(self.capacity)
+        self._client: Optional[redis.Redis] = None
+        self._tasks: list[asyncio.Task] = []
+
+        try:
+            self._client = redis.Redis(
+                host=settings.REDIS_HOST, port=settings.REDIS_PORT, decode_responses=True
+            )
+        except Exception as e:
+            print(f"Revocation Warning: Redis unavailable ({e}). Revocations stay local.")
+            self._client = None
+
+    # --- Lookups ---
+
+    def is_revoked(self, jti: Optional[str]) -> bool:
+        if not jti or jti not in self._bloom:
+            return False
+        expires_at = self._revoked.get(jti)
+        return expires_at is not None and expires_at > time.time()
+
+    def is_token_revoked(self, data: TokenData) -> bool:
+        return self.is_revoked(data.jti)
+
+    # --- Writes ---
+
+    def _remember(self, jti: str, expires_at: float) -> None:
+        self._revoked[jti] = expires_at
+        self._bloom.add(jti)
+
+    async def revoke(self, jti: str, expires_at: float) -> None:
+        """Revokes a token id until ``expires_at`` (the token's own exp)."""
+        if expires_at <= time.time():
+            return
+        self._remember(jti, expires_at)
+        if self._client is None:
+            return
+        try:
+            await self._client.zadd(REVOKED_TOKENS_KEY, {jti: expires_at})
+            await self._client.publish(REVOKED_TOKENS_CHANNEL, f"{jti}:{expires_at}")
+        except Exception as e:
+            print(f"Revocation Warning: could not publish revocation ({e})")
+
+    async def revoke_token(self, data: Optional[TokenData]) -> None:
+        if data is not None and data.jti and data.exp:
+            await self.revoke(data.jti, float(data.exp))
+
+    # --- Synchronization ---
+
+    async def sync(self) -> None:
+        """Reloads the mirror from Redis, dropping expired ids and rebuilding the filter."""
+        now = time.time()
+        entries = []
+        if self._client is not None:
+            await self._client.zremrangebyscore(REVOKED_TOKENS_KEY, "-inf", now)
+            entries = await self._client.zrangebyscore(
+                REVOKED_TOKENS_KEY, now, "+inf", withscores=True
+            )
+        # Read the local mirror last so ids received while awaiting are kept
+        revoked = {jti: exp for jti, exp in self._revoked.items() if exp > now}
+        revoked.update({jti: float(exp) for jti, exp in entries})
+
+        bloom = BloomFilter(max(self.capacity, len(revoked) * 2))
+        for jti in revoked:
+            bloom.add(jti)
+        self._revoked, self._bloom = revoked, bloom
+
+    async def _listen(self) -> None:
+        delay = 1.0
+        while True:
+            pubsub = self._client.pubsub()  # type: ignore
+            try:
+                await pubsub.subscribe(REVOKED_TOKENS_CHANNEL)
+                # Catch up on revocations published while we were unsubscribed
+                if delay > 1.0:
+                    await self.sync()
+                delay = 1.0
+                async for message in pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    jti, _, expires_at = message["data"].rpartition(":")
+                    if jti:
+                        self._remember(jti, float(expires_at))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Revocation Warning: subscription lost ({e}), retrying in {delay:.0f}s")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.resync_interval)
+            finally:
+                await pubsub.reset()
+
+    async def _resync_loop(self, failures: int = 0) -> None:
+        while True:
+            delay = self.resync_interval
+            if failures:
+                # Back off from 1s up to the regular interval while Redis is down
+                delay = min(2 ** (failures - 1), delay)
+            await asyncio.sleep(delay)
+            try:
+                await self.sync()
+                failures = 0
+            except Exception as e:
+                failures += 1
+                print(f"Revocation Warning: resync failed ({e})")
+
+    async def start(self) -> None:
+        if self._tasks:
+            return
+        failures = 0
+        try:
+            await self.sync()
+        except Exception as e:
+            # Keep the client: the listener and resync reconnect once Redis is back
+            print(f"Revocation Warning: Redis unavailable ({e}). Revocations stay local until it returns.")
+            failures = 1
+        if self._client is not None:
+            self._tasks.append(asyncio.create_task(self._listen()))
+        self._tasks.append(asyncio.create_task(self._resync_loop(failures)))
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        self._tasks.clear()
+
+
+# Singleton Instance
+revocation_store = RevocationStore()
@@ -2,29 +2,32 @@ from core.config.globals import settings
 import time
 from typing import Union
 from fastapi import HTTPException, Depends
-from passlib.context import CryptContext
 from sqlalchemy import Result, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from core.database import get_async_db
+from core.services.password_hasher import password_hasher
+from core.ratelimit import RateLimitRule, rate_limit
 
 from app.modules.users.models import User
+from app.modules.users.schemas import RSUserIdentity
+from app.modules.users.identity import cache_user_identity, get_cached_user_identity
 from core.services.init_subscriber import initialize_subscriber_role
 
 from .schemas import INUser, RQUser, RSUser
 from .types import TokenData
+from .token_cache import token_cache
+from .revocation import revocation_store
 
-import bcrypt
-from bcrypt import _bcrypt # type: ignore
 from fastapi.security import OAuth2PasswordBearer
 
 oauth2_schema = OAuth2PasswordBearer("auth/sign-in")
 
-if not hasattr(bcrypt, "__about__"):
-   setattr(bcrypt, "__about__", type("About", (object,), {"__version__": _bcrypt.__version_ex__}))
-
 import jwt
+import uuid
+
+# Revoked token ids are rejected on every decode, cached or not
+token_cache.add_denylist_check(revocation_store.is_token_revoked)
 
-hash_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 SECRET_KEY_JWT = settings.JWT_KEY.encode()
 USED_ALGORITHM = settings.JWT_ALG
 
@@ -39,8 +42,8 @@ async def get_user(db: AsyncSession, username: str) -> User | None:
         return None
 
 
-def verify_password(plane_password: str, current_password: str) -> bool:
-    return hash_context.verify(plane_password, current_password)
+async def verify_password(plane_password: str, current_password: str) -> bool:
+    return await password_hasher.verify(plane_password, current_password)
 
 
 async def authenticade_user(db: AsyncSession, username: str, password: str) -> RSUser:
@@ -48,9 +51,15 @@ async def authenticade_user(db: AsyncSession, username: str, password: str) -> R
         user = await get_user(db, username)
         if user is None:
             raise HTTPException(status_code=404, detail="User not found")
-        same_passowords = verify_password(password, user.password)
+        same_passowords, new_hash = await password_hasher.verify_and_update(
+            password, user.password
+        )
         if same_passowords is False:
             raise HTTPException(status_code=401, detail="Incorrect password")
+        if new_hash:
+            # Stored hash used outdated parameters, upgrade it transparently
+            user.password = new_hash
+            await user.save(db)
         result = RSUser(
             uid=user.uid,
             id=user.id,
@@ -66,6 +75,23 @@ async def authenticade_user(db: AsyncSession, username: str, password: str) -> R
         raise e
 
 
+# Credential checks are throttled before any lookup or bcrypt work
+SIGN_IN_RATE_LIMIT = rate_limit(
+    "sign_in",
+    RateLimitRule("ip", settings.LOGIN_RATE_LIMIT_IP_PER_MINUTE, 60),
+    RateLimitRule("username", settings.LOGIN_RATE_LIMIT_USERNAME_PER_MINUTE, 60),
+    RateLimitRule("global", settings.LOGIN_RATE_LIMIT_GLOBAL_PER_SECOND, 1),
+)
+
+# The partial 2FA token identifies the login attempt being completed
+VERIFY_OTP_RATE_LIMIT = rate_limit(
+    "verify_otp",
+    RateLimitRule("ip", settings.LOGIN_RATE_LIMIT_IP_PER_MINUTE, 60),
+    RateLimitRule("username", settings.LOGIN_RATE_LIMIT_USERNAME_PER_MINUTE, 60),
+    RateLimitRule("global", settings.LOGIN_RATE_LIMIT_GLOBAL_PER_SECOND, 1),
+    username_field="temp_token",
+)
+
 ACCESS_TOKEN_EXPIRE_MINUTES = 30  # 30 minutes
 REFRESH_TOKEN_EXPIRE_MINUTES = 60 * 24 * 7  # 7 days
 
@@ -75,7 +101,7 @@ async def create_user(db: AsyncSession, user_data: RQUser) -> dict | None:
         subscriber_role = await initialize_subscriber_role(db)
         user = await User(
             username=user_data.username,
-            password=hash_context.hash(user_data.password),
+            password=await password_hasher.hash(user_data.password),
             email=user_data.email,
             full_name=user_data.full_name,
             role_ref=subscriber_role.id,
@@ -103,7 +129,7 @@ def create_token(data: dict, expires_time: Union[float, None] = None) -> str:
     copy_user = data.copy()
     if "type" not in copy_user:
         copy_user["type"] = "access"
-    copy_user.update({"exp": expires, "iat": current_time})
+    copy_user.update({"exp": expires, "iat": current_time, "jti": uuid.uuid4().hex})
     token_jwt = jwt.encode(copy_user, key=SECRET_KEY_JWT, algorithm=USED_ALGORITHM)
     return token_jwt
 
@@ -115,12 +141,18 @@ def create_refresh_token(data: dict, expires_time: Union[float, None] = None) ->
     else:
         expires = current_time + int(expires_time)
     copy_user = data.copy()
-    copy_user.update({"exp": expires, "type": "refresh", "iat": current_time})
+    copy_user.update(
+        {"exp": expires, "type": "refresh", "iat": current_time, "jti": uuid.uuid4().hex}
+    )
     token_jwt = jwt.encode(copy_user, key=SECRET_KEY_JWT, algorithm=USED_ALGORITHM)
     return token_jwt
 
 
 def decode_token(token: str) -> TokenData | None:
+    # Tokens are reused for their whole lifetime, skip the signature check on repeats
+    cached = token_cache.get(token)
+    if cached is not None:
+        return cached
     try:
         decode_cotent: dict = jwt.decode(
             token, key=SECRET_KEY_JWT, algorithms=[USED_ALGORITHM]
@@ -131,17 +163,67 @@ def decode_token(token: str) -> TokenData | None:
         if not is_valid_time:
             return None
 
-        return TokenData(**decode_cotent)
+        token_data = TokenData(**decode_cotent)
+        if token_cache.is_denied(token_data):
+            return None
+        token_cache.put(token, token_data)
+        return token_data
     except Exception as e:
         return None
 
+async def revoke_token(token: str | None) -> TokenData | None:
+    """Revokes a still valid token until it expires. Returns its claims."""
+    if not token:
+        return None
+    payload = decode_token(token)
+    await revocation_store.revoke_token(payload)
+    return payload
+
+async def get_user_identity(db: AsyncSession, payload: TokenData) -> RSUserIdentity | None:
+    """
+    Resolves the auth projection of the token's user, from the identity
+    cache when possible. Only the projected columns are selected on a miss.
+    """
+    user_id = payload.id
+    if user_id:
+        identity = await get_cached_user_identity(user_id)
+        if identity is not None:
+            return identity
+
+    query = select(
+        User.id, User.uid, User.username, User.email, User.full_name,
+        User.role_ref, User.otp_enabled, User.created_at,
+    ).where(User.is_deleted == False)
+    if user_id and str(user_id).isdigit():
+        query = query.where(User.id == int(user_id))
+    elif user_id:
+        query = query.where(User.uid == str(user_id))
+    else:
+        query = query.where(User.username == payload.sub)
+
+    row = (await db.execute(query)).one_or_none()
+    if row is None:
+        return None
+
+    identity = RSUserIdentity(
+        id=row.id,
+        uid=row.uid,
+        username=row.username,
+        email=row.email,
+        full_name=row.full_name,
+        role=row.role_ref,
+        otp_enabled=row.otp_enabled,
+        created_at=row.created_at,
+    )
+    await cache_user_identity(identity)
+    return identity
+
 # We need a dependency to get current user from token for these protected endpoints
-async def get_current_user(token: str = Depends(oauth2_schema), db: AsyncSession = Depends(get_async_db)):
+async def get_current_user(token: str = Depends(oauth2_schema), db: AsyncSession = Depends(get_async_db)) -> RSUserIdentity:
     payload = decode_token(token)
     if not payload:
         raise HTTPException(status_code=401, detail="Invalid token")
-    query = await User.find_by_colunm(db, "username", payload.sub)
-    user = query.scalar_one_or_none()
+    user = await get_user_identity(db, payload)
     if not user:
         raise HTTPException(status_code=401, detail="User not found")
     return user
\ No newline at end of file
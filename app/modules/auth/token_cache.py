@@ -0,0 +1,116 @@
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+
+from prometheus_client import Counter
+
+from core.config.globals import settings
+
+from .types import TokenData
+
+
+# Define Prometheus metrics
+TOKEN_CACHE_LOOKUPS = Counter(
+    "jwt_cache_lookups_total",
+    "Verified token cache lookups by result",
+    ["result"],
+)
+
+# Returns True when the token must be rejected even if its signature is valid
+DenylistCheck = Callable[[TokenData], bool]
+
+
+class VerifiedTokenCache:
+    """
+    Bounded LRU of already verified tokens, keyed by the SHA-256 of the raw
+    token so the cache never holds usable credentials. Entries live until
+    the token's ``exp``; denylist hooks run on every hit so a revoked token
+    stops resolving immediately.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(VerifiedTokenCache, cls).__new__(cls)
+            cls._instance._initialize()
+        return cls._instance
+
+    def _initialize(self):
+        self.maxsize = settings.JWT_CACHE_SIZE
+        self._entries: "OrderedDict[bytes, Tuple[TokenData, float]]" = OrderedDict()
+        self._denylist: List[DenylistCheck] = []
+        self._stats: Dict[str, int] = {"hit": 0, "miss": 0, "expired": 0, "denied": 0}
+
+    @staticmethod
+    def _digest(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def _count(self, result: str) -> None:
+        self._stats[result] += 1
+        TOKEN_CACHE_LOOKUPS.labels(result=result).inc()
+
+    # --- Denylist ---
+
+    def add_denylist_check(self, check: DenylistCheck) -> None:
+        if check not in self._denylist:
+            self._denylist.append(check)
+
+    def is_denied(self, data: TokenData) -> bool:
+        return any(check(data) for check in self._denylist)
+
+    # --- Lookups ---
+
+    def get(self, token: str) -> Optional[TokenData]:
+        if self.maxsize <= 0:
+            return None
+
+        key = self._digest(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            self._count("miss")
+            return None
+
+        data, expires_at = entry
+        if expires_at <= time.time():
+            del self._entries[key]
+            self._count("expired")
+            return None
+
+        if self.is_denied(data):
+            del self._entries[key]
+            self._count("denied")
+            return None
+
+        self._entries.move_to_end(key)
+        self._count("hit")
+        # Callers get their own copy so the cached claims can not be mutated
+        return data.model_copy()
+
+    def put(self, token: str, data: TokenData) -> None:
+        if self.maxsize <= 0 or not data.exp:
+            return
+        key = self._digest(token)
+        self._entries[key] = (data.model_copy(), float(data.exp))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def evict(self, token: str) -> None:
+        self._entries.pop(self._digest(token), None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self._stats["hit"] + self._stats["miss"] + self._stats["expired"] + self._stats["denied"]
+        return {
+            **self._stats,
+            "size": len(self._entries),
+            "hit_rate": round(self._stats["hit"] / lookups, 4) if lookups else 0.0,
+        }
+
+
+# Singleton Instance
+token_cache = VerifiedTokenCache()
@@ -14,3 +14,4 @@ class TokenData(BaseModel):
     iss: str | None = None
     type: str | None = None
     otp_enabled: bool = False
+    perms: str | None = None
@@ -0,0 +1,205 @@
+import asyncio
+import hashlib
+import time
+import uuid
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.cache import cache
+from .models import Permission
+
+
+# Minimum seconds between reloads triggered by unknown permissions
+_RELOAD_INTERVAL = 5.0
+
+# Bumped by every worker that changes permissions; the others reload when it
+# moves. Read at most once per interval so lookups stay off the network.
+# Without a shared cache every check sees a new generation, i.e. a short TTL
+INDEX_GENERATION_KEY = "permission_index:generation"
+INDEX_GENERATION_TTL = 60 * 60 * 24 * 30
+_GENERATION_CHECK_INTERVAL = 1.0
+
+
+async def get_index_generation() -> str:
+    generation = await cache.get(INDEX_GENERATION_KEY)
+    if not generation:
+        generation = uuid.uuid4().hex
+        await cache.set(INDEX_GENERATION_KEY, generation, ttl=INDEX_GENERATION_TTL)
+    return generation
+
+
+class PermissionOrdinals:
+    """
+    Immutable snapshot assigning a dense ordinal (bit position) to every
+    permission id. ``version`` identifies the snapshot so serialized sets
+    built with another assignment are rejected instead of misread.
+    """
+
+    __slots__ = ("ids", "ordinals", "by_route", "version")
+
+    def __init__(self, rows: Iterable[Tuple[int, str, str, str]] = ()):
+        rows = sorted(rows)
+        self.ids: Tuple[int, ...] = tuple(row[0] for row in rows)
+        self.ordinals: Dict[int, int] = {pid: i for i, pid in enumerate(self.ids)}
+        self.by_route: Dict[Tuple[str, str, str], int] = {
+            (name, action, type): pid for pid, name, action, type in rows
+        }
+        self.version = hashlib.sha1(
+            ",".join(map(str, self.ids)).encode()
+        ).hexdigest()[:8]
+
+
+class PermissionSet:
+    """
+    Set of permission ids stored as an int bitmap over dense ordinals.
+    Membership is a shift and a mask; union and intersection are single
+    big-int operations regardless of the number of permissions.
+    """
+
+    __slots__ = ("bits", "snapshot")
+
+    def __init__(self, snapshot: PermissionOrdinals, bits: int = 0):
+        self.snapshot = snapshot
+        self.bits = bits
+
+    @classmethod
+    def from_ids(cls, ids: Iterable[int], snapshot: PermissionOrdinals) -> "PermissionSet":
+        bits = 0
+        ordinals = snapshot.ordinals
+        for pid in ids:
+            ordinal = ordinals.get(pid)
+            if ordinal is not None:
+                bits |= 1 << ordinal
+        return cls(snapshot, bits)
+
+    def has(self, permission_id: int) -> bool:
+        ordinal = self.snapshot.ordinals.get(permission_id)
+        return ordinal is not None and (self.bits >> ordinal) & 1 == 1
+
+    __contains__ = has
+
+    def _check_compatible(self, other: "PermissionSet"):
+        if self.snapshot.version != other.snapshot.version:
+            raise ValueError("Permission sets built from different permission indexes")
+
+    def __or__(self, other: "PermissionSet") -> "PermissionSet":
+        self._check_compatible(other)
+        return PermissionSet(self.snapshot, self.bits | other.bits)
+
+    def __and__(self, other: "PermissionSet") -> "PermissionSet":
+        self._check_compatible(other)
+        return PermissionSet(self.snapshot, self.bits & other.bits)
+
+    def issuperset(self, other: "PermissionSet") -> bool:
+        self._check_compatible(other)
+        return other.bits & ~self.bits == 0
+
+    def __bool__(self) -> bool:
+        return self.bits != 0
+
+    def __len__(self) -> int:
+        return self.bits.bit_count()
+
+    def ids(self) -> List[int]:
+        result = []
+        bits = self.bits
+        ids = self.snapshot.ids
+        while bits:
+            low = bits & -bits
+            result.append(ids[low.bit_length() - 1])
+            bits ^= low
+        return result
+
+    def dumps(self) -> str:
+        """Serializes as ``{version}:{hex bitmap}`` for the cache and the JWT."""
+        return f"{self.snapshot.version}:{self.bits:x}"
+
+    @classmethod
+    def loads(cls, value: Optional[str], snapshot: PermissionOrdinals) -> Optional["PermissionSet"]:
+        """Returns None when the value is malformed or was built with another index."""
+        if not value:
+            return None
+        version, _, bits = value.partition(":")
+        if version != snapshot.version:
+            return None
+        try:
+            return cls(snapshot, int(bits, 16))
+        except ValueError:
+            return None
+
+
+class PermissionIndex:
+    """
+    Process-wide permission index: ordinals for the bitmaps and the
+    ``(name, action, type) -> id`` map used by the role verify middlewares,
+    so resolving the permission a route requires does not hit the database.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(PermissionIndex, cls).__new__(cls)
+            cls._instance._initialize()
+        return cls._instance
+
+    def _initialize(self):
+        self.snapshot: Optional[PermissionOrdinals] = None
+        self.generation: Optional[str] = None
+        self._loaded_at = 0.0
+        self._checked_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def load(self, db: AsyncSession) -> PermissionOrdinals:
+        async with self._lock:
+            # Read before the rows: a bump racing the query triggers another reload
+            generation = await get_index_generation()
+            result = await db.execute(
+                select(
+                    Permission.id, Permission.name, Permission.action, Permission.type
+                ).where(Permission.is_deleted == False)
+            )
+            self.snapshot = PermissionOrdinals(
+                (row.id, row.name, row.action, row.type) for row in result
+            )
+            self.generation = generation
+            self._loaded_at = self._checked_at = time.monotonic()
+            return self.snapshot
+
+    async def ensure_loaded(self, db: AsyncSession) -> PermissionOrdinals:
+        if self.snapshot is None:
+            return await self.load(db)
+        now = time.monotonic()
+        if now - self._checked_at > _GENERATION_CHECK_INTERVAL:
+            self._checked_at = now
+            if await get_index_generation() != self.generation:
+                return await self.load(db)
+        return self.snapshot
+
+    async def invalidate(self) -> None:
+        """
+        Forces every worker to reload, e.g. after permissions were created,
+        renamed or deleted: this one right away, the others on their next check.
+        """
+        self.snapshot = None
+        await cache.set(INDEX_GENERATION_KEY, uuid.uuid4().hex, ttl=INDEX_GENERATION_TTL)
+
+    async def resolve(
+        self, db: AsyncSession, name: str, action: str, type: str
+    ) -> Optional[int]:
+        """
+        Returns the id of the permission guarding a route. Unknown keys
+        reload the index (throttled) in case another process created it.
+        """
+        snapshot = await self.ensure_loaded(db)
+        permission_id = snapshot.by_route.get((name, action, type))
+        if permission_id is None and time.monotonic() - self._loaded_at > _RELOAD_INTERVAL:
+            snapshot = await self.load(db)
+            permission_id = snapshot.by_route.get((name, action, type))
+        return permission_id
+
+
+# Singleton Instance
+permission_index = PermissionIndex()
@@ -5,8 +5,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.database import get_async_db
 from core import cache
+from core.ratelimit import Quota
 
 from .models import Permission
+from .bitset import permission_index
 from .schemas import (
     RQPermission, 
     RQCreatePermission,
@@ -17,6 +19,12 @@ from .schemas import (
 )
 from .services import create_permission, create_bulk_permissions_with_roles
 
+# Bulk creation writes many rows and grants, keep it from starving the pool.
+# The owner role (level 100) is not limited.
+QUOTAS = {
+    "create_bulk_permissions": Quota(rate=1, burst=5, concurrency=2, overrides={100: None}),
+}
+
 # prefix /permissions
 router = APIRouter()
 
@@ -119,6 +127,7 @@ async def create_Permission(
 ) -> RSPermission:
     try:
         result = await Permission(**permission.model_dump()).save(db)
+        await permission_index.invalidate()
         return result
     except Exception as e:
         print(e)
@@ -129,6 +138,7 @@ async def create_Permission(
 async def delete_Permission(id: str, db: AsyncSession = Depends(get_async_db)) -> None:
     try:
         await Permission.delete(db, id)
+        await permission_index.invalidate()
     except Exception as e:
         print(e)
         raise e
@@ -140,6 +150,7 @@ async def update_Permission(
 ) -> RSPermission:
     try:
         result = await Permission.update(db, id, permission.model_dump())
+        await permission_index.invalidate()
         return result
     except Exception as e:
         print(e)
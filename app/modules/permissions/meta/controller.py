@@ -6,6 +6,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from core.database import get_async_db
 
 from .models import MetaPermissions
+from .services import bump_meta_generation
 from .schemas import (
     RQMetaPermission,
     RSMetaPermission,
@@ -75,6 +76,7 @@ async def create_meta_permission(
 ) -> RSMetaPermission:
     try:
         result = await MetaPermissions(**meta.model_dump()).save(db)
+        await bump_meta_generation()
         return result
     except Exception as e:
         print(e)
@@ -85,6 +87,7 @@ async def create_meta_permission(
 async def delete_meta_permission(id: int | str, db: AsyncSession = Depends(get_async_db)) -> None:
     try:
         await MetaPermissions.delete(db, id)
+        await bump_meta_generation()
     except Exception as e:
         print(e)
         raise e
@@ -96,6 +99,7 @@ async def update_meta_permission(
 ) -> RSMetaPermission:
     try:
         result = await MetaPermissions.update(db, id, meta.model_dump())
+        await bump_meta_generation()
         return result
     except Exception as e:
         print(e)
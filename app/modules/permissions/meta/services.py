@@ -1,7 +1,28 @@
+import uuid
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .models import MetaPermissions
 from app.modules.permissions.models import Permission
+from core.cache import cache
+
+
+# Anything derived from meta_permissions (e.g. the admin menu) is cached under this generation
+META_GENERATION_KEY = "meta_permissions:generation"
+META_GENERATION_TTL = 60 * 60 * 24 * 30
+
+
+async def get_meta_generation() -> str:
+    generation = await cache.get(META_GENERATION_KEY)
+    if not generation:
+        generation = uuid.uuid4().hex
+        await cache.set(META_GENERATION_KEY, generation, ttl=META_GENERATION_TTL)
+    return generation
+
+
+async def bump_meta_generation() -> None:
+    """Orphans every cache entry derived from meta_permissions."""
+    await cache.set(META_GENERATION_KEY, uuid.uuid4().hex, ttl=META_GENERATION_TTL)
 
 
 async def create_meta_permissions(
@@ -28,6 +49,7 @@ async def create_meta_permissions(
         ref_permission=await Permission.find_one(db, ref_permission),
     )
     await meta_obj.save(db)
+    await bump_meta_generation()
     return meta_obj
 
 
@@ -81,6 +103,7 @@ async def delete_meta_permissions(
         id: ID of the meta_permissions
     """
     await MetaPermissions.delete(db, id)
+    await bump_meta_generation()
 
 
 async def update_meta_permissions(
@@ -108,4 +131,5 @@ async def update_meta_permissions(
     meta_obj.value = value
     meta_obj.ref_permission = ref_permission
     await meta_obj.save(db)
+    await bump_meta_generation()
     return meta_obj
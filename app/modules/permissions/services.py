@@ -1,13 +1,15 @@
-from typing import List, Callable
+from typing import Dict, List, Callable
 
 from fastapi.routing import APIRoute, BaseRoute
 from sqlalchemy import delete
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from .models import Permission
+from .bitset import permission_index
 from .schemas import RQCreatePermission, RQBulkPermission, RSPermission, RSBulkPermissionResult
 from app.modules.roles.models import Role
-from app.modules.role_permissions.models import RolePermission
+from app.modules.role_permissions.services import grant_permissions
+from core.database.exceptions import DatabaseQueryError
 from sqlalchemy import select
 
 
@@ -41,9 +43,21 @@ async def create_permission(
         type=type,
     )
     await permission.save(db)
+    await permission_index.invalidate()
     return permission
 
 
+def _to_rs_permission(permission: Permission) -> RSPermission:
+    return RSPermission(
+        id=permission.id,
+        uid=permission.uid,
+        type=permission.type,
+        name=permission.name,
+        action=permission.action,
+        description=permission.description,
+    )
+
+
 async def create_bulk_permissions_with_roles(
     db: AsyncSession,
     permissions_data: List[RQBulkPermission]
@@ -64,66 +78,58 @@ async def create_bulk_permissions_with_roles(
     results: List[RSBulkPermissionResult] = []
     success_count = 0
     error_count = 0
-    
+
+    # Load existing permissions and target roles up front (one query each).
+    # Plain snapshots are kept because every commit below expires ORM instances.
+    names = list({perm_data.name for perm_data in permissions_data})
+    existing_query = await db.execute(select(Permission).where(Permission.name.in_(names)))
+    permissions_by_name: Dict[str, RSPermission] = {
+        perm.name: _to_rs_permission(perm) for perm in existing_query.scalars().all()
+    }
+
+    roles, _ = await Role.find_many(db, list({perm_data.role_id for perm_data in permissions_data}))
+    role_ids_by_key: Dict[int | str, int] = {}
+    for role in roles:
+        role_ids_by_key[role.id] = role.id
+        role_ids_by_key[role.uid] = role.id
+
+    # Grants are collected per role and written once per role at the end
+    grants: Dict[int, List[int]] = {}
+
     for perm_data in permissions_data:
         try:
-            # Verificar si el permiso ya existe
-            existing_query = await db.execute(
-                select(Permission).where(Permission.name == perm_data.name)
-            )
-            existing_permission = existing_query.scalar_one_or_none()
-            
-            if existing_permission:
-                # Si ya existe, usamos el existente
-                permission = existing_permission
-            else:
+            # Verificar que el rol existe
+            try:
+                role_id = role_ids_by_key.get(int(str(perm_data.role_id)))
+            except ValueError:
+                role_id = role_ids_by_key.get(str(perm_data.role_id))
+            if role_id is None:
+                raise DatabaseQueryError("Not exists the register in roles")
+
+            # Si ya existe, usamos el existente
+            permission = permissions_by_name.get(perm_data.name)
+            if permission is None:
                 # Crear el nuevo permiso
-                permission = await create_permission(
+                permission = _to_rs_permission(await create_permission(
                     db=db,
                     name=perm_data.name,
                     action=perm_data.action,
                     description=perm_data.description,
                     type=perm_data.type
-                )
-            
-            # Verificar que el rol existe
-            role = await Role.find_one(db, perm_data.role_id)
-            
-            # Asignar el permiso al rol si no está ya asignado
-            if permission.id not in role.permissions:
-                updated_permissions = list(role.permissions) + [permission.id]
-                await role.update(db, perm_data.role_id, {"permissions": updated_permissions})
-            
-            # Sync Pivot Table (RolePermission)
-            permission_id = permission.id
-            rp_query = await db.execute(
-                select(RolePermission).where(
-                    RolePermission.role_id == perm_data.role_id,
-                    RolePermission.permission_id == permission_id
-                )
-            )
-            if not rp_query.scalar_one_or_none():
-                await RolePermission(
-                    role_id=perm_data.role_id,
-                    permission_id=permission_id
-                ).save(db)
-            
+                ))
+                permissions_by_name[permission.name] = permission
+
+            grants.setdefault(role_id, []).append(permission.id)
+
             # Agregar resultado exitoso
             results.append(RSBulkPermissionResult(
-                permission=RSPermission(
-                    id=permission.id,
-                    uid=permission.uid,
-                    type=permission.type,
-                    name=permission.name,
-                    action=permission.action,
-                    description=permission.description,
-                ),
+                permission=permission,
                 role_id=perm_data.role_id,
                 success=True,
                 error=None
             ))
             success_count += 1
-            
+
         except Exception as e:
             # Agregar resultado con error
             results.append(RSBulkPermissionResult(
@@ -140,7 +146,14 @@ async def create_bulk_permissions_with_roles(
                 error=str(e)
             ))
             error_count += 1
-    
+
+    if success_count:
+        await permission_index.invalidate()
+
+    # Asignar los permisos a sus roles (pivot table, una sentencia por rol)
+    for role_id, permission_ids in grants.items():
+        await grant_permissions(db, role_id, permission_ids)
+
     return results, success_count, error_count
 
 
@@ -181,6 +194,7 @@ async def create_permissions_api(
         if new_permissions:
             db.add_all(new_permissions)
             await db.commit()
+            await permission_index.invalidate()
             print(f"Created {len(new_permissions)} new permissions of type '{type}'")
         else:
             print(f"No new permissions to create for type '{type}'")
@@ -189,3 +203,27 @@ async def create_permissions_api(
         print(f"Error in create_permissions_api: {e}")
     finally:
         await db.close()
+
+
+async def grant_routes_to_role(
+    routes: List[BaseRoute],
+    sessionAsync: async_sessionmaker[AsyncSession],
+    type: str,
+    role_name: str = "owner",
+) -> None:
+    """Grants the permissions of ``routes`` (created beforehand) to a role."""
+    names = [route.name for route in routes if isinstance(route, APIRoute)]
+    if not names:
+        return
+    db: AsyncSession = sessionAsync()
+    try:
+        result = await db.execute(
+            select(Permission.id).where(Permission.name.in_(names), Permission.type == type)
+        )
+        permission_ids = list(result.scalars().all())
+        query = await Role.find_by_colunm(db, "name", role_name)
+        role = query.scalar_one_or_none()
+        if role is not None:
+            await grant_permissions(db, role.id, permission_ids)
+    finally:
+        await db.close()
@@ -1,9 +1,14 @@
-from sqlalchemy import ForeignKey, Integer
+from sqlalchemy import ForeignKey, Integer, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from core.database import BaseAsync
 
 class RolePermission(BaseAsync):
+    """
+    Source of truth for permission grants.
+    ``roles.permissions`` is a sorted copy maintained by a trigger on this table
+    (see ``services.ensure_role_permissions_sync``) and must not be written directly.
+    """
     __tablename__ = "role_permissions"
 
     role_id: Mapped[int] = mapped_column(
@@ -16,3 +21,7 @@ class RolePermission(BaseAsync):
     # Relationships (Optional, but useful)
     role = relationship("app.modules.roles.models.Role", backref="role_permission_entries")
     permission = relationship("app.modules.permissions.models.Permission", backref="role_permission_entries")
+
+    __table_args__ = (
+        UniqueConstraint("role_id", "permission_id", name="uq_role_permission"),
+    )
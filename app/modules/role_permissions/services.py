@@ -1,50 +1,274 @@
-from sqlalchemy.ext.asyncio import AsyncSession
+import asyncio
+from bisect import bisect_left
+from sqlalchemy import delete, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.future import select
-from typing import List
+from typing import Dict, Iterable, List, Sequence, Tuple, Union
 
 from app.modules.roles.models import Role
 from app.modules.permissions.models import Permission
+from app.modules.permissions.bitset import PermissionSet, permission_index
+from core.cache import cache
+from core.config.globals import settings
+from core.database.drivers.postgres.base import generate_uuid
 from .models import RolePermission
 from .schemas import RSPermissionDetail, RSRolePermissions
 
 
+# Keeps roles.permissions as a sorted, read-only copy of the pivot table.
+# Statement-level triggers refresh every touched role once per statement.
+ROLE_PERMISSIONS_SYNC_DDL = [
+    # Remove duplicated grants so the unique index can be created on legacy tables
+    """
+    DELETE FROM role_permissions a USING role_permissions b
+    WHERE a.role_id = b.role_id
+      AND a.permission_id = b.permission_id
+      AND a.id > b.id
+    """,
+    """
+    CREATE UNIQUE INDEX IF NOT EXISTS uq_role_permission
+    ON role_permissions (role_id, permission_id)
+    """,
+    # Grants that only ever lived in the legacy array are moved into the pivot
+    """
+    INSERT INTO role_permissions (uid, role_id, permission_id, created_at, updated_at, is_deleted)
+    SELECT md5(random()::text || clock_timestamp()::text), r.id, p.permission_id, now(), now(), false
+    FROM roles r CROSS JOIN LATERAL unnest(r.permissions) AS p(permission_id)
+    WHERE EXISTS (SELECT 1 FROM permissions WHERE permissions.id = p.permission_id)
+    ON CONFLICT (role_id, permission_id) DO NOTHING
+    """,
+    # VOLATILE: each call reads a fresh snapshot. A trigger UPDATE that waited on
+    # the role row lock then sees the pivot rows the other transaction committed
+    """
+    CREATE OR REPLACE FUNCTION role_permission_ids(target_role integer) RETURNS integer[] AS $$
+        SELECT COALESCE(array_agg(DISTINCT permission_id ORDER BY permission_id), '{}')
+        FROM role_permissions
+        WHERE role_id = target_role AND is_deleted IS NOT TRUE
+    $$ LANGUAGE sql VOLATILE
+    """,
+    """
+    CREATE OR REPLACE FUNCTION refresh_role_permissions_array() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP = 'INSERT' THEN
+            UPDATE roles SET permissions = role_permission_ids(id)
+            WHERE id IN (SELECT role_id FROM new_rows);
+        ELSIF TG_OP = 'DELETE' THEN
+            UPDATE roles SET permissions = role_permission_ids(id)
+            WHERE id IN (SELECT role_id FROM old_rows);
+        ELSE
+            UPDATE roles SET permissions = role_permission_ids(id)
+            WHERE id IN (SELECT role_id FROM new_rows UNION SELECT role_id FROM old_rows);
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    "DROP TRIGGER IF EXISTS role_permissions_refresh_insert ON role_permissions",
+    """
+    CREATE TRIGGER role_permissions_refresh_insert AFTER INSERT ON role_permissions
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION refresh_role_permissions_array()
+    """,
+    "DROP TRIGGER IF EXISTS role_permissions_refresh_update ON role_permissions",
+    """
+    CREATE TRIGGER role_permissions_refresh_update AFTER UPDATE ON role_permissions
+    REFERENCING NEW TABLE AS new_rows OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION refresh_role_permissions_array()
+    """,
+    "DROP TRIGGER IF EXISTS role_permissions_refresh_delete ON role_permissions",
+    """
+    CREATE TRIGGER role_permissions_refresh_delete AFTER DELETE ON role_permissions
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION refresh_role_permissions_array()
+    """,
+    # Rebuild arrays that drifted before the trigger existed
+    """
+    UPDATE roles SET permissions = role_permission_ids(id)
+    WHERE permissions IS DISTINCT FROM role_permission_ids(id)
+    """,
+]
+
+
+async def ensure_role_permissions_sync(sessionMaker: async_sessionmaker[AsyncSession]):
+    """
+    Installs (idempotently) the trigger that derives ``roles.permissions``
+    from the ``role_permissions`` pivot table.
+    """
+    db: AsyncSession = sessionMaker()
+    try:
+        for statement in ROLE_PERMISSIONS_SYNC_DDL:
+            await db.execute(text(statement))
+        await db.commit()
+        print("[v] Role permissions trigger installed")
+    except Exception as e:
+        await db.rollback()
+        print(f"[x] Error installing role permissions trigger: {e}")
+        raise e
+    finally:
+        await db.close()
+
+
+async def grant_permissions(
+    db: AsyncSession, role_id: int, permission_ids: Iterable[int], commit: bool = True
+) -> None:
+    """
+    Grants permissions to a role with a single insert, ignoring the ones
+    already granted. ``roles.permissions`` is refreshed by the trigger.
+    With ``commit=False`` the caller commits and invalidates the cache.
+    """
+    ids = sorted(set(permission_ids))
+    if not ids:
+        return
+    await db.execute(
+        insert(RolePermission)
+        .values(
+            [
+                {"uid": generate_uuid(), "role_id": role_id, "permission_id": permission_id}
+                for permission_id in ids
+            ]
+        )
+        .on_conflict_do_nothing(index_elements=["role_id", "permission_id"])
+    )
+    if commit:
+        await db.commit()
+        await invalidate_role_permission_set(role_id)
+
+
+async def revoke_permissions(
+    db: AsyncSession, role_id: int, permission_ids: Iterable[int], commit: bool = True
+) -> None:
+    """Removes grants from a role with a single delete, see ``grant_permissions``."""
+    ids = list(set(permission_ids))
+    if not ids:
+        return
+    await db.execute(
+        delete(RolePermission).where(
+            RolePermission.role_id == role_id,
+            RolePermission.permission_id.in_(ids),
+        )
+    )
+    if commit:
+        await db.commit()
+        await invalidate_role_permission_set(role_id)
+
+
+async def set_role_permissions(
+    db: AsyncSession, role_id: int, permission_ids: Iterable[int]
+) -> None:
+    """
+    Replaces the grants of a role, touching only the differences, in one
+    transaction: readers never see the role with only half of the change.
+    """
+    wanted = set(permission_ids)
+    current = set(await get_role_permission_ids(db, role_id))
+    if wanted == current:
+        return
+    try:
+        await revoke_permissions(db, role_id, current - wanted, commit=False)
+        await grant_permissions(db, role_id, wanted - current, commit=False)
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+    await invalidate_role_permission_set(role_id)
+
+
+async def get_role_permission_ids(
+    db: AsyncSession, role_id: Union[int, str, None]
+) -> Tuple[int, ...]:
+    """
+    Reads the materialized, sorted permission ids of a role.
+    Unknown or non numeric role ids (e.g. partial 2FA tokens) have no permissions.
+    """
+    try:
+        val_id = int(str(role_id))
+    except ValueError:
+        return ()
+    result = await db.execute(
+        select(Role.permissions).where(Role.id == val_id, Role.is_deleted == False)
+    )
+    return tuple(result.scalar_one_or_none() or ())
+
+
+def has_permission_id(permission_ids: Sequence[int], permission_id: int) -> bool:
+    """Membership test over a sorted permission id array."""
+    index = bisect_left(permission_ids, permission_id)
+    return index < len(permission_ids) and permission_ids[index] == permission_id
+
+
+def _role_perms_key(role_id: int) -> str:
+    return f"role_perms:{role_id}"
+
+
+async def get_role_permission_set(
+    db: AsyncSession, role_id: Union[int, str, None]
+) -> PermissionSet:
+    """
+    Returns the permissions of a role as a bitmap. The serialized bitmap is
+    cached under ``role_perms:{role_id}`` and dropped by grant/revoke.
+    """
+    snapshot = await permission_index.ensure_loaded(db)
+    try:
+        val_id = int(str(role_id))
+    except ValueError:
+        return PermissionSet(snapshot)
+
+    key = _role_perms_key(val_id)
+    permission_set = PermissionSet.loads(await cache.get(key), snapshot)
+    if permission_set is not None:
+        return permission_set
+
+    permission_set = PermissionSet.from_ids(
+        await get_role_permission_ids(db, val_id), snapshot
+    )
+    await cache.set(key, permission_set.dumps(), ttl=settings.ROLE_PERMISSIONS_CACHE_TTL)
+    return permission_set
+
+
+async def invalidate_role_permission_set(role_id: int) -> None:
+    await cache.delete(_role_perms_key(role_id))
+
+
+async def role_has_permission(
+    db: AsyncSession, role_id: Union[int, str, None], permission_id: int
+) -> bool:
+    return (await get_role_permission_set(db, role_id)).has(permission_id)
+
+
+async def role_permissions_claim(
+    db: AsyncSession, role_id: Union[int, str, None]
+) -> Dict[str, str]:
+    """
+    Extra access token claims carrying the role bitmap, so the role verify
+    middlewares can skip the lookup. Empty unless JWT_PERMISSIONS_CLAIM is on.
+    """
+    if not settings.JWT_PERMISSIONS_CLAIM:
+        return {}
+    return {"perms": (await get_role_permission_set(db, role_id)).dumps()}
+
+
 async def assign_permission_to_role(
     db: AsyncSession, role_id: int, permission_id: int
 ) -> Role:
     """
-    Assigns a permission to a role by adding the permission UID to the role's permissions array.
+    Assigns a permission to a role through the role_permissions pivot table.
 
     Args:
         db: Database session
-        role_id: UID of the role
-        permission_id: UID of the permission
+        role_id: ID of the role
+        permission_id: ID of the permission
 
     Returns:
         Updated Role object
     """
-    # Get the role
-    role = await Role.find_one(db, role_id)
-
-    # Get the permission to verify it exists
-    permission = await Permission.find_one(db, permission_id)
-
-    # Add permission ID to role's permissions array if not already present
-    if permission.id not in role.permissions:
-        updated_permissions = list(role.permissions) + [permission.id]
-        await role.update(db, role_id, {"permissions": updated_permissions})
-
-    # Sync Pivot Table (RolePermission)
-    rp_query = await db.execute(
-        select(RolePermission).where(
-            RolePermission.role_id == role.id,
-            RolePermission.permission_id == permission.id
-        )
+    # Get the role and the permission to verify it exists, through the session loader
+    role, permission = await asyncio.gather(
+        Role.load(db, role_id), Permission.load(db, permission_id)
     )
-    if not rp_query.scalar_one_or_none():
-        await RolePermission(
-            role_id=role.id,
-            permission_id=permission.id
-        ).save(db)
+
+    await grant_permissions(db, role.id, [permission.id])
+    await db.refresh(role)
 
     return role
 
@@ -53,33 +277,21 @@ async def remove_permission_from_role(
     db: AsyncSession, role_id: int, permission_id: int
 ) -> Role:
     """
-    Removes a permission from a role by removing the permission UID from the role's permissions array.
+    Removes a permission from a role through the role_permissions pivot table.
 
     Args:
         db: Database session
-        role_id: UID of the role
-        permission_id: UID of the permission
+        role_id: ID of the role
+        permission_id: ID of the permission
 
     Returns:
         Updated Role object
     """
     # Get the role
-    role = await Role.find_one(db, role_id)
+    role = await Role.load(db, role_id)
 
-    # Remove permission ID from role's permissions array if present
-    if permission_id in role.permissions:
-        updated_permissions = [p for p in role.permissions if p != permission_id]
-        await role.update(db, role_id, {"permissions": updated_permissions})
-
-    # Remove from Pivot Table (RolePermission)
-    from sqlalchemy import delete
-    await db.execute(
-        delete(RolePermission).where(
-            RolePermission.role_id == role.id,
-            RolePermission.permission_id == permission_id
-        )
-    )
-    await db.commit()
+    await revoke_permissions(db, role.id, [permission_id])
+    await db.refresh(role)
 
     return role
 
@@ -98,23 +310,18 @@ async def get_role_permissions(db: AsyncSession, role_id: int) -> RSRolePermissi
     # Get the role
     role = await Role.find_one(db, role_id)
 
-    # Get all permissions for this role
-    permissions = []
-    for permission_id in role.permissions:
-        try:
-            permission = await Permission.find_one(db, permission_id)
-            permissions.append(
-                RSPermissionDetail(
-                    id=permission.id,
-                    name=permission.name,
-                    action=permission.action,
-                    description=permission.description,
-                    type=permission.type,
-                )
-            )
-        except:
-            # Skip permissions that no longer exist
-            continue
+    # Get all permissions for this role in a single query, skipping the ones that no longer exist
+    found, _ = await Permission.find_many(db, list(role.permissions))
+    permissions = [
+        RSPermissionDetail(
+            id=permission.id,
+            name=permission.name,
+            action=permission.action,
+            description=permission.description,
+            type=permission.type,
+        )
+        for permission in found
+    ]
 
     return RSRolePermissions(
         role_id=role.id, role_name=role.name, permissions=permissions
@@ -7,7 +7,8 @@ from core.database import get_async_db
 
 from .models import Role
 from .schemas import RQRole, RSRole, RSRoleList
-from .services import create_role
+from .services import create_role, invalidate_role, invalidate_role_level
+from app.modules.role_permissions.services import set_role_permissions
 from core.cache import Cache
 
 # prefix /roles
@@ -86,7 +87,8 @@ async def create_Role(role: RQRole, db: AsyncSession = Depends(get_async_db)) ->
 @router.delete("/id/{id}", status_code=204, tags=[tag])
 async def delete_Role(id: str, db: AsyncSession = Depends(get_async_db)) -> None:
     try:
-        await Role.delete(db, id)
+        role = await Role.delete(db, id)
+        await invalidate_role(role.id)
     except Exception as e:
         print(e)
         raise e
@@ -97,7 +99,12 @@ async def update_Role(
     id: str, role: RQRole, db: AsyncSession = Depends(get_async_db)
 ) -> RSRole:
     try:
-        result = await Role.update(db, id, role.model_dump())
+        data = role.model_dump()
+        permissions = data.pop("permissions")
+        result = await Role.update(db, id, data)
+        await invalidate_role_level(result.id)
+        await set_role_permissions(db, result.id, permissions)
+        await db.refresh(result)
         return result
     except Exception as e:
         print(e)
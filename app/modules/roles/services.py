@@ -5,36 +5,71 @@ from app.modules.permissions.models import Permission
 
 from .models import Role
 from .schemas import RQRole, RSRole
-from app.modules.role_permissions.models import RolePermission
+from app.modules.role_permissions.services import (
+    grant_permissions,
+    invalidate_role_permission_set,
+)
+from core.cache import cache
+from sqlalchemy import select
 
 
-async def create_role(db: AsyncSession, rq_role: RQRole) -> RSRole:
+ROLE_LEVEL_CACHE_TTL = 60
+
+
+def _role_level_key(role_id: int) -> str:
+    return f"role_level:{role_id}"
+
+
+async def get_role_level(db: AsyncSession, role_id: int | str | None) -> int | None:
+    """Level of a role, cached briefly since it is read on quota checks."""
     try:
-        permissions = []
+        val_id = int(str(role_id))
+    except ValueError:
+        return None
+
+    key = _role_level_key(val_id)
+    cached = await cache.get(key)
+    if cached is not None:
+        return int(cached)
+
+    result = await db.execute(
+        select(Role.level).where(Role.id == val_id, Role.is_deleted == False)
+    )
+    level = result.scalar_one_or_none()
+    if level is not None:
+        await cache.set(key, str(level), ttl=ROLE_LEVEL_CACHE_TTL)
+    return level
+
+
+async def invalidate_role_level(role_id: int) -> None:
+    await cache.delete(_role_level_key(role_id))
 
+
+async def invalidate_role(role_id: int) -> None:
+    """Drops every cached view of a deleted role."""
+    await invalidate_role_level(role_id)
+    await invalidate_role_permission_set(role_id)
+
+
+async def create_role(db: AsyncSession, rq_role: RQRole) -> RSRole:
+    try:
         if rq_role.permissions.__len__() == 0:
             raise HTTPException(
                 status_code=400, detail="Role must have at least one permission"
             )
 
-        for permission in tuple(rq_role.permissions):
-            try:
-                permission_obj = await Permission.find_one(db, permission)
-                permissions.append(permission_obj.id)
-            except ValueError as e:
-                raise HTTPException(status_code=400, detail=e.args[0])
-
-        rq_role.permissions = permissions
+        found, missing = await Permission.find_many(db, tuple(rq_role.permissions))
+        if missing:
+            raise HTTPException(
+                status_code=400, detail=f"Permissions not found: {missing}"
+            )
+        permissions = [permission_obj.id for permission_obj in found]
 
-        role = await Role(**rq_role.model_dump()).save(db)
-        role_id = role.id
+        # roles.permissions is derived from the pivot table by a trigger
+        role = await Role(**{**rq_role.model_dump(), "permissions": []}).save(db)
 
-        # Sync Pivot Table (RolePermission)
-        for perm_id in permissions:
-            await RolePermission(
-                role_id=role_id,
-                permission_id=perm_id
-            ).save(db)
+        await grant_permissions(db, role.id, permissions)
+        await db.refresh(role)
 
         return role
 
@@ -0,0 +1,34 @@
+from typing import Optional
+
+from core.cache import cache
+from core.config.globals import settings
+
+from .schemas import RSUserIdentity
+
+
+def _identity_key(user_id: int | str) -> str:
+    return f"user_identity:{user_id}"
+
+
+async def get_cached_user_identity(user_id: int | str) -> Optional[RSUserIdentity]:
+    cached = await cache.get(_identity_key(user_id))
+    if not cached:
+        return None
+    try:
+        return RSUserIdentity.model_validate_json(cached)
+    except ValueError:
+        return None
+
+
+async def cache_user_identity(identity: RSUserIdentity) -> None:
+    """Stores the projection under both the numeric id and the uid."""
+    value = identity.model_dump_json()
+    ttl = settings.USER_IDENTITY_CACHE_TTL
+    await cache.set(_identity_key(identity.id), value, ttl=ttl)
+    await cache.set(_identity_key(identity.uid), value, ttl=ttl)
+
+
+async def invalidate_user_identity(user_id: int | str, uid: str | None = None) -> None:
+    await cache.delete(_identity_key(user_id))
+    if uid:
+        await cache.delete(_identity_key(uid))
@@ -9,6 +9,9 @@ from core.database import to_tsvector_ix
 
 from app.modules.roles.models import Role
 from core.database import BaseAsync
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .identity import invalidate_user_identity
 
 
 class TSVector(types.TypeDecorator):
@@ -45,3 +48,22 @@ class User(BaseAsync):
         ),
         {"extend_existing": True},
     )
+
+    # Write-through invalidation of the cached auth projection (see users/identity.py)
+
+    async def save(self, db: AsyncSession):
+        result = await super().save(db)
+        await invalidate_user_identity(result.id, result.uid)
+        return result
+
+    @classmethod
+    async def update(cls, db: AsyncSession, id: int | str, data: dict):
+        reg = await super().update(db, id, data)
+        await invalidate_user_identity(reg.id, reg.uid)
+        return reg
+
+    @classmethod
+    async def delete(cls, db: AsyncSession, id: int | str):
+        reg = await super().delete(db, id)
+        await invalidate_user_identity(reg.id, reg.uid)
+        return reg
@@ -39,6 +39,18 @@ class RSUserTokenData(BaseModel):
     otp_enabled: bool = False
 
 
+class RSUserIdentity(BaseModel):
+    """Columns auth needs from a user, cached by user id (no password or OTP secret)."""
+    id: int
+    uid: str
+    username: str
+    email: str
+    full_name: str
+    role: int
+    otp_enabled: bool = False
+    created_at: datetime
+
+
 class INUser(RSUser):
     password: str
 
@@ -1,9 +1,8 @@
 from fastapi import Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.modules.users.models import User
 from app.modules.users.schemas import RSUser
-from app.modules.auth.services import decode_token
+from app.modules.auth.services import decode_token, get_user_identity
 from core.database import get_async_db
 from fastapi.security import OAuth2PasswordBearer
 
@@ -32,9 +31,8 @@ async def get_current_user(
     if not payload:
         raise HTTPException(status_code=401, detail="Token inválido")
     
-    # Buscar el usuario en la base de datos
-    query = await User.find_by_colunm(db, "username", payload.sub)
-    user = query.scalar_one_or_none()
+    # Buscar el usuario (proyección cacheada, sin cargar la fila completa)
+    user = await get_user_identity(db, payload)
     
     if not user:
         raise HTTPException(status_code=401, detail="Usuario no encontrado")
@@ -45,7 +43,7 @@ async def get_current_user(
         username=user.username,
         full_name=user.full_name,
         email=user.email,
-        role=user.role_ref,
+        role=user.role,
         otp_enabled=user.otp_enabled,
         created_at=user.created_at,
     )
@@ -1,41 +1,96 @@
-import os
-from importlib import import_module
 import socketio
+from socketio import packet
 from fastapi import FastAPI
 
+from core.config.globals import settings
 
-def init_sockets(app: FastAPI):
+from core.utils.module_registry import registry
 
-    module_names = [f for f in os.listdir("app/sockets")]
+from .manager import create_client_manager, emitter
+from .observability import EVENT_PACKETS, InstrumentedAsyncServer, configure_loggers
+from .admission import AdmissionControl
+from core.middlewares.jwt_verify_socket import authorize_event
 
-    namespaces = []
 
-    for module_name in module_names:
+class SocketServer(InstrumentedAsyncServer):
+    """
+    Adds admission control (connection limits, bounded outbound queues,
+    eviction) and checks the namespace guard (authorize_namespace) before
+    every inbound event.
+    """
 
-        # Only process directories that are not __pycache__
-        if not os.path.isdir(os.path.join("app/sockets", module_name)) or module_name == "__pycache__":
-            continue
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.admission = AdmissionControl(self)
+
+    async def _handle_eio_connect(self, eio_sid, environ):
+        # False makes Engine.IO refuse the transport before any session exists
+        if not self.admission.admit(eio_sid, environ):
+            return False
+        return await super()._handle_eio_connect(eio_sid, environ)
+
+    async def _handle_eio_disconnect(self, eio_sid):
+        self.admission.release(eio_sid)
+        await super()._handle_eio_disconnect(eio_sid)
+
+    async def _handle_eio_message(self, eio_sid, data):
+        self.admission.touch(eio_sid)
+        await super()._handle_eio_message(eio_sid, data)
+
+    async def _handle_connect(self, eio_sid, namespace, data):
+        if not self.admission.admit_namespace(namespace or "/"):
+            await self._send_packet(eio_sid, self.packet_class(
+                packet.CONNECT_ERROR, data={"message": "Too many connections"},
+                namespace=namespace))
+            return
+        await super()._handle_connect(eio_sid, namespace, data)
+
+    async def _send_packet(self, eio_sid, pkt):
+        if pkt.packet_type in EVENT_PACKETS and not self.admission.can_enqueue(
+            eio_sid, self._label(pkt.namespace)
+        ):
+            return
+        await super()._send_packet(eio_sid, pkt)
+
+    async def _trigger_event(self, event, namespace, *args):
+        if event not in ("connect", "disconnect") and args:
+            if not await authorize_event(self, event, namespace, args[0]):
+                return {"error": "Unauthorized"}
+        return await super()._trigger_event(event, namespace, *args)
 
-        namespaces.append(f"/{module_name}")
 
-    sio = socketio.AsyncServer(
+def init_sockets(app: FastAPI):
+
+    entries = registry.discover("app/sockets", "events.py", recursive=False)
+
+    namespaces = [f"/{entry.name}" for entry in entries]
+
+    socketio_logger, engineio_logger = configure_loggers()
+
+    sio = SocketServer(
         async_mode="asgi",
         cors_allowed_origins=[],
         path="/sio",
         namespaces=namespaces,
-        logger=True,
-        engineio_logger=True,
+        # Redis pub/sub so rooms and emits reach clients on every worker
+        client_manager=create_client_manager(),
+        logger=socketio_logger,
+        engineio_logger=engineio_logger,
         allow_upgrades=True,
+        # Clients missing pongs are dropped by Engine.IO
+        ping_interval=settings.SOCKET_PING_INTERVAL,
+        ping_timeout=settings.SOCKET_PING_TIMEOUT,
     )
 
-    for module_name in module_names:
+    emitter.attach(sio)
 
-        try:
+    for entry in entries:
 
-            if not os.path.isdir(os.path.join("app/sockets", module_name)) or module_name == "__pycache__":
-                continue
+        module_name = entry.name
+
+        try:
 
-            module = import_module(f"app.sockets.{module_name}.events")
+            module = registry.load(entry)
 
             print(f"Importing SOCKET module: {module_name}")
 
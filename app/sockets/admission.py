@@ -0,0 +1,183 @@
+import asyncio
+import time
+from collections import Counter as Tally
+from typing import Dict, Optional, Set
+
+from prometheus_client import Counter, Gauge
+
+from core.config.globals import settings
+
+
+# Define Prometheus metrics
+SOCKET_CONNECTIONS = Gauge(
+    "socketio_connections",
+    "Clients currently connected per namespace",
+    ["namespace"],
+)
+
+SOCKET_QUEUED_BYTES = Gauge(
+    "socketio_queued_bytes",
+    "Outbound bytes waiting in client queues per namespace",
+    ["namespace"],
+)
+
+SOCKET_REJECTIONS = Counter(
+    "socketio_admission_rejections_total",
+    "Connections refused by admission control",
+    ["reason"],
+)
+
+SOCKET_EVICTIONS = Counter(
+    "socketio_evictions_total",
+    "Clients disconnected by admission control",
+    ["reason"],
+)
+
+SOCKET_DROPPED = Counter(
+    "socketio_dropped_packets_total",
+    "Outbound packets dropped because the client queue was full",
+    ["namespace"],
+)
+
+
+def _packet_size(pkt) -> int:
+    data = getattr(pkt, "data", None)
+    return len(data) if isinstance(data, (str, bytes)) else 0
+
+
+class AdmissionControl:
+    """
+    Connection and memory limits for a Socket.IO server (per worker):
+    global and per-IP Engine.IO connections, per-namespace connections,
+    bounded outbound queues, and a sweep evicting idle or backed-up clients.
+    """
+
+    def __init__(self, server):
+        self.server = server
+        self.max_connections = settings.SOCKET_MAX_CONNECTIONS
+        self.max_per_ip = settings.SOCKET_MAX_CONNECTIONS_PER_IP
+        self.max_per_namespace = settings.SOCKET_MAX_NAMESPACE_CONNECTIONS
+        self.max_queued_packets = settings.SOCKET_MAX_QUEUED_PACKETS
+        self.max_queued_bytes = settings.SOCKET_MAX_QUEUED_BYTES
+        self.overflow_policy = settings.SOCKET_OVERFLOW_POLICY
+        self.idle_timeout = settings.SOCKET_IDLE_TIMEOUT_SECONDS
+
+        self.ips: Dict[str, str] = {}
+        self.per_ip: Tally = Tally()
+        self.last_seen: Dict[str, float] = {}
+        self._evicting: Set[str] = set()
+        self._sweeper: Optional[asyncio.Task] = None
+
+    # --- Admission ---
+
+    def client_ip(self, environ: dict) -> str:
+        if settings.RATE_LIMIT_TRUST_PROXY:
+            forwarded = environ.get("HTTP_X_FORWARDED_FOR")
+            if forwarded:
+                return forwarded.split(",")[0].strip()
+        return environ.get("REMOTE_ADDR") or "unknown"
+
+    def admit(self, eio_sid: str, environ: dict) -> bool:
+        if self.max_connections and len(self.ips) >= self.max_connections:
+            SOCKET_REJECTIONS.labels(reason="global").inc()
+            return False
+        ip = self.client_ip(environ)
+        if self.max_per_ip and self.per_ip[ip] >= self.max_per_ip:
+            SOCKET_REJECTIONS.labels(reason="per_ip").inc()
+            return False
+
+        self.ips[eio_sid] = ip
+        self.per_ip[ip] += 1
+        self.last_seen[eio_sid] = time.monotonic()
+        if self._sweeper is None:
+            self._sweeper = asyncio.ensure_future(self._sweep_loop())
+        return True
+
+    def admit_namespace(self, namespace: str) -> bool:
+        if not self.max_per_namespace:
+            return True
+        if self.connections(namespace) >= self.max_per_namespace:
+            SOCKET_REJECTIONS.labels(reason="namespace").inc()
+            return False
+        return True
+
+    def release(self, eio_sid: str) -> None:
+        ip = self.ips.pop(eio_sid, None)
+        if ip is not None:
+            self.per_ip[ip] -= 1
+            if self.per_ip[ip] <= 0:
+                del self.per_ip[ip]
+        self.last_seen.pop(eio_sid, None)
+        self._evicting.discard(eio_sid)
+
+    def touch(self, eio_sid: str) -> None:
+        self.last_seen[eio_sid] = time.monotonic()
+
+    # --- Outbound queues ---
+
+    def _queue(self, eio_sid: str):
+        socket = self.server.eio.sockets.get(eio_sid)
+        return getattr(socket, "queue", None)
+
+    def can_enqueue(self, eio_sid: str, namespace: str) -> bool:
+        """False when the packet must not be queued (policy already applied)."""
+        queue = self._queue(eio_sid)
+        if queue is None or not self.max_queued_packets or queue.qsize() < self.max_queued_packets:
+            return True
+
+        if self.overflow_policy == "drop":
+            SOCKET_DROPPED.labels(namespace=namespace).inc()
+        else:
+            self.evict(eio_sid, "queue_full")
+        return False
+
+    def queued_bytes(self, eio_sid: str) -> int:
+        queue = self._queue(eio_sid)
+        if queue is None:
+            return 0
+        # asyncio.Queue keeps its items in a deque; read-only peek
+        return sum(_packet_size(pkt) for pkt in list(getattr(queue, "_queue", ())))
+
+    # --- Eviction ---
+
+    def evict(self, eio_sid: str, reason: str) -> None:
+        if eio_sid in self._evicting:
+            return
+        self._evicting.add(eio_sid)
+        SOCKET_EVICTIONS.labels(reason=reason).inc()
+        # Not inline: we may be inside the send path of this very socket
+        self.server.start_background_task(self.server.eio.disconnect, eio_sid)
+
+    def connections(self, namespace: str) -> int:
+        return len(self.server.manager.rooms.get(namespace, {}).get(None, {}))
+
+    async def _sweep_loop(self):
+        while True:
+            await asyncio.sleep(settings.SOCKET_SWEEP_SECONDS)
+            try:
+                self.sweep()
+            except Exception as e:
+                print(f"[SocketAdmission] Sweep error: {e}")
+
+    def sweep(self) -> None:
+        now = time.monotonic()
+        namespaces = self.server.namespaces if isinstance(self.server.namespaces, list) else []
+        queued: Tally = Tally()
+
+        for eio_sid in list(self.ips):
+            if self.idle_timeout and now - self.last_seen.get(eio_sid, now) > self.idle_timeout:
+                self.evict(eio_sid, "idle")
+                continue
+
+            size = self.queued_bytes(eio_sid)
+            if self.max_queued_bytes and size > self.max_queued_bytes:
+                self.evict(eio_sid, "slow_consumer")
+                continue
+
+            for namespace in namespaces:
+                if self.server.manager.sid_from_eio_sid(eio_sid, namespace):
+                    queued[namespace] += size
+
+        for namespace in namespaces:
+            SOCKET_CONNECTIONS.labels(namespace=namespace).set(self.connections(namespace))
+            SOCKET_QUEUED_BYTES.labels(namespace=namespace).set(queued[namespace])
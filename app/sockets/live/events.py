@@ -15,7 +15,7 @@ def socket_config(sio: AsyncServer, app: FastAPI, module_name: str):
 
     namespace = f"/{module_name}"
     channel = ChannelEvent()
-    handler = wrap_init_connect(sio)
+    handler = wrap_init_connect(sio, namespace)
     streaming = Streaming(sio, namespace)
 
     try:
@@ -32,6 +32,23 @@ def socket_config(sio: AsyncServer, app: FastAPI, module_name: str):
                 )
             return result
 
+        @sio.on("disconnect", namespace=namespace)
+        async def on_disconnect(sid):
+            streaming.remove_client(sid)
+
+        @sio.on("subscribe", namespace=namespace)
+        async def on_subscribe(sid, data):
+            source = (data or {}).get("source")
+            return {"ok": streaming.subscribe(sid, source)}
+
+        @sio.on("unsubscribe", namespace=namespace)
+        async def on_unsubscribe(sid, data):
+            streaming.unsubscribe(sid, (data or {}).get("source"))
+            return {"ok": True}
+
+        # Channel events forwarded as stream updates (batched per tick)
+        streaming.register_source("test", "test")
+
         @channel.subscribe_to("test")
         async def test(args):
 
@@ -39,7 +56,7 @@ def socket_config(sio: AsyncServer, app: FastAPI, module_name: str):
 
             await sio.emit("test2", "XDDD", namespace=namespace)
 
-        # asyncio.ensure_future(streaming.send('0'), loop=asyncio.get_event_loop())
+        # Producers push with streaming.send("<source>", update)
 
     except ValueError as e:
         print(e)
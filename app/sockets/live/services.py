@@ -1,20 +1,238 @@
 import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Set, Union
 
-from fastapi_socketio import SocketManager
+from prometheus_client import Counter, Gauge
+from socketio import AsyncServer
+
+from core.config.globals import settings
+from core.event import ChannelEvent
+
+
+# Define Prometheus metrics
+STREAMING_UPDATES = Counter(
+    "streaming_updates_total",
+    "Updates pushed into the streaming pipeline by outcome",
+    ["namespace", "outcome"],
+)
+
+STREAMING_FRAMES = Counter(
+    "streaming_frames_total",
+    "Frames emitted to clients by the streaming pipeline",
+    ["namespace"],
+)
+
+STREAMING_CLIENTS = Gauge(
+    "streaming_clients",
+    "Clients subscribed to at least one stream",
+    ["namespace"],
+)
+
+
+# An async generator function (started while someone listens) or a ChannelEvent key
+Source = Union[Callable[[], AsyncIterator[Any]], str]
+
+
+@dataclass
+class ClientStream:
+    sid: str
+    sources: Set[str] = field(default_factory=set)
+    # source -> latest payload; dict payloads are merged key by key
+    pending: Dict[str, Any] = field(default_factory=dict)
+    pending_keys: int = 0
+    in_flight_since: Optional[float] = None
 
 
 class Streaming:
-    sources: list = []
-    sio: SocketManager = None
+    """
+    Batched push pipeline for a namespace.
+
+    Producers ``send`` updates for a named source as fast as they like; each
+    subscribed client gets at most one ``frame`` event per tick holding the
+    latest state of its sources. Dict updates are merged by key and every
+    other update replaces the previous one, so slow consumers skip
+    superseded values instead of queueing them.
 
-    def __init__(self, socket_manager: SocketManager, namespace: str):
-        self.sio = socket_manager
+    Backpressure: a client receives its next frame only after acknowledging
+    the previous one (``socket.on("frame", (frame, ack) => { ...; ack() })``)
+    or after STREAMING_ACK_TIMEOUT_SECONDS.
+    """
+
+    def __init__(self, sio: AsyncServer, namespace: str):
+        self.sio = sio
         self.namespace = namespace
+        self.tick = settings.STREAMING_TICK_MS / 1000
+        self.require_ack = settings.STREAMING_REQUIRE_ACK
+        self.ack_timeout = settings.STREAMING_ACK_TIMEOUT_SECONDS
+        self.max_pending_keys = settings.STREAMING_MAX_PENDING_KEYS
+
+        self.sources: Dict[str, Source] = {}
+        self.subscribers: Dict[str, Set[str]] = {}
+        self.clients: Dict[str, ClientStream] = {}
+        self._producers: Dict[str, asyncio.Task] = {}
+        self._ticker: Optional[asyncio.Task] = None
+
+    # --- Producers ---
+
+    def register_source(self, name: str, source: Source) -> None:
+        if name in self.sources:
+            raise ValueError(f"Stream source '{name}' already registered")
+        self.sources[name] = source
+
+        if isinstance(source, str):
+            # Every emission of the channel event becomes an update
+            async def forward(*args, **kwargs):
+                self.send(name, kwargs or (args[0] if len(args) == 1 else list(args)))
+
+            ChannelEvent().subscribe_to(source, handler=forward)
+
+    def send(self, source_name: str, update: Any) -> None:
+        """Queues an update for every subscriber of the source (non-blocking)."""
+        sids = self.subscribers.get(source_name)
+        if not sids:
+            return
+
+        for sid in sids:
+            client = self.clients[sid]
+            previous = client.pending.get(source_name)
+
+            if isinstance(update, dict):
+                merged = previous if isinstance(previous, dict) else {}
+                new_keys = sum(1 for key in update if key not in merged)
+                if client.pending_keys + new_keys > self.max_pending_keys:
+                    STREAMING_UPDATES.labels(namespace=self.namespace, outcome="dropped").inc()
+                    continue
+                client.pending_keys += new_keys
+                merged.update(update)
+                client.pending[source_name] = merged
+            else:
+                if isinstance(previous, dict):
+                    client.pending_keys -= len(previous)
+                client.pending[source_name] = update
+
+            STREAMING_UPDATES.labels(
+                namespace=self.namespace,
+                outcome="merged" if previous is not None else "accepted",
+            ).inc()
 
-    async def send(self, source_name: str):
+    async def _produce(self, name: str, source: Callable[[], AsyncIterator[Any]]):
         try:
+            async for update in source():
+                self.send(name, update)
+        except asyncio.CancelledError:
             pass
+        except Exception as e:
+            print(f"[Streaming] Source '{name}' failed: {e}")
+        finally:
+            self._producers.pop(name, None)
+
+    # --- Consumers ---
+
+    def subscribe(self, sid: str, source_name: str) -> bool:
+        source = self.sources.get(source_name)
+        if source is None:
+            return False
+
+        client = self.clients.get(sid)
+        if client is None:
+            client = self.clients[sid] = ClientStream(sid)
+            STREAMING_CLIENTS.labels(namespace=self.namespace).set(len(self.clients))
+        client.sources.add(source_name)
+        self.subscribers.setdefault(source_name, set()).add(sid)
+
+        # Generator sources only run while someone listens
+        if not isinstance(source, str) and source_name not in self._producers:
+            self._producers[source_name] = asyncio.create_task(self._produce(source_name, source))
+        if self._ticker is None:
+            self._ticker = asyncio.create_task(self._run())
+        return True
+
+    def _detach(self, client: ClientStream, source_name: str) -> None:
+        client.sources.discard(source_name)
+        dropped = client.pending.pop(source_name, None)
+        if isinstance(dropped, dict):
+            client.pending_keys -= len(dropped)
+
+        sids = self.subscribers.get(source_name)
+        if sids is not None:
+            sids.discard(client.sid)
+            if not sids:
+                del self.subscribers[source_name]
+                producer = self._producers.pop(source_name, None)
+                if producer is not None:
+                    producer.cancel()
+
+    def unsubscribe(self, sid: str, source_name: str) -> None:
+        client = self.clients.get(sid)
+        if client is None:
+            return
+        self._detach(client, source_name)
+        if not client.sources:
+            self.remove_client(sid)
+
+    def remove_client(self, sid: str) -> None:
+        """Cancels everything a client was receiving (call on disconnect)."""
+        client = self.clients.pop(sid, None)
+        if client is None:
+            return
+        STREAMING_CLIENTS.labels(namespace=self.namespace).set(len(self.clients))
+        for source_name in list(client.sources):
+            self._detach(client, source_name)
+
+    # --- Delivery ---
+
+    async def _run(self):
+        try:
+            while self.clients:
+                started = time.monotonic()
+                await self._flush()
+                await asyncio.sleep(max(0.0, self.tick - (time.monotonic() - started)))
         except asyncio.CancelledError:
             pass
+        finally:
+            self._ticker = None
+
+    async def _flush(self):
+        now = time.monotonic()
+        frames = []
+        for client in self.clients.values():
+            if not client.pending:
+                continue
+            if client.in_flight_since is not None and now - client.in_flight_since < self.ack_timeout:
+                continue  # Still busy with the previous frame, keep merging
+            frames.append((client.sid, client.pending))
+            client.pending = {}
+            client.pending_keys = 0
+            client.in_flight_since = now if self.require_ack else None
+
+        if not frames:
+            return
+        await asyncio.gather(*(self._emit(sid, frame) for sid, frame in frames))
+
+    async def _emit(self, sid: str, frame: Dict[str, Any]):
+        try:
+            await self.sio.emit(
+                "frame",
+                frame,
+                to=sid,
+                namespace=self.namespace,
+                callback=(lambda *_: self._ack(sid)) if self.require_ack else None,
+                # The client is connected to this worker; acks don't cross the queue
+                ignore_queue=True,
+            )
+            STREAMING_FRAMES.labels(namespace=self.namespace).inc()
         except Exception as e:
-            print(e)
+            print(f"[Streaming] Error emitting frame to {sid}: {e}")
+            self._ack(sid)
+
+    def _ack(self, sid: str) -> None:
+        client = self.clients.get(sid)
+        if client is not None:
+            client.in_flight_since = None
+
+    async def close(self):
+        for producer in list(self._producers.values()):
+            producer.cancel()
+        if self._ticker is not None:
+            self._ticker.cancel()
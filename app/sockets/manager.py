@@ -0,0 +1,123 @@
+import time
+from typing import Any, Optional
+
+import redis as redis_sync
+import socketio
+from prometheus_client import Counter, Gauge, Histogram
+
+from core.config.globals import settings
+
+
+# Define Prometheus metrics
+SOCKET_PUBSUB_MESSAGES = Counter(
+    "socketio_pubsub_messages_total",
+    "Socket.IO messages exchanged through the message queue",
+    ["direction", "method"],
+)
+
+SOCKET_PUBSUB_EMIT_LATENCY = Histogram(
+    "socketio_pubsub_emit_latency_seconds",
+    "Time between an emit on another node and its delivery here",
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+)
+
+SOCKET_PUBSUB_QUEUE_DEPTH = Gauge(
+    "socketio_pubsub_queue_depth",
+    "Messages taken from the queue and not yet delivered to local clients",
+)
+
+
+def redis_url() -> str:
+    return settings.SOCKETIO_REDIS_URL or f"redis://{settings.REDIS_HOST}:{settings.REDIS_PORT}/0"
+
+
+class InstrumentedRedisManager(socketio.AsyncRedisManager):
+    """
+    AsyncRedisManager stamping published messages so the receiving nodes
+    can measure cross-node emit latency (assumes synchronized clocks).
+    """
+
+    async def _publish(self, data):
+        SOCKET_PUBSUB_MESSAGES.labels(direction="published", method=data.get("method")).inc()
+        return await super()._publish({**data, "sent_at": time.time()})
+
+    async def _handle_emit(self, message):
+        # Emits from this node are delivered locally before being published
+        if message.get("host_id") == self.host_id:
+            return await super()._handle_emit(message)
+
+        SOCKET_PUBSUB_MESSAGES.labels(direction="received", method="emit").inc()
+        sent_at = message.get("sent_at")
+        if sent_at:
+            SOCKET_PUBSUB_EMIT_LATENCY.observe(max(0.0, time.time() - sent_at))
+
+        SOCKET_PUBSUB_QUEUE_DEPTH.inc()
+        try:
+            await super()._handle_emit(message)
+        finally:
+            SOCKET_PUBSUB_QUEUE_DEPTH.dec()
+
+
+def create_client_manager(write_only: bool = False) -> Optional[socketio.AsyncManager]:
+    """
+    Client manager selected by SOCKETIO_MANAGER. With "redis" rooms and
+    emits span every worker and node; when Redis is unreachable (or with
+    "memory") it falls back to the in-process manager.
+    """
+    if settings.SOCKETIO_MANAGER != "redis":
+        return None if write_only else socketio.AsyncManager()
+
+    url = redis_url()
+    try:
+        # Same check as the cache: fail at boot instead of on the first emit
+        redis_sync.Redis.from_url(url).ping()
+    except Exception as e:
+        print(f"Socket.IO Warning: Could not connect to Redis ({e}). Falling back to In-Process.")
+        return None if write_only else socketio.AsyncManager()
+
+    return InstrumentedRedisManager(
+        url, channel=settings.SOCKETIO_CHANNEL, write_only=write_only
+    )
+
+
+class SocketEmitter:
+    """
+    Emits to Socket.IO clients from anywhere: HTTP handlers and jobs in a
+    worker go through that worker's server, other processes (CLI, job
+    runners) through a write-only connection to the message queue.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(SocketEmitter, cls).__new__(cls)
+            cls._instance._initialize()
+        return cls._instance
+
+    def _initialize(self):
+        self.server: Optional[socketio.AsyncServer] = None
+        self._external: Optional[socketio.AsyncManager] = None
+        self._external_ready = False
+
+    def attach(self, server: socketio.AsyncServer) -> None:
+        self.server = server
+
+    async def emit(
+        self, event: str, data: Any = None, namespace: str = "/", room: Optional[str] = None
+    ) -> None:
+        if self.server is not None:
+            await self.server.emit(event, data, namespace=namespace, room=room)
+            return
+
+        if not self._external_ready:
+            self._external = create_client_manager(write_only=True)
+            self._external_ready = True
+        if self._external is None:
+            print(f"Socket.IO Warning: no server or queue to emit '{event}'")
+            return
+        await self._external.emit(event, data, namespace=namespace, room=room)
+
+
+# Singleton Instance
+emitter = SocketEmitter()
@@ -0,0 +1,151 @@
+import json
+import logging
+import random
+import time
+from typing import Any
+
+import socketio
+from socketio import packet
+from prometheus_client import Counter, Histogram
+
+from core.config.globals import settings
+
+
+# Define Prometheus metrics (default registry, next to PrometheusMiddleware's)
+SOCKET_CONNECTS = Counter(
+    "socketio_connects_total",
+    "Socket.IO namespace connections by result",
+    ["namespace", "result"],
+)
+
+SOCKET_DISCONNECTS = Counter(
+    "socketio_disconnects_total",
+    "Socket.IO namespace disconnections",
+    ["namespace"],
+)
+
+SOCKET_EVENTS = Counter(
+    "socketio_events_total",
+    "Socket.IO event packets, emits counted once per recipient",
+    ["namespace", "direction"],
+)
+
+SOCKET_BYTES = Counter(
+    "socketio_bytes_total",
+    "Encoded Socket.IO packet bytes",
+    ["namespace", "direction"],
+)
+
+SOCKET_HANDSHAKE = Histogram(
+    "socketio_handshake_duration_seconds",
+    "Time to accept or refuse a namespace connection (auth included)",
+    ["namespace"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+)
+
+
+EVENT_PACKETS = (packet.EVENT, packet.BINARY_EVENT)
+
+events_logger = logging.getLogger("app.sockets")
+
+
+def configure_loggers() -> tuple:
+    """
+    Socket.IO and Engine.IO log every packet at INFO; their levels come from
+    settings so production keeps them at WARNING.
+    """
+    socketio_logger = logging.getLogger("socketio.server")
+    socketio_logger.setLevel(settings.SOCKETIO_LOG_LEVEL.upper())
+    engineio_logger = logging.getLogger("engineio.server")
+    engineio_logger.setLevel(settings.ENGINEIO_LOG_LEVEL.upper())
+    events_logger.setLevel(logging.INFO)
+    if not events_logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        events_logger.addHandler(handler)
+        events_logger.propagate = False
+    return socketio_logger, engineio_logger
+
+
+def log_sampled(event: str, force: bool = False, **fields: Any) -> None:
+    """One JSON line for a sampled fraction (SOCKETIO_LOG_SAMPLE_RATE) of socket events."""
+    if not force and random.random() >= settings.SOCKETIO_LOG_SAMPLE_RATE:
+        return
+    events_logger.info(json.dumps({"event": event, "ts": round(time.time(), 3), **fields}, default=str))
+
+
+def _size(encoded) -> int:
+    if isinstance(encoded, list):
+        return sum(_size(item) for item in encoded)
+    return len(encoded) if isinstance(encoded, (str, bytes)) else 0
+
+
+class InstrumentedAsyncServer(socketio.AsyncServer):
+    """
+    AsyncServer counting connections, events and bytes per namespace.
+    Hooks the packet level so emits through any client manager are covered.
+    """
+
+    def _label(self, namespace) -> str:
+        # Namespaces come from clients; keep label cardinality bounded
+        namespace = namespace or "/"
+        if self.namespaces == "*" or namespace == "/" or namespace in self.namespaces:
+            return namespace
+        return "other"
+
+    async def _send_packet(self, eio_sid, pkt):
+        namespace = self._label(pkt.namespace)
+        if pkt.packet_type == packet.CONNECT:
+            SOCKET_CONNECTS.labels(namespace=namespace, result="accepted").inc()
+        elif pkt.packet_type == packet.CONNECT_ERROR:
+            SOCKET_CONNECTS.labels(namespace=namespace, result="refused").inc()
+            log_sampled("connect_refused", force=True, namespace=namespace, eio_sid=eio_sid)
+        elif pkt.packet_type in EVENT_PACKETS:
+            encoded = pkt.encode()
+            SOCKET_EVENTS.labels(namespace=namespace, direction="sent").inc()
+            SOCKET_BYTES.labels(namespace=namespace, direction="sent").inc(_size(encoded))
+            log_sampled("emit", namespace=namespace, eio_sid=eio_sid, bytes=_size(encoded))
+            if isinstance(encoded, list):
+                for ep in encoded:
+                    await self.eio.send(eio_sid, ep)
+            else:
+                await self.eio.send(eio_sid, encoded)
+            return
+        await super()._send_packet(eio_sid, pkt)
+
+    async def _handle_connect(self, eio_sid, namespace, data):
+        label = self._label(namespace)
+        started = time.perf_counter()
+        try:
+            await super()._handle_connect(eio_sid, namespace, data)
+        finally:
+            elapsed = time.perf_counter() - started
+            SOCKET_HANDSHAKE.labels(namespace=label).observe(elapsed)
+            log_sampled("connect", namespace=label, eio_sid=eio_sid, ms=round(elapsed * 1000, 2))
+
+    async def _handle_disconnect(self, eio_sid, namespace):
+        # Engine.IO disconnects walk every namespace, count only the joined ones
+        sid = self.manager.sid_from_eio_sid(eio_sid, namespace or "/")
+        if self.manager.is_connected(sid, namespace or "/"):
+            label = self._label(namespace)
+            SOCKET_DISCONNECTS.labels(namespace=label).inc()
+            log_sampled("disconnect", namespace=label, eio_sid=eio_sid)
+        await super()._handle_disconnect(eio_sid, namespace)
+
+    async def _handle_event(self, eio_sid, namespace, id, data):
+        label = self._label(namespace)
+        SOCKET_EVENTS.labels(namespace=label, direction="received").inc()
+        log_sampled("event", namespace=label, eio_sid=eio_sid, name=data[0] if data else None)
+        await super()._handle_event(eio_sid, namespace, id, data)
+
+    async def _handle_eio_message(self, eio_sid, data):
+        # Raw bytes are counted before decoding; text packets name their namespace
+        # right after the type (and binary attachment count), e.g. 2/live,[...]
+        if isinstance(data, (str, bytes)):
+            namespace = "/"
+            if isinstance(data, str):
+                start = data.find("/")
+                if 0 < start <= 4 and data[:start].rstrip("-").isdigit():
+                    namespace = data[start:].split(",", 1)[0]
+            SOCKET_BYTES.labels(namespace=self._label(namespace), direction="received").inc(len(data))
+        await super()._handle_eio_message(eio_sid, data)
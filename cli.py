@@ -8,6 +8,7 @@ from core.cli.generate_module import generate_module
 from core.cli.generate_socket import generate_socket
 from core.cli.generate_webhook import generate_webhook
 from core.cli.generate_plugin import generate_plugin
+from core.cli.profile_startup import profile_startup
 
 
 def main():
@@ -31,6 +32,15 @@ Examples:
   
   # Generate a plugin
   python cli.py generate:plugin mailer
+
+  # Profile the application boot (reports in ./profiles)
+  python cli.py profile:startup
+
+  # Build fingerprinted, precompressed static assets (before serve)
+  python cli.py static:build
+
+  # Run in production (gunicorn + uvicorn workers, one per CPU by default)
+  python cli.py serve --workers 8
         """
     )
     
@@ -48,6 +58,16 @@ Examples:
     # Optional flags for webhooks
     parser.add_argument('--in', action='store_true', dest='in_only', help='Generate inbound webhook only')
     parser.add_argument('--out', action='store_true', dest='out_only', help='Generate outbound webhook only')
+
+    # Optional flags for the boot profiler
+    parser.add_argument('--output', default='profiles', help='Directory for profile reports')
+    parser.add_argument('--timeout', type=float, default=120.0, help='Seconds to wait for the boot to finish')
+
+    # Optional flags for the production server
+    parser.add_argument('--host', help='Interface to bind (WEB_HOST)')
+    parser.add_argument('--port', type=int, help='Port to bind (WEB_PORT)')
+    parser.add_argument('--workers', type=int, help='Worker processes (WEB_WORKERS, default CPU count)')
+    parser.add_argument('--no-preload', action='store_false', dest='preload', default=None, help='Import the app in each worker instead of the master')
     
     args = parser.parse_args()
     
@@ -80,6 +100,18 @@ Examples:
             print("[ERROR] Plugin name is required")
             sys.exit(1)
         generate_plugin(args.args[0])
+
+    elif args.command == 'profile:startup':
+        profile_startup(args.output, args.timeout)
+
+    elif args.command == 'static:build':
+        from core.cli.build_static import build_static
+        build_static(args.args[0] if args.args else None)
+
+    elif args.command == 'serve':
+        # Imported here so the generators keep working without the app settings
+        from core.cli.serve import serve
+        serve(args.host, args.port, args.workers, args.preload)
     
     else:
         print(f"[ERROR] Unknown command: {args.command}")
@@ -88,6 +120,9 @@ Examples:
         print("  generate:socket <name>   - Generate a new socket module")
         print("  generate:webhook <name>  - Generate a new webhook (use --in or --out for specific ones)")
         print("  generate:plugin <name>   - Generate a new plugin structure")
+        print("  profile:startup          - Profile boot phases and import times")
+        print("  static:build [dir]       - Fingerprint and precompress the admin static assets")
+        print("  serve                    - Run the production server (gunicorn + uvicorn workers)")
         sys.exit(1)
 
 
@@ -0,0 +1,67 @@
+import json
+import os
+from typing import Dict
+
+from core.config.globals import settings
+from .manifest import build_bundles
+from .server import AssetFiles, cache_asset
+
+
+class Assets:
+    """
+    Fingerprinted URLs for the assets the admin templates use, served from
+    STATIC_ASSETS_PREFIX. Uses the output of ``python cli.py static:build``
+    (with precompressed variants) when present, otherwise fingerprints the
+    source files at startup and serves them uncompressed.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(Assets, cls).__new__(cls)
+            cls._instance._initialize()
+        return cls._instance
+
+    def _initialize(self):
+        self.prefix = settings.STATIC_ASSETS_PREFIX.rstrip("/")
+        self.build_dir = settings.STATIC_BUILD_DIR
+        self.urls: Dict[str, str] = {}
+        self.app = AssetFiles()
+
+    def load(self) -> None:
+        manifest = os.path.join(self.build_dir, "manifest.json")
+        if os.path.isfile(manifest):
+            self._load_build(manifest)
+        else:
+            self._load_sources()
+        print(f"[Assets] {len(self.urls)} assets, {len(self.app.files)} files")
+
+    def _load_build(self, manifest: str) -> None:
+        with open(manifest) as f:
+            self.urls = json.load(f)
+        for dirpath, _, filenames in os.walk(self.build_dir):
+            for filename in filenames:
+                if filename == "manifest.json" or filename.endswith((".br", ".gz")):
+                    continue
+                path = os.path.join(dirpath, filename)
+                public = os.path.relpath(path, self.build_dir).replace(os.sep, "/")
+                # The directory fingerprints its whole bundle, add the name for a per-file tag
+                self.app.files[public] = cache_asset(path, public.replace("/", "-"))
+
+    def _load_sources(self) -> None:
+        print(f"[Assets] No build in {self.build_dir}, serving sources (run python cli.py static:build)")
+        for url, bundle in build_bundles().items():
+            self.urls[url] = bundle.public_path
+            for path in bundle.files:
+                public = bundle.relative(path)
+                self.app.files[public] = cache_asset(path, public.replace("/", "-"), with_variants=False)
+
+    def url(self, path: str) -> str:
+        """Template helper: ``{{ asset('/node_modules/htmx.org/dist/htmx.min.js') }}``."""
+        public = self.urls.get(path)
+        return f"{self.prefix}/{public}" if public else path
+
+
+# Singleton Instance
+assets = Assets()
@@ -0,0 +1,131 @@
+import hashlib
+import json
+import os
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set
+
+
+# URL prefixes templates may reference, and where their files live
+ASSET_ROOTS = {
+    "/static/": "admin/static",
+    "/node_modules/": "node_modules",
+    "/public/": "app/public",
+}
+
+TEMPLATE_DIRS = ["admin/src"]
+
+# src="/..." / href="/..." / import ... from '/...' / asset('/...')
+REFERENCE_RE = re.compile(
+    r"""(?:\bsrc|\bhref)\s*=\s*["'](/[^"'{}?#]+)["']"""
+    r"""|\bfrom\s*["'](/[^"'{}?#]+)["']"""
+    r"""|\basset\(\s*["'](/[^"'?#]+)["']\s*\)"""
+)
+
+# Relative specifiers a browser fetches next to the file: ES module imports
+# (static and dynamic) and CSS url()/@import
+ESM_IMPORT_RE = re.compile(
+    r"""(?:\bimport|\bexport)\b[^"';]*?\bfrom\s*["'](\.{1,2}/[^"']+)["']"""
+    r"""|\bimport\s*\(?\s*["'](\.{1,2}/[^"']+)["']"""
+)
+CSS_URL_RE = re.compile(r"""url\(\s*["']?(?!data:|[a-z]+://|/)([^"')?#]+)|@import\s+["'](\.{0,2}/?[^"']+)["']""")
+
+
+@dataclass
+class AssetBundle:
+    """An entry file and everything it loads by relative path, fingerprinted together."""
+    url: str
+    entry: str
+    base: str
+    files: List[str] = field(default_factory=list)
+    fingerprint: str = ""
+
+    @property
+    def public_path(self) -> str:
+        return f"{self.fingerprint}/{os.path.relpath(self.entry, self.base).replace(os.sep, '/')}"
+
+    def relative(self, path: str) -> str:
+        return f"{self.fingerprint}/{os.path.relpath(path, self.base).replace(os.sep, '/')}"
+
+
+def scan_templates(template_dirs: Iterable[str] = TEMPLATE_DIRS) -> Set[str]:
+    """Asset URLs referenced by the templates, limited to the known roots."""
+    urls: Set[str] = set()
+    for template_dir in template_dirs:
+        for dirpath, _, filenames in os.walk(template_dir):
+            for filename in filenames:
+                if not filename.endswith(".html"):
+                    continue
+                with open(os.path.join(dirpath, filename), encoding="utf-8") as f:
+                    for match in REFERENCE_RE.finditer(f.read()):
+                        url = next(group for group in match.groups() if group)
+                        if resolve(url):
+                            urls.add(url)
+    return urls
+
+
+def resolve(url: str) -> Optional[str]:
+    for prefix, root in ASSET_ROOTS.items():
+        if url.startswith(prefix):
+            path = os.path.normpath(os.path.join(root, url[len(prefix):]))
+            # No way out of the root through ../
+            if os.path.commonpath([os.path.abspath(path), os.path.abspath(root)]) != os.path.abspath(root):
+                return None
+            return path if os.path.isfile(path) else None
+    return None
+
+
+def dependencies(path: str) -> List[str]:
+    ext = os.path.splitext(path)[1]
+    if ext in (".js", ".mjs"):
+        pattern = ESM_IMPORT_RE
+    elif ext == ".css":
+        pattern = CSS_URL_RE
+    else:
+        return []
+
+    with open(path, encoding="utf-8", errors="ignore") as f:
+        content = f.read()
+    found = []
+    for match in pattern.finditer(content):
+        specifier = next((group for group in match.groups() if group), None)
+        if not specifier:
+            continue
+        dependency = os.path.normpath(os.path.join(os.path.dirname(path), specifier))
+        # Code that merely mentions a path (strings, comments) resolves to nothing
+        if os.path.isfile(dependency):
+            found.append(dependency)
+    return found
+
+
+def bundle(url: str, entry: str) -> AssetBundle:
+    files: List[str] = []
+    seen: Set[str] = set()
+    stack = [entry]
+    while stack:
+        path = stack.pop()
+        if path in seen:
+            continue
+        seen.add(path)
+        files.append(path)
+        stack.extend(dependencies(path))
+
+    files.sort()
+    digest = hashlib.sha256()
+    base = os.path.commonpath([os.path.dirname(path) for path in files])
+    for path in files:
+        digest.update(os.path.relpath(path, base).encode())
+        with open(path, "rb") as f:
+            digest.update(hashlib.sha256(f.read()).digest())
+
+    return AssetBundle(url=url, entry=entry, base=base, files=files, fingerprint=digest.hexdigest()[:12])
+
+
+def build_bundles(template_dirs: Iterable[str] = TEMPLATE_DIRS) -> Dict[str, AssetBundle]:
+    return {url: bundle(url, resolve(url)) for url in sorted(scan_templates(template_dirs))}
+
+
+def write_manifest(path: str, bundles: Dict[str, AssetBundle]) -> None:
+    data = {url: item.public_path for url, item in bundles.items()}
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
@@ -0,0 +1,96 @@
+import mimetypes
+import os
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+
+from starlette.responses import FileResponse, PlainTextResponse, Response
+from starlette.types import Receive, Scope, Send
+
+
+# Precompressed variants written by static:build, in order of preference
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+@dataclass
+class CachedAsset:
+    path: str
+    stat: os.stat_result
+    media_type: str
+    etag: str
+    # encoding -> (path, stat)
+    variants: Dict[str, Tuple[str, os.stat_result]] = field(default_factory=dict)
+
+
+def cache_asset(path: str, fingerprint: str, with_variants: bool = True) -> CachedAsset:
+    media_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+    if path.endswith(".mjs"):
+        media_type = "text/javascript"
+    asset = CachedAsset(path, os.stat(path), media_type, fingerprint)
+    if with_variants:
+        for encoding, suffix in ENCODINGS:
+            if os.path.isfile(path + suffix):
+                asset.variants[encoding] = (path + suffix, os.stat(path + suffix))
+    return asset
+
+
+def accepted_encodings(header: str) -> set:
+    accepted = set()
+    for part in header.split(","):
+        coding, _, params = part.strip().partition(";")
+        quality = params.strip()
+        if quality.startswith("q="):
+            try:
+                if float(quality[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(coding.strip().lower())
+    return accepted
+
+
+class AssetFiles:
+    """
+    Serves fingerprinted assets from an in-memory table built at startup: no
+    per-request stat or path lookup, immutable caching, conditional requests
+    answered without touching the disk, and brotli/gzip variants picked by
+    Accept-Encoding.
+    """
+
+    def __init__(self, files: Optional[Dict[str, CachedAsset]] = None):
+        self.files: Dict[str, CachedAsset] = files or {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            return
+        if scope["method"] not in ("GET", "HEAD"):
+            await PlainTextResponse("Method Not Allowed", status_code=405)(scope, receive, send)
+            return
+
+        asset = self.files.get(scope["path"].lstrip("/"))
+        if asset is None:
+            await PlainTextResponse("Not Found", status_code=404)(scope, receive, send)
+            return
+
+        headers = dict((k.decode("latin-1").lower(), v.decode("latin-1")) for k, v in scope["headers"])
+        accepted = accepted_encodings(headers.get("accept-encoding", ""))
+        encoding = next((name for name, _ in ENCODINGS if name in asset.variants and name in accepted), None)
+
+        etag = f'"{asset.etag}-{encoding}"' if encoding else f'"{asset.etag}"'
+        response_headers = {"cache-control": CACHE_CONTROL, "etag": etag}
+        if asset.variants:
+            response_headers["vary"] = "Accept-Encoding"
+
+        if_none_match = headers.get("if-none-match", "")
+        if if_none_match == "*" or etag in [tag.strip() for tag in if_none_match.split(",")]:
+            await Response(status_code=304, headers=response_headers)(scope, receive, send)
+            return
+
+        path, stat = asset.variants[encoding] if encoding else (asset.path, asset.stat)
+        if encoding:
+            response_headers["content-encoding"] = encoding
+        response = FileResponse(
+            path, stat_result=stat, headers=response_headers, media_type=asset.media_type
+        )
+        await response(scope, receive, send)
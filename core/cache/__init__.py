@@ -11,6 +11,8 @@ from .memory import InMemoryCacheBackend
 # Try to import Redis backend, but don't fail if dependencies are issues (though we know they exist)
 from .redis.backend import RedisCacheBackend
 
+from core.utils.boot_profile import boot_profiler
+
 
 class Cache:
     _instance = None
@@ -29,13 +31,14 @@ class Cache:
         redis_port = settings.REDIS_PORT
 
         # Try to initialize Redis
-        try:
-            self.backend = RedisCacheBackend(host=redis_host, port=redis_port)
-        except Exception as e:
-            print(
-                f"Cache Warning: Could not connect to Redis ({e}). Falling back to In-Memory."
-            )
-            self.backend = InMemoryCacheBackend()
+        with boot_profiler.phase("cache.connect"):
+            try:
+                self.backend = RedisCacheBackend(host=redis_host, port=redis_port)
+            except Exception as e:
+                print(
+                    f"Cache Warning: Could not connect to Redis ({e}). Falling back to In-Memory."
+                )
+                self.backend = InMemoryCacheBackend()
 
     # --- Public Accessors for manual usage ---
 
@@ -0,0 +1,78 @@
+"""
+Static asset build: copies the assets the admin templates reference (and
+the files they load by relative path) into fingerprinted directories, with
+gzip and brotli variants next to each compressible file.
+"""
+import gzip
+import os
+import shutil
+from typing import Optional
+
+try:
+    import brotli
+except ImportError:  # Optional: without it only gzip variants are written
+    brotli = None
+
+from core.assets.manifest import build_bundles, write_manifest
+
+
+COMPRESSIBLE = {".js", ".mjs", ".css", ".svg", ".html", ".json", ".map", ".txt", ".xml", ".ico", ".wasm"}
+
+# Smaller files are not worth a variant (and a second lookup)
+MIN_COMPRESS_SIZE = 512
+
+
+def _write_variants(path: str) -> int:
+    with open(path, "rb") as f:
+        data = f.read()
+    if len(data) < MIN_COMPRESS_SIZE:
+        return 0
+
+    written = 0
+    variants = [(".gz", lambda raw: gzip.compress(raw, compresslevel=9, mtime=0))]
+    if brotli is not None:
+        variants.insert(0, (".br", lambda raw: brotli.compress(raw, quality=11)))
+    for suffix, compress in variants:
+        compressed = compress(data)
+        # Keep a variant only when it saves at least 5%
+        if len(compressed) < len(data) * 0.95:
+            with open(path + suffix, "wb") as f:
+                f.write(compressed)
+            written += 1
+    return written
+
+
+def build_static(output_dir: Optional[str] = None) -> None:
+    from core.config.globals import settings
+
+    output_dir = output_dir or settings.STATIC_BUILD_DIR
+    if brotli is None:
+        print("[WARNING] brotli is not installed, writing gzip variants only")
+
+    # Built aside and swapped in, so a running server never sees half a build
+    staging = f"{output_dir}.tmp"
+    shutil.rmtree(staging, ignore_errors=True)
+    os.makedirs(staging)
+
+    bundles = build_bundles()
+    files = variants = 0
+    for url, bundle in bundles.items():
+        for path in bundle.files:
+            target = os.path.join(staging, bundle.relative(path))
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            shutil.copyfile(path, target)
+            files += 1
+            if os.path.splitext(path)[1] in COMPRESSIBLE:
+                variants += _write_variants(target)
+        print(f"  {url} -> {bundle.public_path} ({len(bundle.files)} files)")
+
+    write_manifest(os.path.join(staging, "manifest.json"), bundles)
+
+    previous = f"{output_dir}.old"
+    shutil.rmtree(previous, ignore_errors=True)
+    if os.path.exists(output_dir):
+        os.replace(output_dir, previous)
+    os.replace(staging, output_dir)
+    shutil.rmtree(previous, ignore_errors=True)
+
+    print(f"[SUCCESS] {len(bundles)} assets, {files} files, {variants} compressed variants in {output_dir}")
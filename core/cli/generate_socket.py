@@ -18,7 +18,7 @@ from core.middlewares.jwt_verify_socket import wrap_init_connect
 def socket_config(sio: AsyncServer, app: FastAPI, module_name: str):
     namespace = f"/{{module_name}}"
     channel = ChannelEvent()
-    handler = wrap_init_connect(sio)
+    handler = wrap_init_connect(sio, namespace)
     # service = {name.capitalize()}Service(sio, namespace)
 
     try:
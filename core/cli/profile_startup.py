@@ -0,0 +1,177 @@
+"""
+CLI boot profiler: times the startup phases and every module import.
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+
+# Runs in a child interpreter started with -X importtime. main is imported
+# inside a running loop, like uvicorn does, then the lifespan runs until the
+# readiness gate opens (init_auth finished).
+BOOTSTRAP = """
+import asyncio, json, os, sys
+
+async def boot():
+    import main
+    from core.services.readiness import readiness
+    async with main.app.router.lifespan_context(main.app):
+        await readiness.wait()
+
+    from core.utils.boot_profile import boot_profiler
+    from core.utils.module_registry import registry
+    with open(sys.argv[1], "w") as f:
+        json.dump({"phases": boot_profiler.report(), "modules": registry.report()}, f)
+
+try:
+    asyncio.run(asyncio.wait_for(boot(), timeout=float(sys.argv[2])))
+finally:
+    sys.stderr.flush()
+    # Background tasks (revocation listener, scheduler) never finish on their own
+    os._exit(0)
+"""
+
+
+def parse_importtime(stderr: str) -> List[Dict[str, Any]]:
+    """
+    Builds the import tree from ``-X importtime`` output.
+
+    Lines come children first, nested by two spaces per level, so the
+    children of a line are the pending entries one level deeper.
+
+    Args:
+        stderr: Raw stderr of the profiled interpreter
+
+    Returns:
+        Root imports, each with self_us, cumulative_us and children
+    """
+    pending: Dict[int, List[Dict[str, Any]]] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|", 2)
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # Header line
+        name = parts[2][1:]
+        depth = (len(name) - len(name.lstrip(" "))) // 2
+        node = {
+            "module": name.strip(),
+            "self_us": int(parts[0]),
+            "cumulative_us": int(parts[1]),
+            "children": pending.pop(depth + 1, []),
+        }
+        pending.setdefault(depth, []).append(node)
+    return pending.get(0, [])
+
+
+def collapse_imports(roots: List[Dict[str, Any]]) -> List[str]:
+    """Folded stacks (``a;b;c <self us>``) for flamegraph.pl / speedscope."""
+    lines: List[str] = []
+
+    def walk(node: Dict[str, Any], stack: List[str]):
+        stack = [*stack, node["module"]]
+        if node["self_us"]:
+            lines.append(f"{';'.join(stack)} {node['self_us']}")
+        for child in node["children"]:
+            walk(child, stack)
+
+    for root in roots:
+        walk(root, ["imports"])
+    return lines
+
+
+def collapse_phases(phases: List[Dict[str, Any]]) -> List[str]:
+    """Folded stacks of the boot phases, self time in microseconds."""
+    children_ms: Dict[str, float] = {}
+    for phase in phases:
+        parent = phase["phase"].rpartition(";")[0]
+        if parent:
+            children_ms[parent] = children_ms.get(parent, 0.0) + phase["duration_ms"]
+
+    lines = []
+    for phase in phases:
+        self_ms = phase["duration_ms"] - children_ms.get(phase["phase"], 0.0)
+        lines.append(f"boot;{phase['phase']} {max(0, int(self_ms * 1000))}")
+    return lines
+
+
+def top_imports(roots: List[Dict[str, Any]], limit: int = 20) -> List[Dict[str, Any]]:
+    """Top-level packages by cumulative import time."""
+    ordered = sorted(roots, key=lambda node: node["cumulative_us"], reverse=True)
+    return [
+        {"module": node["module"], "cumulative_ms": round(node["cumulative_us"] / 1000, 2)}
+        for node in ordered[:limit]
+    ]
+
+
+def profile_startup(output_dir: str = "profiles", timeout: float = 120.0) -> Dict[str, Any]:
+    """
+    Boots the application once under ``-X importtime`` and writes:
+
+    - ``startup-<timestamp>.json``: phases, API module imports and the import tree
+    - ``startup-<timestamp>.imports.folded``: import self times as collapsed stacks
+    - ``startup-<timestamp>.phases.folded``: boot phases as collapsed stacks
+
+    Args:
+        output_dir: Directory for the reports
+        timeout: Seconds to wait for the boot (including init_auth)
+
+    Returns:
+        The JSON report
+    """
+    out = Path(output_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        phases_file = os.path.join(tmp, "phases.json")
+        started = time.perf_counter()
+        child = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", BOOTSTRAP, phases_file, str(timeout)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        wall_ms = (time.perf_counter() - started) * 1000
+
+        if not os.path.exists(phases_file):
+            errors = [l for l in child.stderr.splitlines() if not l.startswith("import time:")]
+            print("[ERROR] The application did not finish booting:")
+            print("\n".join(errors[-20:]))
+            sys.exit(1)
+
+        with open(phases_file) as f:
+            boot = json.load(f)
+
+    imports = parse_importtime(child.stderr)
+    report = {
+        "created_at": stamp,
+        "python": sys.version.split()[0],
+        "wall_ms": round(wall_ms, 2),
+        "import_ms": round(sum(node["cumulative_us"] for node in imports) / 1000, 2),
+        "phases": boot["phases"],
+        "modules": boot["modules"],
+        "top_imports": top_imports(imports),
+        "imports": imports,
+    }
+
+    report_file = out / f"startup-{stamp}.json"
+    report_file.write_text(json.dumps(report, indent=2))
+    (out / f"startup-{stamp}.imports.folded").write_text("\n".join(collapse_imports(imports)) + "\n")
+    (out / f"startup-{stamp}.phases.folded").write_text("\n".join(collapse_phases(boot["phases"])) + "\n")
+
+    print(f"[OK] Boot took {report['wall_ms']:.0f}ms ({report['import_ms']:.0f}ms importing)")
+    for phase in report["phases"]:
+        depth = phase["phase"].count(";")
+        name = phase["phase"].rpartition(";")[2]
+        print(f"  {'  ' * depth}{name:<{28 - 2 * depth}} {phase['duration_ms']:>10.1f}ms")
+    print("\n  Slowest imports:")
+    for row in report["top_imports"][:10]:
+        print(f"  {row['module']:<28} {row['cumulative_ms']:>10.1f}ms")
+    print(f"\n[SUCCESS] Report written to {report_file}")
+    return report
@@ -0,0 +1,130 @@
+"""
+CLI production launcher: gunicorn master with uvicorn workers.
+"""
+import multiprocessing
+import os
+import shutil
+import sys
+from typing import Any, Dict, Optional
+
+from core.config.globals import settings
+
+
+def default_workers() -> int:
+    """One worker per core unless WEB_WORKERS says otherwise."""
+    return settings.WEB_WORKERS or multiprocessing.cpu_count()
+
+
+def prepare_metrics_dir() -> Optional[str]:
+    """
+    Points prometheus_client at a shared directory so every worker writes
+    its samples there and /metrics aggregates them. Must run before
+    prometheus_client is imported, hence before the app is loaded.
+
+    Returns:
+        The multiprocess directory, or None when disabled
+    """
+    path = os.environ.get("PROMETHEUS_MULTIPROC_DIR") or settings.PROMETHEUS_MULTIPROC_DIR
+    if not path:
+        return None
+    # Samples of a previous run would be summed into this one
+    shutil.rmtree(path, ignore_errors=True)
+    os.makedirs(path, exist_ok=True)
+    os.environ["PROMETHEUS_MULTIPROC_DIR"] = path
+    return path
+
+
+def post_fork(server, worker):
+    """Connections opened by the preloading master must not be shared."""
+    from core.database import engineSync
+    from core.database.drivers.postgres.async_connection import engineAsync
+
+    engineSync.dispose(close=False)
+    engineAsync.sync_engine.dispose(close=False)
+
+
+def child_exit(server, worker):
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(worker.pid)
+
+
+def build_options(
+    host: str, port: int, workers: int, preload: bool
+) -> Dict[str, Any]:
+    return {
+        "bind": f"{host}:{port}",
+        "workers": workers,
+        # UvicornWorker picks uvloop and httptools when they are installed
+        "worker_class": "uvicorn.workers.UvicornWorker",
+        "preload_app": preload,
+        "max_requests": settings.WEB_MAX_REQUESTS,
+        "max_requests_jitter": settings.WEB_MAX_REQUESTS_JITTER,
+        "graceful_timeout": settings.WEB_GRACEFUL_TIMEOUT,
+        "timeout": settings.WEB_TIMEOUT,
+        "keepalive": settings.WEB_KEEPALIVE,
+        # Heartbeat files in memory, a slow disk must not get workers killed
+        "worker_tmp_dir": "/dev/shm" if os.path.isdir("/dev/shm") else None,
+        "forwarded_allow_ips": "*" if settings.RATE_LIMIT_TRUST_PROXY else "127.0.0.1",
+        "accesslog": "-",
+        "errorlog": "-",
+        "post_fork": post_fork,
+        "child_exit": child_exit,
+    }
+
+
+def serve(
+    host: Optional[str] = None,
+    port: Optional[int] = None,
+    workers: Optional[int] = None,
+    preload: Optional[bool] = None,
+):
+    """
+    Starts the application with a gunicorn master and N uvicorn workers.
+
+    - preload: import main once in the master, workers share it copy-on-write
+    - max requests (+ jitter): workers are recycled so leaks stay bounded and
+      they do not all restart at once
+    - rolling restarts: ``kill -HUP <master>`` replaces workers one by one
+      after they finish in-flight requests (graceful timeout); with preload,
+      new code needs ``kill -USR2`` (new master) then ``kill -TERM`` on the old
+
+    Args:
+        host: Interface to bind (WEB_HOST)
+        port: Port to bind (WEB_PORT)
+        workers: Worker processes (WEB_WORKERS, 0 = CPU count)
+        preload: Load the app in the master (WEB_PRELOAD)
+    """
+    try:
+        from gunicorn.app.base import BaseApplication
+    except ImportError:
+        print("[ERROR] gunicorn is not installed: pip install gunicorn")
+        sys.exit(1)
+
+    options = build_options(
+        host or settings.WEB_HOST,
+        port or settings.WEB_PORT,
+        workers or default_workers(),
+        settings.WEB_PRELOAD if preload is None else preload,
+    )
+    metrics_dir = prepare_metrics_dir()
+    # Workers inherit it and size their task process pools from it
+    settings.WEB_WORKERS = options["workers"]
+
+    class Application(BaseApplication):
+        def load_config(self):
+            for key, value in options.items():
+                if value is not None:
+                    self.cfg.set(key, value)
+
+        def load(self):
+            from main import app
+
+            return app
+
+    print(
+        f"[+] Serving on {options['bind']} with {options['workers']} workers "
+        f"(preload={options['preload_app']}, metrics={metrics_dir or 'single process'})"
+    )
+    Application().run()
@@ -5,6 +5,48 @@ class Settings(BaseSettings):
     # JWT Configuration
     JWT_KEY: str = "396d399d8f19cb5b4ad13b25187449b0c0e7447cf4b06545a7b9a75e8f7cf20c"
     JWT_ALG: str = "HS256"
+    # Embed the role permission bitmap in access tokens (grants apply on token renewal)
+    JWT_PERMISSIONS_CLAIM: bool = False
+    # Verified tokens kept in memory until they expire (0 disables the cache)
+    JWT_CACHE_SIZE: int = 10000
+    # Token revocation (expected revoked ids alive at once, resync safety net)
+    TOKEN_REVOCATION_CAPACITY: int = 100000
+    TOKEN_REVOCATION_RESYNC_SECONDS: int = 30
+
+    # Password Hashing
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_ROUNDS: int = 12
+    PASSWORD_REHASH_ON_LOGIN: bool = True
+
+    # Task runner (blocking work off the event loop). Every web worker has its own
+    # process pool: 0 CPU workers = CPU count // WEB_WORKERS (at least 1), so the
+    # pools of all web workers add up to one process per core
+    TASKS_CPU_WORKERS: int = 0
+    TASKS_THREAD_WORKERS: int = 8
+    TASKS_MAX_PENDING: int = 1000
+    TASKS_RESULT_TTL_SECONDS: int = 300
+
+    # Rate Limiting
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_TRUST_PROXY: bool = False
+    LOGIN_RATE_LIMIT_IP_PER_MINUTE: int = 20
+    LOGIN_RATE_LIMIT_USERNAME_PER_MINUTE: int = 5
+    LOGIN_RATE_LIMIT_GLOBAL_PER_SECOND: int = 50
+    # Concurrency slots of crashed requests are reclaimed after this many seconds
+    QUOTA_LEASE_TTL_SECONDS: int = 60
+
+    # Web Server (python cli.py serve)
+    WEB_HOST: str = "0.0.0.0"
+    WEB_PORT: int = 8000
+    WEB_WORKERS: int = 0  # 0 = one per CPU
+    WEB_PRELOAD: bool = True
+    WEB_MAX_REQUESTS: int = 10000
+    WEB_MAX_REQUESTS_JITTER: int = 1000
+    WEB_GRACEFUL_TIMEOUT: int = 30
+    WEB_TIMEOUT: int = 60
+    WEB_KEEPALIVE: int = 5
+    # Shared samples directory so /metrics covers every worker
+    PROMETHEUS_MULTIPROC_DIR: str = "/tmp/fastapi-template-metrics"
 
     # Database Configuration
     DB_NAME: str = "postgres"
@@ -14,9 +56,18 @@ class Settings(BaseSettings):
     DB_PORT: int = 5432
     DB_DRIVER: str = "postgres"
 
+    # Database Profiling
+    DB_PROFILING: bool = False
+    DB_SLOW_QUERY_MS: int = 200
+    DB_N_PLUS_ONE_THRESHOLD: int = 10
+
     # Application Mode
     MODE: str = "PROD"
 
+    # Startup (init_auth seeding runs once per deploy, guarded by an advisory lock)
+    INIT_AUTH_MARKER_TTL: int = 600
+    INIT_AUTH_RETRY_SECONDS: int = 5
+
     # Owner Configuration
     OWNER_USER: str = "admin"
     OWNER_PASS: str = "change_this_password"
@@ -31,6 +82,69 @@ class Settings(BaseSettings):
     REDIS_HOST: str = "localhost"
     REDIS_PORT: int = 6379
 
+    # Socket.IO client manager ("redis" spans workers and nodes, "memory" is per process)
+    SOCKETIO_MANAGER: str = "redis"
+    SOCKETIO_REDIS_URL: str = ""  # Defaults to REDIS_HOST/REDIS_PORT
+    SOCKETIO_CHANNEL: str = "socketio"
+    # Per-packet library logs stay off unless lowered to INFO; events are sampled as JSON lines
+    SOCKETIO_LOG_LEVEL: str = "WARNING"
+    ENGINEIO_LOG_LEVEL: str = "WARNING"
+    SOCKETIO_LOG_SAMPLE_RATE: float = 0.01
+
+    # Socket admission control (per worker; 0 disables a limit)
+    SOCKET_MAX_CONNECTIONS: int = 10000
+    SOCKET_MAX_CONNECTIONS_PER_IP: int = 50
+    SOCKET_MAX_NAMESPACE_CONNECTIONS: int = 0
+    SOCKET_MAX_QUEUED_PACKETS: int = 500
+    SOCKET_MAX_QUEUED_BYTES: int = 1048576
+    SOCKET_OVERFLOW_POLICY: str = "disconnect"  # "disconnect" or "drop"
+    SOCKET_IDLE_TIMEOUT_SECONDS: int = 0
+    SOCKET_PING_INTERVAL: int = 25
+    SOCKET_PING_TIMEOUT: int = 20
+    SOCKET_SWEEP_SECONDS: int = 5
+
+    # Live streaming (frames per client per tick, next frame after the client acks)
+    STREAMING_TICK_MS: int = 100
+    STREAMING_REQUIRE_ACK: bool = True
+    STREAMING_ACK_TIMEOUT_SECONDS: float = 5.0
+    STREAMING_MAX_PENDING_KEYS: int = 1000
+
+    # Scheduled jobs ("sqlalchemy" and "redis" stores survive restarts; one leader schedules)
+    JOBS_STORE: str = "sqlalchemy"
+    JOBS_COALESCE: bool = True
+    JOBS_MISFIRE_GRACE_SECONDS: int = 60
+    JOBS_LEADER_TTL_SECONDS: int = 15
+    # Per-firing locks expire instead of being released; keep above the misfire grace
+    JOBS_LOCK_TTL_SECONDS: int = 300
+
+    # File uploads (streamed to disk in chunks; 0 disables a limit)
+    FILES_UPLOAD_DIR: str = "uploads"
+    FILES_CHUNK_SIZE: int = 1048576
+    FILES_MAX_UPLOAD_BYTES: int = 104857600
+    FILES_MAX_REQUEST_BYTES: int = 536870912
+
+    # File storage ("local" content-addressed directory or an "s3"-compatible bucket)
+    STORAGE_BACKEND: str = "local"
+    STORAGE_LOCAL_ROOT: str = "storage"
+    STORAGE_S3_BUCKET: str = ""
+    STORAGE_S3_PREFIX: str = "objects"
+    STORAGE_S3_ENDPOINT_URL: str = ""  # e.g. http://localhost:9000 for MinIO
+    STORAGE_S3_REGION: str = "us-east-1"
+    STORAGE_S3_ACCESS_KEY: str = ""
+    STORAGE_S3_SECRET_KEY: str = ""
+    # Downloads redirect to presigned URLs for this long (0 streams through the app)
+    STORAGE_S3_PRESIGN_SECONDS: int = 300
+
+    # Static assets (python cli.py static:build writes fingerprinted, precompressed copies)
+    STATIC_BUILD_DIR: str = "build/assets"
+    STATIC_ASSETS_PREFIX: str = "/assets"
+
+    # Permissions Cache
+    ROLE_PERMISSIONS_CACHE_TTL: int = 300
+
+    # User identity cache (auth projection of the users table)
+    USER_IDENTITY_CACHE_TTL: int = 300
+
     # AI Configuration (Optional)
     OPENAI_API_KEY: str = "sk-..."
     ANTHROPIC_API_KEY: str = "sk-ant-..."
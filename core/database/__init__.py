@@ -18,3 +18,10 @@ if driver == "postgres":
     from .drivers.postgres.async_connection import engineAsync, get_async_db
 
     from .drivers.postgres.sync_connection import engineSync, get_sync_db
+
+    from .drivers.postgres.loader import ModelLoader
+
+    from .profiling import profiler
+
+    if profiler.enabled:
+        profiler.install(engineSync, engineAsync.sync_engine)
@@ -1,4 +1,4 @@
-import asyncio
+import hashlib
 import uuid
 from datetime import datetime
 from functools import wraps
@@ -6,6 +6,7 @@ import json
 from typing import Any, List, Literal, Self, Sequence, Set, Union
 
 from sqlalchemy import (
+    ARRAY,
     TIMESTAMP,
     UUID,
     Boolean,
@@ -14,8 +15,11 @@ from sqlalchemy import (
     Integer,
     String,
     Table,
+    any_,
     desc,
     func,
+    literal,
+    or_,
     select,
     text,
     update,
@@ -48,6 +52,8 @@ from .async_connection import get_async_db
 
 from .sync_connection import get_sync_db
 
+from .loader import ModelLoader
+
 
 
 def generate_uuid():
@@ -70,6 +76,57 @@ def generate_dll_view(tablename: str, is_deleted: str) -> str:
             """
 
 
+# Models waiting for their _deleted/_exists views (see create_pending_views)
+_pending_views: list = []
+
+# Transaction level advisory lock: workers boot together and concurrent
+# CREATE OR REPLACE VIEW statements fail with "tuple concurrently updated"
+VIEWS_LOCK_KEY = int(hashlib.sha1(b"global_views").hexdigest()[:15], 16)
+
+
+def _create_views_ddl(models: list):
+
+    sync_conn = SessionSync()
+
+    try:
+        sync_conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": VIEWS_LOCK_KEY})
+
+        for cls in models:
+            try:
+                # A savepoint per model: one failing view does not undo the others
+                with sync_conn.begin_nested():
+
+                    sync_conn.execute(text(generate_dll_view(cls.__tablename__, "true")))
+
+                    sync_conn.execute(text(generate_dll_view(cls.__tablename__, "false")))
+            except Exception as e:
+                print(f"[!] Warning: Could not create views for {cls.__tablename__}: {e}")
+
+        sync_conn.commit()
+    except Exception as e:
+        sync_conn.rollback()
+        print(f"[!] Warning: Could not create views: {e}")
+    finally:
+        sync_conn.close()
+
+
+def _create_view_tables(cls):
+
+    # Only SQLAlchemy metadata: assigned even when this worker's DDL failed,
+    # since the views may exist already (another worker, a previous boot)
+    cls.deleted = create_view(
+        name=f"{cls.__tablename__}_deleted",
+        selectable=select(cls).where(cls.is_deleted == True),
+        metadata=BaseAsync.metadata,
+    )
+
+    cls.exists = create_view(
+        name=f"{cls.__tablename__}_exists",
+        selectable=select(cls).where(cls.is_deleted == False),
+        metadata=BaseAsync.metadata,
+    )
+
+
 class VanillaBaseAsync(DeclarativeBase):
     pass
 
@@ -150,33 +207,22 @@ class BaseAsync(DeclarativeBase):
     @classmethod
     def create_global_views(cls):
 
-        async def create(cls: type[Self]):
-            try:
-                sync_conn = SessionSync()
-
-                sync_conn.execute(text(generate_dll_view(cls.__tablename__, "true")))
+        # Models are imported before any event loop runs (gunicorn workers),
+        # so the views are created from the lifespan by create_pending_views
+        _pending_views.append(cls)
 
-                sync_conn.execute(text(generate_dll_view(cls.__tablename__, "false")))
+    @classmethod
+    async def create_pending_views(cls):
 
-                sync_conn.commit()
+        models = list(_pending_views)
 
-                cls.deleted = create_view(
-                    name=f"{cls.__tablename__}_deleted",
-                    selectable=select(cls).where(cls.is_deleted == True),
-                    metadata=BaseAsync.metadata,
-                )
+        _pending_views.clear()
 
-                cls.exists = create_view(
-                    name=f"{cls.__tablename__}_exists",
-                    selectable=select(cls).where(cls.is_deleted == False),
-                    metadata=BaseAsync.metadata,
-                )
+        _create_views_ddl(models)
 
-                sync_conn.close()
-            except Exception as e:
-                print(f"[!] Warning: Could not create views for {cls.__tablename__}: {e}")
+        for model in models:
 
-        asyncio.ensure_future(create(cls))
+            _create_view_tables(model)
 
     def __init_subclass__(cls) -> None:
 
@@ -277,6 +323,65 @@ class BaseAsync(DeclarativeBase):
         except SQLAlchemyError as e:
             raise DatabaseQueryError(str(e))
 
+    @classmethod
+    async def find_many(
+        cls, db: AsyncSession, ids: Sequence[Union[int, str]]
+    ) -> tuple[List[Self], List[Union[int, str]]]:
+        """
+        Fetches several registers by id or uid in a single query.
+
+        Returns:
+            tuple: (registers, missing)
+                - registers: Found registers in the same order as ``ids``
+                - missing: Requested ids that do not exist or are deleted
+        """
+        if not ids:
+            return [], []
+
+        int_ids: List[int] = []
+        uids: List[str] = []
+        for id in ids:
+            try:
+                int_ids.append(int(str(id)))
+            except ValueError:
+                uids.append(str(id))
+
+        conditions = []
+        if int_ids:
+            conditions.append(cls.id == any_(literal(int_ids, ARRAY(Integer))))
+        if uids:
+            conditions.append(cls.uid == any_(literal(uids, ARRAY(String))))
+
+        try:
+            query = select(cls).where(or_(*conditions), cls.is_deleted == False)
+            rows = (await db.execute(query)).scalars().all()
+        except SQLAlchemyError as e:
+            raise DatabaseQueryError(str(e))
+
+        by_id = {row.id: row for row in rows}
+        by_uid = {row.uid: row for row in rows}
+
+        found: List[Self] = []
+        missing: List[Union[int, str]] = []
+        for id in ids:
+            try:
+                row = by_id.get(int(str(id)))
+            except ValueError:
+                row = by_uid.get(str(id))
+            if row is None:
+                missing.append(id)
+            else:
+                found.append(row)
+        return found, missing
+
+    @classmethod
+    async def load(cls, db: AsyncSession, id: Union[int, str]) -> Self:
+        """
+        Like ``find_one`` but goes through the session identity map, so
+        concurrent loads in the same tick are batched into one query.
+        """
+        return await ModelLoader.for_session(db).load(cls, id)
+
     @classmethod
     async def find_all(
         cls,
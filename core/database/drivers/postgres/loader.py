@@ -0,0 +1,94 @@
+import asyncio
+from typing import Any, Dict, List, Tuple, Union
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.database.exceptions import DatabaseQueryError
+
+
+Key = Union[int, str]
+
+
+def _normalize_key(id: Key) -> Key:
+    try:
+        return int(str(id))
+    except ValueError:
+        return str(id)
+
+
+class ModelLoader:
+    """
+    Per-session identity map and dataloader.
+
+    ``load`` calls issued in the same event-loop tick are collected and
+    resolved with one ``find_many`` query per model. Results are kept for
+    the lifetime of the session, which for ``get_async_db`` is one request.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self._identity: Dict[Tuple[type, Key], Any] = {}
+        self._pending: Dict[type, Dict[Key, List[asyncio.Future]]] = {}
+        self._scheduled = False
+
+    @classmethod
+    def for_session(cls, db: AsyncSession) -> "ModelLoader":
+        loader = db.info.get("model_loader")
+        if loader is None:
+            loader = db.info["model_loader"] = cls(db)
+        return loader
+
+    async def load(self, model: type, id: Key) -> Any:
+        key = _normalize_key(id)
+
+        if (model, key) in self._identity:
+            return self._identity[(model, key)]
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.setdefault(model, {}).setdefault(key, []).append(future)
+
+        if not self._scheduled:
+            self._scheduled = True
+            # Runs after every task already queued for this tick had its chance to enqueue
+            loop.call_soon(lambda: asyncio.ensure_future(self._dispatch()))
+
+        return await future
+
+    def forget(self, model: type, id: Key) -> None:
+        self._identity.pop((model, _normalize_key(id)), None)
+
+    def clear(self) -> None:
+        self._identity.clear()
+
+    async def _dispatch(self):
+        # Models are fetched one after another: an AsyncSession can not run concurrent queries
+        while self._pending:
+            model, batch = self._pending.popitem()
+            keys = list(batch.keys())
+            try:
+                found, _ = await model.find_many(self.db, keys)
+            except Exception as e:
+                for futures in batch.values():
+                    for future in futures:
+                        if not future.done():
+                            future.set_exception(e)
+                continue
+
+            for row in found:
+                self._identity[(model, row.id)] = row
+                self._identity[(model, row.uid)] = row
+
+            for key, futures in batch.items():
+                row = self._identity.get((model, key))
+                for future in futures:
+                    if future.done():
+                        continue
+                    if row is None:
+                        future.set_exception(
+                            DatabaseQueryError(f"Not exists the register in {model.__tablename__}")
+                        )
+                    else:
+                        future.set_result(row)
+
+        self._scheduled = False
@@ -0,0 +1,243 @@
+import hashlib
+import logging
+import re
+import time
+from collections import Counter as CounterDict
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from prometheus_client import Counter, Histogram
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from core.config.globals import settings
+
+logger = logging.getLogger("core.database.profiling")
+
+
+# Define Prometheus metrics
+STATEMENT_DURATION = Histogram(
+    "db_statement_duration_seconds",
+    "Duration of SQL statements by normalized fingerprint",
+    ["fingerprint"],
+)
+
+ROUTE_QUERY_COUNT = Histogram(
+    "db_route_queries_per_request",
+    "Number of SQL statements issued per request by route",
+    ["method", "route"],
+    buckets=(1, 2, 5, 10, 20, 50, 100, 200, 500),
+)
+
+ROUTE_DB_TIME = Histogram(
+    "db_route_time_seconds",
+    "Time spent in the database per request by route",
+    ["method", "route"],
+)
+
+SLOW_QUERIES = Counter(
+    "db_slow_queries_total",
+    "Total count of statements slower than DB_SLOW_QUERY_MS",
+    ["fingerprint"],
+)
+
+N_PLUS_ONE = Counter(
+    "db_n_plus_one_total",
+    "Requests that repeated the same statement more than DB_N_PLUS_ONE_THRESHOLD times",
+    ["method", "route", "fingerprint"],
+)
+
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_BIND_PARAMS = re.compile(r"\$\d+|%\([^)]+\)s|%s|(?<!:):\w+|\?")
+_IN_LISTS = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_statement(statement: str) -> str:
+    """
+    Reduce a SQL statement to a stable shape: literals and bind
+    parameters become ``?`` and ``IN`` lists collapse to ``(?...)``.
+    """
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _BIND_PARAMS.sub("?", normalized)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _IN_LISTS.sub("(?...)", normalized)
+    return _WHITESPACE.sub(" ", normalized).strip()
+
+
+def fingerprint_statement(statement: str) -> str:
+    return hashlib.sha1(normalize_statement(statement).encode()).hexdigest()[:12]
+
+
+def redact_parameters(parameters: Any) -> Any:
+    """Replace bind values by their type names so slow-query logs never carry data."""
+    if isinstance(parameters, dict):
+        return {k: f"<{type(v).__name__}>" for k, v in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [redact_parameters(p) if isinstance(p, (dict, list, tuple)) else f"<{type(p).__name__}>" for p in parameters]
+    return f"<{type(parameters).__name__}>"
+
+
+@dataclass
+class RequestDBStats:
+    method: str
+    path: str
+    route: Optional[str] = None
+    query_count: int = 0
+    db_time: float = 0.0
+    fingerprints: CounterDict = field(default_factory=CounterDict)
+
+
+@dataclass
+class StatementStats:
+    statement: str
+    calls: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+
+
+_current_request: ContextVar[Optional[RequestDBStats]] = ContextVar(
+    "db_profiling_request", default=None
+)
+
+
+class QueryProfiler:
+    """
+    Instruments engine cursor events to record per-statement latency,
+    attribute DB time to the active request and flag N+1 patterns.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(QueryProfiler, cls).__new__(cls)
+            cls._instance._initialize()
+        return cls._instance
+
+    def _initialize(self):
+        self.enabled = settings.DB_PROFILING
+        self.slow_query_seconds = settings.DB_SLOW_QUERY_MS / 1000
+        self.n_plus_one_threshold = settings.DB_N_PLUS_ONE_THRESHOLD
+        self.statements: Dict[str, StatementStats] = {}
+        self._engines: List[Engine] = []
+
+    # --- Engine instrumentation ---
+
+    def install(self, *engines: Engine) -> None:
+        for engine in engines:
+            if engine in self._engines:
+                continue
+            event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+            event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+            self._engines.append(engine)
+
+    # The start time lives on the execution context, not on the connection: a
+    # failed statement never reaches after_cursor_execute, and a stack shared
+    # by the pooled connection would hand its stale entry to later queries
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            context._profiling_started = time.perf_counter()
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        started = getattr(context, "_profiling_started", None)
+        if started is None:
+            return
+        del context._profiling_started
+        self.record(statement, parameters, time.perf_counter() - started)
+
+    def record(self, statement: str, parameters: Any, duration: float) -> None:
+        fingerprint = fingerprint_statement(statement)
+
+        stats = self.statements.get(fingerprint)
+        if stats is None:
+            stats = self.statements[fingerprint] = StatementStats(
+                statement=normalize_statement(statement)
+            )
+        stats.calls += 1
+        stats.total_time += duration
+        stats.max_time = max(stats.max_time, duration)
+
+        STATEMENT_DURATION.labels(fingerprint=fingerprint).observe(duration)
+
+        request_stats = _current_request.get()
+        if request_stats is not None:
+            request_stats.query_count += 1
+            request_stats.db_time += duration
+            request_stats.fingerprints[fingerprint] += 1
+
+        if duration >= self.slow_query_seconds:
+            SLOW_QUERIES.labels(fingerprint=fingerprint).inc()
+            logger.warning(
+                "Slow query %.1fms [%s] route=%s statement=%s params=%s",
+                duration * 1000,
+                fingerprint,
+                request_stats.path if request_stats else None,
+                stats.statement,
+                redact_parameters(parameters),
+            )
+
+    # --- Request scope ---
+
+    def begin_request(self, method: str, path: str) -> RequestDBStats:
+        request_stats = RequestDBStats(method=method, path=path)
+        _current_request.set(request_stats)
+        return request_stats
+
+    def end_request(self, request_stats: RequestDBStats) -> List[str]:
+        """
+        Publish per-route metrics for a finished request and return the
+        fingerprints that crossed the N+1 threshold.
+        """
+        # Raw paths of unmatched requests (404 scans) would explode label cardinality
+        route = request_stats.route or "unmatched"
+        method = request_stats.method
+
+        ROUTE_QUERY_COUNT.labels(method=method, route=route).observe(request_stats.query_count)
+        ROUTE_DB_TIME.labels(method=method, route=route).observe(request_stats.db_time)
+
+        suspects = self.detect_n_plus_one(request_stats)
+        for fingerprint in suspects:
+            N_PLUS_ONE.labels(method=method, route=route, fingerprint=fingerprint).inc()
+            stats = self.statements.get(fingerprint)
+            logger.warning(
+                "Possible N+1 on %s %s: [%s] executed %d times: %s",
+                method,
+                route,
+                fingerprint,
+                request_stats.fingerprints[fingerprint],
+                stats.statement if stats else "",
+            )
+        return suspects
+
+    def detect_n_plus_one(self, request_stats: RequestDBStats) -> List[str]:
+        return [
+            fingerprint
+            for fingerprint, count in request_stats.fingerprints.items()
+            if count > self.n_plus_one_threshold
+        ]
+
+    def snapshot(self, limit: int = 50) -> List[Dict[str, Any]]:
+        """Statements ordered by accumulated time, for ad-hoc inspection."""
+        ordered = sorted(
+            self.statements.items(), key=lambda item: item[1].total_time, reverse=True
+        )
+        return [
+            {
+                "fingerprint": fingerprint,
+                "statement": stats.statement,
+                "calls": stats.calls,
+                "total_ms": round(stats.total_time * 1000, 3),
+                "mean_ms": round(stats.total_time * 1000 / stats.calls, 3),
+                "max_ms": round(stats.max_time * 1000, 3),
+            }
+            for fingerprint, stats in ordered[:limit]
+        ]
+
+
+# Singleton Instance
+profiler = QueryProfiler()
@@ -1,16 +1,112 @@
-from fastapi import FastAPI
+from apscheduler.events import EVENT_JOB_MISSED, EVENT_JOB_SUBMITTED
+from apscheduler.jobstores.memory import MemoryJobStore
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from fastapi import FastAPI
 
-scheduler = AsyncIOScheduler()
+from core.config.globals import settings
+from .coordination import coordination
+from .registry import JOB_MISFIRES, JobSpec, jobs, note_submitted, run_job, scheduled
 
 
-def set_jobs(app: FastAPI) -> FastAPI:
-    @app.on_event("startup")
-    async def startup_event():
-        scheduler.start()
+def create_jobstore():
+    """
+    Job store selected by JOBS_STORE: "sqlalchemy" keeps schedules in the
+    application database, "redis" in Redis and "memory" loses them on restart.
+    """
+    store = settings.JOBS_STORE
+    try:
+        if store == "sqlalchemy":
+            from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
+            from core.database import engineSync
+
+            return SQLAlchemyJobStore(engine=engineSync)
+        if store == "redis":
+            from apscheduler.jobstores.redis import RedisJobStore
+
+            return RedisJobStore(host=settings.REDIS_HOST, port=settings.REDIS_PORT)
+    except Exception as e:
+        print(f"Jobs Warning: Could not create the {store} job store ({e}). Falling back to In-Memory.")
+    return MemoryJobStore()
+
+
+scheduler = AsyncIOScheduler(
+    jobstores={"default": create_jobstore()},
+    job_defaults={
+        "coalesce": settings.JOBS_COALESCE,
+        "misfire_grace_time": settings.JOBS_MISFIRE_GRACE_SECONDS,
+        # The per-run lock covers other processes, this one covers overlaps here
+        "max_instances": 1,
+    },
+)
+
+
+def _on_missed(event):
+    JOB_MISFIRES.labels(job=event.job_id).inc()
+
+
+scheduler.add_listener(_on_missed, EVENT_JOB_MISSED)
+scheduler.add_listener(note_submitted, EVENT_JOB_SUBMITTED)
+
 
-    @app.on_event("shutdown")
-    async def shutdown_event():
-        scheduler.shutdown()
+def _schedule(spec: JobSpec) -> None:
+    options = {}
+    if spec.coalesce is not None:
+        options["coalesce"] = spec.coalesce
+    if spec.misfire_grace_time is not None:
+        options["misfire_grace_time"] = spec.misfire_grace_time
 
+    # Keep the stored schedule: re-adding on every leader change would push
+    # interval jobs back, or skip them when leadership moves often enough
+    existing = scheduler.get_job(spec.id)
+    if existing is not None:
+        options["next_run_time"] = existing.next_run_time
+
+    # Stored by reference, so the job survives restarts of any worker
+    scheduler.add_job(
+        "core.jobs.registry:run_job",
+        spec.trigger,
+        args=[spec.id],
+        id=spec.id,
+        name=spec.id,
+        replace_existing=True,
+        **spec.trigger_args,
+        **options,
+    )
+
+
+async def _on_leadership(leading: bool) -> None:
+    if leading:
+        if not scheduler.running:
+            # Started paused so the job store is open while the jobs are
+            # (re)added, and nothing fires before the registry is applied
+            scheduler.start(paused=True)
+            for spec in jobs.values():
+                _schedule(spec)
+            # Jobs deleted from the code would otherwise fire forever
+            for job in scheduler.get_jobs():
+                if job.func is run_job and job.args and job.args[0] not in jobs:
+                    job.remove()
+            scheduler.resume()
+        else:
+            scheduler.resume()
+    elif scheduler.running:
+        scheduler.pause()
+
+
+async def start() -> None:
+    """Joins the leader election; only the leader runs the scheduler."""
+    await coordination.start(_on_leadership)
+
+
+async def stop() -> None:
+    await coordination.stop()
+    if scheduler.running:
+        scheduler.shutdown(wait=False)
+
+
+def set_jobs(app: FastAPI) -> FastAPI:
+    # Kept for compatibility: start() and stop() run in the application lifespan
     return app
+
+
+__all__ = ["scheduler", "scheduled", "run_job", "jobs", "start", "stop", "set_jobs"]
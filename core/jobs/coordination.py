@@ -0,0 +1,142 @@
+import asyncio
+import os
+import socket
+import uuid
+from typing import Awaitable, Callable, Optional
+
+import redis.asyncio as redis
+import redis as redis_sync
+from prometheus_client import Gauge
+
+from core.config.globals import settings
+
+
+# Define Prometheus metrics
+JOBS_LEADER = Gauge(
+    "jobs_leader",
+    "1 while this process holds the scheduler leadership",
+)
+
+
+# Deletes or extends the leader key only while it still holds our token
+RELEASE_LUA = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+RENEW_LUA = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('PEXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+LEADER_KEY = "jobs:leader"
+LOCK_PREFIX = "jobs:running:"
+
+
+class Coordination:
+    """
+    Redis-backed leader lease and per-run locks shared by every worker and
+    node. Without Redis each process is on its own: it leads and every lock
+    is granted, which is only safe with a single worker.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(Coordination, cls).__new__(cls)
+            cls._instance._initialize()
+        return cls._instance
+
+    def _initialize(self):
+        self.token = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.is_leader = False
+        self._client: Optional[redis.Redis] = None
+        self._connected: Optional[bool] = None
+        self._elector: Optional[asyncio.Task] = None
+
+    def _connect(self) -> bool:
+        if self._connected is None:
+            try:
+                redis_sync.Redis(host=settings.REDIS_HOST, port=settings.REDIS_PORT).ping()
+                self._client = redis.Redis(host=settings.REDIS_HOST, port=settings.REDIS_PORT)
+                self._release = self._client.register_script(RELEASE_LUA)
+                self._renew = self._client.register_script(RENEW_LUA)
+                self._connected = True
+            except Exception as e:
+                print(
+                    f"Jobs Warning: Could not connect to Redis ({e}). "
+                    "Every process runs the scheduler; use a single worker."
+                )
+                self._connected = False
+        return self._connected
+
+    # --- Per-run locks ---
+
+    async def acquire(self, slot: str, ttl: int) -> Optional[str]:
+        """
+        Lease token when this process may run the firing ``slot`` now, None
+        otherwise. Locks are never released, they expire after ``ttl``.
+        """
+        if not self._connect():
+            return self.token
+        lease = uuid.uuid4().hex
+        if await self._client.set(LOCK_PREFIX + slot, lease, nx=True, ex=ttl):
+            return lease
+        return None
+
+    # --- Leader election ---
+
+    async def start(self, on_change: Callable[[bool], Awaitable[None]]) -> None:
+        if not self._connect():
+            self._set_leader(True)
+            await on_change(True)
+            return
+        self._elector = asyncio.create_task(self._elect(on_change))
+
+    async def _elect(self, on_change: Callable[[bool], Awaitable[None]]):
+        ttl_ms = settings.JOBS_LEADER_TTL_SECONDS * 1000
+        while True:
+            try:
+                if self.is_leader:
+                    leading = bool(await self._renew(keys=[LEADER_KEY], args=[self.token, ttl_ms]))
+                else:
+                    leading = bool(await self._client.set(LEADER_KEY, self.token, nx=True, px=ttl_ms))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Unreachable Redis: step down before the lease could pass to someone else
+                print(f"[Jobs] Leader election error: {e}")
+                leading = False
+
+            if leading != self.is_leader:
+                self._set_leader(leading)
+                print(f"[Jobs] {'Acquired' if leading else 'Lost'} scheduler leadership ({self.token})")
+                await on_change(leading)
+
+            await asyncio.sleep(settings.JOBS_LEADER_TTL_SECONDS / 3)
+
+    def _set_leader(self, leading: bool) -> None:
+        self.is_leader = leading
+        JOBS_LEADER.set(1 if leading else 0)
+
+    async def stop(self) -> None:
+        if self._elector is not None:
+            self._elector.cancel()
+            try:
+                await self._elector
+            except asyncio.CancelledError:
+                pass
+            self._elector = None
+        if self.is_leader and self._client is not None:
+            # Hand over right away instead of waiting for the lease to expire
+            await self._release(keys=[LEADER_KEY], args=[self.token])
+        self._set_leader(False)
+
+
+# Singleton Instance
+coordination = Coordination()
@@ -0,0 +1,123 @@
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from prometheus_client import Counter, Histogram
+
+from core.config.globals import settings
+from .coordination import coordination
+
+
+# Define Prometheus metrics
+JOB_DURATION = Histogram(
+    "job_duration_seconds",
+    "Run time of scheduled jobs",
+    ["job"],
+    buckets=(0.01, 0.05, 0.1, 0.5, 1, 5, 15, 60, 300, 900),
+)
+
+JOB_RUNS = Counter(
+    "job_runs_total",
+    "Scheduled job firings by result",
+    ["job", "result"],
+)
+
+JOB_MISFIRES = Counter(
+    "job_misfires_total",
+    "Job firings skipped because they were later than the misfire grace time",
+    ["job"],
+)
+
+
+@dataclass
+class JobSpec:
+    id: str
+    func: Callable[[], Awaitable[Any]]
+    trigger: str
+    trigger_args: Dict[str, Any] = field(default_factory=dict)
+    # None falls back to the scheduler's job defaults
+    coalesce: Optional[bool] = None
+    misfire_grace_time: Optional[int] = None
+    lock_ttl: Optional[int] = None
+
+
+jobs: Dict[str, JobSpec] = {}
+
+# Scheduled run time of each submitted job, read back by run_job
+_run_times: Dict[str, datetime] = {}
+
+
+def note_submitted(event) -> None:
+    """EVENT_JOB_SUBMITTED listener; fires before the job's coroutine starts."""
+    if event.scheduled_run_times:
+        _run_times[event.job_id] = event.scheduled_run_times[-1]
+
+
+def scheduled(
+    trigger: str,
+    id: Optional[str] = None,
+    coalesce: Optional[bool] = None,
+    misfire_grace_time: Optional[int] = None,
+    lock_ttl: Optional[int] = None,
+    **trigger_args,
+):
+    """
+    Registers an async function as a cluster-wide job, e.g. in a module's
+    ``jobs.py``::
+
+        @scheduled("interval", minutes=5)
+        async def warm_cache():
+            ...
+
+    Each firing runs once across every worker and node.
+    """
+
+    def decorator(func: Callable[[], Awaitable[Any]]):
+        job_id = id or f"{func.__module__}.{func.__name__}"
+        if job_id in jobs and jobs[job_id].func is not func:
+            raise ValueError(f"Job '{job_id}' already registered")
+        jobs[job_id] = JobSpec(
+            id=job_id,
+            func=func,
+            trigger=trigger,
+            trigger_args=trigger_args,
+            coalesce=coalesce,
+            misfire_grace_time=misfire_grace_time,
+            lock_ttl=lock_ttl,
+        )
+        return func
+
+    return decorator
+
+
+async def run_job(job_id: str) -> None:
+    """
+    Entry point stored in the job store for every registered job; the
+    function itself is looked up here so stores only hold plain references.
+    """
+    spec = jobs.get(job_id)
+    if spec is None:
+        print(f"[Jobs] '{job_id}' is no longer registered, skipping")
+        JOB_RUNS.labels(job=job_id, result="unknown").inc()
+        return
+
+    # Guards the window where two processes both think they lead. The lock is
+    # per firing and left to expire: a run that finishes quickly must not let
+    # another process run the same firing again
+    run_time = _run_times.pop(job_id, None)
+    slot = f"{job_id}:{run_time.isoformat()}" if run_time else job_id
+    lease = await coordination.acquire(slot, spec.lock_ttl or settings.JOBS_LOCK_TTL_SECONDS)
+    if lease is None:
+        JOB_RUNS.labels(job=job_id, result="locked").inc()
+        return
+
+    started = time.perf_counter()
+    try:
+        await spec.func()
+        JOB_RUNS.labels(job=job_id, result="success").inc()
+    except Exception as e:
+        print(f"[Jobs] '{job_id}' failed: {e}")
+        JOB_RUNS.labels(job=job_id, result="error").inc()
+    finally:
+        JOB_DURATION.labels(job=job_id).observe(time.perf_counter() - started)
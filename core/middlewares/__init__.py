@@ -3,7 +3,13 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from .jwt_verify import JWT_VERIFY
 from .role_verify import ROLE_VERIFY
+from .quota_verify import QUOTA_VERIFY
 from .prometheus import PrometheusMiddleware
+from .db_profiling import DBProfilingMiddleware
+from .lazy_modules import LazyModuleMiddleware
+from .body_limit import BodySizeLimitMiddleware
+from core.config.globals import settings
+from core.database.profiling import profiler
 
 
 def initialazer(app=FastAPI()):
@@ -18,7 +24,15 @@ def initialazer(app=FastAPI()):
         allow_headers=["*"],
     )
     
+    # Refuse oversized uploads before they are spooled (inside metrics, so 413s are counted)
+    if settings.FILES_MAX_REQUEST_BYTES:
+        app.add_middleware(BodySizeLimitMiddleware, max_bytes=settings.FILES_MAX_REQUEST_BYTES)
+
     # Add Prometheus metrics middleware
     app.add_middleware(PrometheusMiddleware)
-    
+
+    # Add SQL statement profiling (enabled with DB_PROFILING)
+    if profiler.enabled:
+        app.add_middleware(DBProfilingMiddleware)
+
     return app
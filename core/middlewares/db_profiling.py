@@ -0,0 +1,27 @@
+from typing import Callable
+
+from fastapi import Request, Response
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from core.database.profiling import profiler
+
+
+class DBProfilingMiddleware(BaseHTTPMiddleware):
+    """
+    Opens a per-request statement scope for the query profiler and
+    attributes query count and DB time to the matched route template.
+    """
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        request_stats = profiler.begin_request(request.method, request.url.path)
+
+        response = await call_next(request)
+
+        # The router stores the matched route in the (shared) scope
+        route = request.scope.get("route")
+        if route is not None:
+            request_stats.route = getattr(route, "path", None)
+
+        profiler.end_request(request_stats)
+
+        return response
@@ -1,49 +1,152 @@
-from typing import Dict, Tuple
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
 from core.config.globals import settings
+from core.database import SessionAsync
 from socketio import AsyncServer
 
-from app.modules.auth.services import decode_token
+from app.modules.auth.services import decode_token, TokenData
+from app.modules.permissions.bitset import PermissionSet, permission_index
+from app.modules.permissions.const import socket_type
+from app.modules.role_permissions.services import get_role_permission_set
+from app.modules.roles.services import get_role_level
 
 DEBUG = settings.MODE == "DEVELOPMENT"
 
+# Role context shared by the connections of a worker for a few seconds, so a
+# reconnect storm costs one lookup per role instead of one per socket
+ROLE_CONTEXT_TTL = 5.0
 
-async def JWT_VERIFY_SOCKET(jwt: str):
+
+@dataclass(frozen=True)
+class SocketIdentity:
+    """Verified identity kept in the socket session under ``identity``."""
+    id: Any
+    uid: str
+    username: str
+    role: Any
+    level: Optional[int]
+    permissions: PermissionSet
+
+    def can(self, name: str, action: str, type: str = socket_type) -> bool:
+        # Resolved against the snapshot the bitmap was built with, no I/O
+        permission_id = self.permissions.snapshot.by_route.get((name, action, type))
+        return permission_id is not None and self.permissions.has(permission_id)
+
+
+# Inbound event guard: (identity, event) -> allowed; must not do I/O
+EventGuard = Callable[[Optional[SocketIdentity], str], bool]
+
+event_guards: Dict[str, EventGuard] = {}
+
+_role_contexts: Dict[Any, Tuple[float, "asyncio.Future[Tuple[PermissionSet, Optional[int]]]"]] = {}
+
+
+async def _load_role_context(role) -> Tuple[PermissionSet, Optional[int]]:
+    db = SessionAsync()
+    try:
+        return await get_role_permission_set(db, role), await get_role_level(db, role)
+    finally:
+        await db.close()
+
+
+async def role_context(role) -> Tuple[PermissionSet, Optional[int]]:
+    """Single-flight, briefly memoized permissions and level of a role."""
+    now = time.monotonic()
+    entry = _role_contexts.get(role)
+    if entry is None or entry[0] < now:
+        future = asyncio.ensure_future(_load_role_context(role))
+        _role_contexts[role] = (now + ROLE_CONTEXT_TTL, future)
+        entry = _role_contexts[role]
+    try:
+        return await asyncio.shield(entry[1])
+    except Exception:
+        _role_contexts.pop(role, None)
+        raise
+
+
+async def resolve_identity(payload: TokenData) -> SocketIdentity:
+    permissions, level = await role_context(payload.role)
+
+    # A permissions claim from the current index wins over the role lookup
+    claimed = PermissionSet.loads(payload.perms, permissions.snapshot)
+    return SocketIdentity(
+        id=payload.id,
+        uid=payload.uid or "",
+        username=payload.sub,
+        role=payload.role,
+        level=level,
+        permissions=claimed if claimed is not None else permissions,
+    )
+
+
+async def JWT_VERIFY_SOCKET(jwt: str) -> Optional[SocketIdentity]:
     try:
-        if DEBUG:
-            print("JWT: ", jwt)
-            return True
         if not jwt:
             raise ValueError("JWT not found")
+        # Verified tokens are answered from the token cache until they expire
         payload = decode_token(jwt)
-        if not payload:
+        if not payload or not payload.role:
             raise ValueError("JWT invalid")
-        return True
+        return await resolve_identity(payload)
     except ValueError as e:
         print(e)
-        return False
+        return None
+    except Exception as e:
+        # A failed role lookup rejects the connection instead of crashing the handshake
+        print(f"[Socket] Could not verify JWT: {e}")
+        return None
 
 
-def wrap_init_connect(sio: AsyncServer):
+def wrap_init_connect(sio: AsyncServer, namespace: str = "/"):
     async def init_connect(sid: str, _, auth: Dict[str, str]):
-        jwt = auth.get("auth")
+        jwt = (auth or {}).get("auth")
 
         try:
+            identity = await JWT_VERIFY_SOCKET(jwt) if jwt else None
+
             if DEBUG:
                 print("JWT: ", jwt)
-                return True
-
-            if not jwt:
+            elif identity is None:
                 return False
 
-            is_auth = await JWT_VERIFY_SOCKET(jwt)
-
-            if is_auth:
-                sio.session(sid)
-                return True
+            # Handlers read it with (await sio.get_session(sid, namespace))["identity"]
+            await sio.save_session(sid, {"identity": identity}, namespace=namespace)
+            return True
 
-        except ValueError as e:
-            print(e)
+        except Exception as e:
+            print(f"[Socket] Connection rejected: {e}")
 
         return False
 
     return init_connect
+
+
+def authorize_namespace(namespace: str, guard: EventGuard) -> None:
+    """Checks every inbound event of the namespace with ``guard``."""
+    event_guards[namespace] = guard
+
+
+def require_permissions(rules: Dict[str, Tuple[str, str]], default: bool = True) -> EventGuard:
+    """
+    Guard mapping events to a (name, action) SOCKET permission; events
+    without a rule are allowed unless ``default`` is False.
+    """
+
+    def guard(identity: Optional[SocketIdentity], event: str) -> bool:
+        rule = rules.get(event)
+        if rule is None:
+            return default
+        return identity is not None and identity.can(*rule)
+
+    return guard
+
+
+async def authorize_event(sio: AsyncServer, event: str, namespace: str, sid: str) -> bool:
+    guard = event_guards.get(namespace)
+    if guard is None or DEBUG:
+        return True
+    # Sessions live in the Engine.IO session of this worker
+    session = await sio.get_session(sid, namespace=namespace)
+    return guard(session.get("identity"), event)
@@ -0,0 +1,22 @@
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from core.utils.module_registry import lazy_modules
+
+
+class LazyModuleMiddleware:
+    """
+    Imports deferred (``LAZY = True``) API modules on the first request under
+    their prefix, before routing, so that request is served by the module.
+    """
+
+    def __init__(self, app: ASGIApp, prefix: str = ""):
+        self.app = app
+        self.prefix = prefix
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if lazy_modules.pending and scope["type"] in ("http", "websocket"):
+            path: str = scope.get("path", "")
+            if path.startswith(self.prefix):
+                await lazy_modules.load_for(path[len(self.prefix):], scope["app"], self.prefix)
+
+        await self.app(scope, receive, send)
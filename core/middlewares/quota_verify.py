@@ -0,0 +1,96 @@
+import hashlib
+import math
+import uuid
+from typing import AsyncIterator, Callable, Optional
+
+from fastapi import HTTPException, Request, status
+
+from app.modules.auth.services import decode_token, TokenData
+from app.modules.roles.services import get_role_level
+from core.config.globals import settings
+from core.database import SessionAsync
+from core.ratelimit import Quota, QuotaPolicy, limiter, resolve_quota
+
+
+def _token_payload(request: Request) -> Optional[TokenData]:
+    authorization = request.headers.get("Authorization", "")
+    token = authorization[7:] if authorization.lower().startswith("bearer ") else None
+    token = token or request.cookies.get("access_token")
+    # decode_token answers repeats from the verified token cache
+    return decode_token(token) if token else None
+
+
+async def _apply_role_override(quota: Quota, payload: Optional[TokenData]) -> Optional[Quota]:
+    if not quota.overrides or payload is None or not payload.role:
+        return quota
+    db = SessionAsync()
+    try:
+        level = await get_role_level(db, payload.role)
+    finally:
+        await db.close()
+    return quota.for_level(level)
+
+
+def _too_many_requests(retry_after: float) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail="Too many requests",
+        headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+    )
+
+
+def QUOTA_VERIFY(scope: str, policy: QuotaPolicy) -> Callable[[Request], AsyncIterator[None]]:
+    """
+    Dependency enforcing the quotas a module declares in ``QUOTAS``.
+    Module-wide quotas ("*") share one budget across the module routes;
+    route quotas get their own.
+    """
+
+    async def QUOTA_VERIFY_CURRY(request: Request) -> AsyncIterator[None]:
+        route_name = getattr(request.scope.get("route"), "name", None)
+        quota = resolve_quota(policy, route_name)
+        if quota is None or not limiter.enabled:
+            yield
+            return
+
+        payload = _token_payload(request)
+        quota = await _apply_role_override(quota, payload)
+        if quota is None:
+            yield
+            return
+
+        if quota.key == "user":
+            identity = str(payload.id or payload.sub) if payload else limiter.client_ip(request)
+        elif quota.key == "ip":
+            identity = limiter.client_ip(request)
+        else:
+            identity = ""
+
+        target = route_name if route_name in policy else "*"
+        digest = hashlib.sha1(identity.encode()).hexdigest()[:16]
+        key = f"quota:{scope}:{target}:{quota.key}:{digest}"
+
+        if quota.rate:
+            result = await limiter.take(
+                scope, quota.key, f"{key}:rate", quota.rate, quota.burst or max(1, int(quota.rate))
+            )
+            if not result.allowed:
+                raise _too_many_requests(result.retry_after)
+
+        if not quota.concurrency:
+            yield
+            return
+
+        lease = uuid.uuid4().hex
+        acquired = await limiter.acquire(
+            scope, quota.key, f"{key}:inflight", quota.concurrency, lease,
+            settings.QUOTA_LEASE_TTL_SECONDS,
+        )
+        if not acquired:
+            raise _too_many_requests(1)
+        try:
+            yield
+        finally:
+            await limiter.release(f"{key}:inflight", lease)
+
+    return QUOTA_VERIFY_CURRY
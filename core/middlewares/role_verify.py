@@ -4,8 +4,8 @@ from core.database import SessionAsync
 from app.modules.auth.controller import oauth2_schema
 from app.modules.auth.schemas import RSUser
 from app.modules.auth.services import decode_token, create_token
-from app.modules.permissions.models import Permission
-from app.modules.role_permissions.models import RolePermission
+from app.modules.permissions.bitset import PermissionSet, permission_index
+from app.modules.role_permissions.services import role_has_permission
 from app.modules.permissions.const import api_type
 from typing import Callable
 from .jwt_verify import JWT_VERIFY
@@ -73,15 +73,9 @@ def ROLE_VERIFY(omit_routes: list = []) -> Callable:
             (name,) = (request.scope["route"].name,)
             method = request.method
 
-            permission_require = (
-                await db.execute(
-                    select(Permission).where(
-                        Permission.name == name,
-                        Permission.action == method,
-                        Permission.type == api_type,
-                    )
-                )
-            ).scalar_one_or_none()
+            permission_require = await permission_index.resolve(
+                db, name, method, api_type
+            )
 
             if not permission_require:
                 await db.close()
@@ -91,15 +85,14 @@ def ROLE_VERIFY(omit_routes: list = []) -> Callable:
                     headers={"WWW-Authenticate": "Bearer"},
                 )
 
-            # Check if user has permission via pivot table
-            has_permission = (
-                await db.execute(
-                    select(RolePermission).where(
-                        RolePermission.role_id == payload.role,
-                        RolePermission.permission_id == permission_require.id
-                    )
+            # A permissions claim built with the current index spares the role lookup
+            claimed = PermissionSet.loads(payload.perms, await permission_index.ensure_loaded(db))
+            if claimed is not None:
+                has_permission = claimed.has(permission_require)
+            else:
+                has_permission = await role_has_permission(
+                    db, payload.role, permission_require
                 )
-            ).scalar_one_or_none()
 
             await db.close()
 
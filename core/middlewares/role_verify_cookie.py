@@ -6,8 +6,8 @@ from fastapi import Request, HTTPException, status, Response
 from fastapi.responses import JSONResponse
 from sqlalchemy.future import select
 from app.modules.roles.models import Role
-from app.modules.permissions.models import Permission
-from app.modules.role_permissions.models import RolePermission
+from app.modules.permissions.bitset import PermissionSet, permission_index
+from app.modules.role_permissions.services import role_has_permission
 from app.modules.users.models import User
 from app.modules.users.schemas import RSUserTokenData
 from app.modules.permissions.const import admin_type
@@ -84,15 +84,9 @@ async def ROLE_VERIFY_COOKIE(request: Request, response: Response) -> RSUserToke
         route_name = request.scope["route"].name
         method = request.method
 
-        permission_require = (
-            await db.execute(
-                select(Permission).where(
-                    Permission.name == route_name,
-                    Permission.action == method,
-                    Permission.type == admin_type,
-                )
-            )
-        ).scalar_one_or_none()
+        permission_require = await permission_index.resolve(
+            db, route_name, method, admin_type
+        )
 
         if not permission_require:
             await db.close()
@@ -108,15 +102,14 @@ async def ROLE_VERIFY_COOKIE(request: Request, response: Response) -> RSUserToke
             request.state.user = user_data
             return user_data
 
-        # Check if user has permission via pivot table
-        has_permission = (
-            await db.execute(
-                select(RolePermission).where(
-                    RolePermission.role_id == payload.role,
-                    RolePermission.permission_id == permission_require.id
-                )
+        # A permissions claim built with the current index spares the role lookup
+        claimed = PermissionSet.loads(payload.perms, await permission_index.ensure_loaded(db))
+        if claimed is not None:
+            has_permission = claimed.has(permission_require)
+        else:
+            has_permission = await role_has_permission(
+                db, payload.role, permission_require
             )
-        ).scalar_one_or_none()
 
         await db.close()
 
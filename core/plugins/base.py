@@ -1,15 +1,19 @@
 import os
-import importlib
 import inspect
 from typing import List
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from .types.plugin import Plugin
+from core.utils.module_registry import registry
+from core.utils.boot_profile import boot_profiler
+from core.tasks import task_runner
+from core.services.password_hasher import password_hasher
 
 class PluginManager:
     def __init__(self):
         self.plugins: List[Plugin] = []
-        self._load_plugins()
+        with boot_profiler.phase("plugins"):
+            self._load_plugins()
 
     def _load_plugins(self):
         """
@@ -23,28 +27,22 @@ class PluginManager:
             os.makedirs(plugins_dir, exist_ok=True)
             return
 
-        for item in os.listdir(plugins_dir):
-            item_path = os.path.join(plugins_dir, item)
-            
-            # Use only first level directories that have __init__.py
-            if os.path.isdir(item_path):
-                init_file = os.path.join(item_path, "__init__.py")
-                if os.path.exists(init_file):
-                    try:
-                        # Import the module
-                        module_name = f"plugins.{item}"
-                        module = importlib.import_module(module_name)
-                        
-                        # Find Plugin subclasses defined in the module
-                        for name, obj in inspect.getmembers(module):
-                            if (inspect.isclass(obj) and 
-                                issubclass(obj, Plugin) and 
-                                obj is not Plugin):
-                                self.plugins.append(obj())
-                                print(f"[PluginManager] Loaded plugin: {item}")
-                                break # Load only one plugin per module for now to avoid duplicates if re-imported
-                    except Exception as e:
-                        print(f"[PluginManager] Error loading plugin '{item}': {e}")
+        for entry in registry.discover(plugins_dir, "__init__.py", recursive=False):
+            item = entry.name
+            try:
+                # Import the module
+                module = registry.load(entry)
+
+                # Find Plugin subclasses defined in the module
+                for name, obj in inspect.getmembers(module):
+                    if (inspect.isclass(obj) and
+                        issubclass(obj, Plugin) and
+                        obj is not Plugin):
+                        self.plugins.append(obj())
+                        print(f"[PluginManager] Loaded plugin: {item}")
+                        break # Load only one plugin per module for now to avoid duplicates if re-imported
+            except Exception as e:
+                print(f"[PluginManager] Error loading plugin '{item}': {e}")
 
     @asynccontextmanager
     async def manage_lifespan(self, app: FastAPI):
@@ -67,5 +65,9 @@ class PluginManager:
             except Exception as e:
                 print(f"[PluginManager] Error terminating plugin '{plugin.__class__.__name__}': {e}")
 
+        # Executors last, plugins may still offload work while terminating
+        task_runner.shutdown()
+        password_hasher.shutdown()
+
 # Singleton Instance
 plugin_manager = PluginManager()
\ No newline at end of file
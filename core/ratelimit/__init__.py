@@ -0,0 +1,190 @@
+import hashlib
+import math
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Literal, Optional
+
+from fastapi import HTTPException, Request, status
+from prometheus_client import Counter
+
+from core.config.globals import settings
+
+# Import Backends
+from .base import BaseRateLimitBackend, RateLimitResult
+from .memory import InMemoryRateLimitBackend
+from .redis.backend import RedisRateLimitBackend
+from .quotas import Quota, QuotaPolicy, resolve_quota
+
+
+KeyClass = Literal["ip", "username", "global"]
+
+
+# Define Prometheus metrics
+RATE_LIMIT_DECISIONS = Counter(
+    "ratelimit_decisions_total",
+    "Rate limit decisions by scope, key class and result",
+    ["scope", "key_class", "result"],
+)
+
+
+@dataclass(frozen=True)
+class RateLimitRule:
+    """``limit`` hits per ``window`` seconds for each value of ``key_class``."""
+    key_class: KeyClass
+    limit: int
+    window: float
+
+
+class RateLimiter:
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(RateLimiter, cls).__new__(cls)
+            cls._instance._initialize()
+        return cls._instance
+
+    def _initialize(self):
+        self.enabled = settings.RATE_LIMIT_ENABLED
+        self.trust_proxy = settings.RATE_LIMIT_TRUST_PROXY
+        self.backend: BaseRateLimitBackend
+
+        # Try to initialize Redis so limits are shared by every worker
+        try:
+            self.backend = RedisRateLimitBackend(
+                host=settings.REDIS_HOST, port=settings.REDIS_PORT
+            )
+        except Exception as e:
+            print(
+                f"RateLimit Warning: Could not connect to Redis ({e}). Falling back to In-Memory."
+            )
+            self.backend = InMemoryRateLimitBackend()
+
+    def client_ip(self, request: Request) -> str:
+        if self.trust_proxy:
+            forwarded = request.headers.get("x-forwarded-for")
+            if forwarded:
+                return forwarded.split(",")[0].strip()
+        return request.client.host if request.client else "unknown"
+
+    async def hit(self, scope: str, rule: RateLimitRule, identity: Optional[str]) -> RateLimitResult:
+        if rule.key_class == "global":
+            key = f"ratelimit:{scope}:global"
+        else:
+            digest = hashlib.sha1((identity or "").encode()).hexdigest()[:16]
+            key = f"ratelimit:{scope}:{rule.key_class}:{digest}"
+
+        try:
+            result = await self.backend.hit(key, rule.limit, rule.window)
+        except Exception as e:
+            # Fail open: an unavailable limiter must not take authentication down
+            print(f"RateLimit Warning: {e}")
+            RATE_LIMIT_DECISIONS.labels(scope=scope, key_class=rule.key_class, result="error").inc()
+            return RateLimitResult(True, rule.limit, 0.0)
+
+        RATE_LIMIT_DECISIONS.labels(
+            scope=scope,
+            key_class=rule.key_class,
+            result="allowed" if result.allowed else "rejected",
+        ).inc()
+        return result
+
+    async def take(
+        self, scope: str, key_class: str, key: str, rate: float, burst: int
+    ) -> RateLimitResult:
+        try:
+            result = await self.backend.take(key, rate, burst)
+        except Exception as e:
+            print(f"RateLimit Warning: {e}")
+            RATE_LIMIT_DECISIONS.labels(scope=scope, key_class=key_class, result="error").inc()
+            return RateLimitResult(True, burst, 0.0)
+
+        RATE_LIMIT_DECISIONS.labels(
+            scope=scope,
+            key_class=key_class,
+            result="allowed" if result.allowed else "rejected",
+        ).inc()
+        return result
+
+    async def acquire(
+        self, scope: str, key_class: str, key: str, limit: int, lease: str, ttl: float
+    ) -> bool:
+        try:
+            acquired = await self.backend.acquire(key, limit, lease, ttl)
+        except Exception as e:
+            print(f"RateLimit Warning: {e}")
+            RATE_LIMIT_DECISIONS.labels(scope=scope, key_class=key_class, result="error").inc()
+            return True
+
+        if not acquired:
+            RATE_LIMIT_DECISIONS.labels(
+                scope=scope, key_class=key_class, result="rejected_concurrency"
+            ).inc()
+        return acquired
+
+    async def release(self, key: str, lease: str) -> None:
+        try:
+            await self.backend.release(key, lease)
+        except Exception as e:
+            print(f"RateLimit Warning: {e}")
+
+
+# Singleton Instance
+limiter = RateLimiter()
+
+
+async def _request_field(request: Request, field: str) -> Optional[str]:
+    """
+    Reads a field from the JSON or form body. FastAPI parses the body before
+    solving dependencies, so this hits Starlette's cached copy.
+    """
+    content_type = request.headers.get("content-type", "")
+    try:
+        if content_type.startswith("application/json"):
+            body = await request.json()
+            value = body.get(field) if isinstance(body, dict) else None
+        elif content_type.startswith(("application/x-www-form-urlencoded", "multipart/form-data")):
+            value = (await request.form()).get(field)
+        else:
+            value = request.query_params.get(field)
+    except Exception:
+        return None
+    return str(value).strip().lower() if value else None
+
+
+def rate_limit(
+    scope: str, *rules: RateLimitRule, username_field: str = "username"
+) -> Callable[[Request], Awaitable[None]]:
+    """
+    FastAPI dependency rejecting with 429 once any rule is exhausted.
+    Declare it in the route (or router) ``dependencies`` so it runs before
+    the handler touches the database or hashes a password.
+
+        @router.post("/sign-in", dependencies=[Depends(rate_limit(
+            "sign_in", RateLimitRule("ip", 20, 60), RateLimitRule("username", 5, 60)
+        ))])
+    """
+
+    async def RATE_LIMIT(request: Request) -> None:
+        if not limiter.enabled:
+            return
+
+        # Stops at the first exhausted rule so rejected requests do not spend the others
+        for rule in rules:
+            if rule.key_class == "ip":
+                identity = limiter.client_ip(request)
+            elif rule.key_class == "username":
+                identity = await _request_field(request, username_field)
+                if identity is None:
+                    continue
+            else:
+                identity = None
+
+            result = await limiter.hit(scope, rule, identity)
+            if not result.allowed:
+                raise HTTPException(
+                    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                    detail="Too many requests",
+                    headers={"Retry-After": str(max(1, math.ceil(result.retry_after)))},
+                )
+
+    return RATE_LIMIT
@@ -0,0 +1,43 @@
+from abc import ABC, abstractmethod
+from typing import NamedTuple
+
+
+class RateLimitResult(NamedTuple):
+    allowed: bool
+    remaining: int
+    retry_after: float
+
+
+class BaseRateLimitBackend(ABC):
+
+    @abstractmethod
+    async def hit(self, key: str, limit: int, window: float) -> RateLimitResult:
+        """
+        Records one hit for ``key`` if fewer than ``limit`` hits happened in
+        the last ``window`` seconds. Rejected hits are not recorded.
+        """
+        pass
+
+    @abstractmethod
+    async def reset(self, key: str) -> None:
+        pass
+
+    @abstractmethod
+    async def take(self, key: str, rate: float, burst: int) -> RateLimitResult:
+        """
+        Token bucket: refills ``rate`` tokens per second up to ``burst`` and
+        takes one if available.
+        """
+        pass
+
+    @abstractmethod
+    async def acquire(self, key: str, limit: int, lease: str, ttl: float) -> bool:
+        """
+        Takes one of ``limit`` concurrent slots under ``lease``. Leases expire
+        after ``ttl`` seconds so a crashed worker can not leak slots.
+        """
+        pass
+
+    @abstractmethod
+    async def release(self, key: str, lease: str) -> None:
+        pass
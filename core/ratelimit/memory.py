@@ -0,0 +1,82 @@
+import time
+from collections import deque
+from typing import Deque, Dict, Tuple
+
+from .base import BaseRateLimitBackend, RateLimitResult
+
+
+class InMemoryRateLimitBackend(BaseRateLimitBackend):
+    """
+    Process-local limits: a sliding-window log per key (each deque holds at
+    most ``limit`` timestamps, idle keys are swept periodically), token
+    buckets and concurrency leases.
+    """
+
+    _SWEEP_EVERY = 1024
+
+    def __init__(self):
+        self._hits: Dict[str, Deque[float]] = {}
+        self._windows: Dict[str, float] = {}
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        self._leases: Dict[str, Dict[str, float]] = {}
+        self._calls = 0
+
+    async def hit(self, key: str, limit: int, window: float) -> RateLimitResult:
+        now = time.monotonic()
+        self._calls += 1
+        if self._calls % self._SWEEP_EVERY == 0:
+            self._sweep(now)
+
+        hits = self._hits.get(key)
+        if hits is None:
+            hits = self._hits[key] = deque()
+        self._windows[key] = window
+
+        while hits and hits[0] <= now - window:
+            hits.popleft()
+
+        if len(hits) >= limit:
+            return RateLimitResult(False, 0, hits[0] + window - now)
+
+        hits.append(now)
+        return RateLimitResult(True, limit - len(hits), 0.0)
+
+    async def reset(self, key: str) -> None:
+        self._hits.pop(key, None)
+        self._windows.pop(key, None)
+        self._buckets.pop(key, None)
+        self._leases.pop(key, None)
+
+    async def take(self, key: str, rate: float, burst: int) -> RateLimitResult:
+        now = time.monotonic()
+        tokens, updated_at = self._buckets.get(key, (float(burst), now))
+        tokens = min(float(burst), tokens + (now - updated_at) * rate)
+
+        if tokens < 1:
+            self._buckets[key] = (tokens, now)
+            return RateLimitResult(False, 0, (1 - tokens) / rate)
+
+        self._buckets[key] = (tokens - 1, now)
+        return RateLimitResult(True, int(tokens - 1), 0.0)
+
+    async def acquire(self, key: str, limit: int, lease: str, ttl: float) -> bool:
+        now = time.monotonic()
+        leases = self._leases.setdefault(key, {})
+        for expired in [l for l, expires_at in leases.items() if expires_at <= now]:
+            del leases[expired]
+        if len(leases) >= limit:
+            return False
+        leases[lease] = now + ttl
+        return True
+
+    async def release(self, key: str, lease: str) -> None:
+        leases = self._leases.get(key)
+        if leases is not None:
+            leases.pop(lease, None)
+            if not leases:
+                del self._leases[key]
+
+    def _sweep(self, now: float) -> None:
+        for key in [k for k, hits in self._hits.items() if not hits or hits[-1] <= now - self._windows[k]]:
+            del self._hits[key]
+            del self._windows[key]
@@ -0,0 +1,43 @@
+from dataclasses import dataclass, field
+from typing import Dict, Literal, Mapping, Optional
+
+
+QuotaKey = Literal["user", "ip", "global"]
+
+
+@dataclass(frozen=True)
+class Quota:
+    """
+    Traffic limits for a module or a route.
+
+    rate/burst: token bucket, ``rate`` requests per second with up to
+    ``burst`` requests at once (defaults to ``rate``).
+    concurrency: maximum requests in flight at the same time.
+    key: who shares the budget, the authenticated user, the client ip or
+    every caller.
+    overrides: quotas for callers whose role level is at least the key;
+    the highest matching level wins and ``None`` lifts the limits.
+    """
+    rate: Optional[float] = None
+    burst: Optional[int] = None
+    concurrency: Optional[int] = None
+    key: QuotaKey = "user"
+    overrides: Mapping[int, Optional["Quota"]] = field(default_factory=dict)
+
+    def for_level(self, level: Optional[int]) -> Optional["Quota"]:
+        if level is None or not self.overrides:
+            return self
+        matching = [min_level for min_level in self.overrides if level >= min_level]
+        if not matching:
+            return self
+        return self.overrides[max(matching)]
+
+
+# Module-wide quota under "*", route specific quotas under the route name
+QuotaPolicy = Dict[str, Quota]
+
+
+def resolve_quota(policy: QuotaPolicy, route_name: Optional[str]) -> Optional[Quota]:
+    if route_name and route_name in policy:
+        return policy[route_name]
+    return policy.get("*")
@@ -0,0 +1,131 @@
+import time
+import uuid
+from typing import Optional
+
+import redis.asyncio as redis
+import redis as redis_sync
+
+from ..base import BaseRateLimitBackend, RateLimitResult
+
+
+# Sliding-window log on a sorted set, evaluated atomically on the server.
+# KEYS[1] = key, ARGV = now (ms), window (ms), limit, member id
+SLIDING_WINDOW_LUA = """
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local limit = tonumber(ARGV[3])
+
+redis.call('ZREMRANGEBYSCORE', key, '-inf', now - window)
+local count = redis.call('ZCARD', key)
+
+if count >= limit then
+    local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+    local retry = window
+    if oldest[2] then
+        retry = tonumber(oldest[2]) + window - now
+    end
+    return {0, 0, retry}
+end
+
+redis.call('ZADD', key, now, ARGV[4])
+redis.call('PEXPIRE', key, window)
+return {1, limit - count - 1, 0}
+"""
+
+
+# Token bucket kept in a hash (tokens, updated_at).
+# KEYS[1] = key, ARGV = now (ms), rate (tokens/s), burst
+TOKEN_BUCKET_LUA = """
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local burst = tonumber(ARGV[3])
+
+local state = redis.call('HMGET', key, 'tokens', 'ts')
+local tokens = tonumber(state[1]) or burst
+local ts = tonumber(state[2]) or now
+tokens = math.min(burst, tokens + (now - ts) / 1000 * rate)
+
+local allowed = 0
+local retry = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+else
+    retry = math.ceil((1 - tokens) / rate * 1000)
+end
+
+redis.call('HSET', key, 'tokens', tostring(tokens), 'ts', now)
+redis.call('PEXPIRE', key, math.ceil(burst / rate * 1000) + 1000)
+return {allowed, math.floor(tokens), retry}
+"""
+
+# Concurrency slots as leases on a sorted set scored by expiry.
+# KEYS[1] = key, ARGV = now (ms), limit, lease id, ttl (ms)
+ACQUIRE_LUA = """
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+local ttl = tonumber(ARGV[4])
+
+redis.call('ZREMRANGEBYSCORE', key, '-inf', now)
+if redis.call('ZCARD', key) >= tonumber(ARGV[2]) then
+    return 0
+end
+redis.call('ZADD', key, now + ttl, ARGV[3])
+redis.call('PEXPIRE', key, ttl)
+return 1
+"""
+
+
+class RedisRateLimitBackend(BaseRateLimitBackend):
+    def __init__(self, host: str, port: int):
+        self._host = host
+        self._port = port
+        self._client: Optional[redis.Redis] = None
+        self._connect()
+
+    def _connect(self):
+        # Check connection with a sync client, as the cache backend does
+        redis_sync.Redis(host=self._host, port=self._port).ping()
+
+        self._client = redis.Redis(host=self._host, port=self._port)
+        self._script = self._client.register_script(SLIDING_WINDOW_LUA)
+        self._bucket_script = self._client.register_script(TOKEN_BUCKET_LUA)
+        self._acquire_script = self._client.register_script(ACQUIRE_LUA)
+
+    async def hit(self, key: str, limit: int, window: float) -> RateLimitResult:
+        if self._client is None:
+            raise RuntimeError("Async Redis client is not initialized")
+        now_ms = int(time.time() * 1000)
+        allowed, remaining, retry_ms = await self._script(
+            keys=[key],
+            args=[now_ms, int(window * 1000), limit, f"{now_ms}-{uuid.uuid4().hex[:8]}"],
+        )
+        return RateLimitResult(bool(allowed), int(remaining), int(retry_ms) / 1000)
+
+    async def reset(self, key: str) -> None:
+        if self._client is None:
+            raise RuntimeError("Async Redis client is not initialized")
+        await self._client.delete(key)
+
+    async def take(self, key: str, rate: float, burst: int) -> RateLimitResult:
+        if self._client is None:
+            raise RuntimeError("Async Redis client is not initialized")
+        allowed, remaining, retry_ms = await self._bucket_script(
+            keys=[key], args=[int(time.time() * 1000), rate, burst]
+        )
+        return RateLimitResult(bool(allowed), int(remaining), int(retry_ms) / 1000)
+
+    async def acquire(self, key: str, limit: int, lease: str, ttl: float) -> bool:
+        if self._client is None:
+            raise RuntimeError("Async Redis client is not initialized")
+        acquired = await self._acquire_script(
+            keys=[key], args=[int(time.time() * 1000), limit, lease, int(ttl * 1000)]
+        )
+        return bool(acquired)
+
+    async def release(self, key: str, lease: str) -> None:
+        if self._client is None:
+            raise RuntimeError("Async Redis client is not initialized")
+        await self._client.zrem(key, lease)
@@ -1,8 +1,10 @@
-from core.utils.import_modules import import_modules, import_webhooks, load_subscribers
+from core.utils.import_modules import import_modules, import_webhooks, load_jobs, load_subscribers
+from core.utils.boot_profile import boot_profiler
 
 from fastapi import APIRouter, Depends
-from starlette.responses import Response
-from prometheus_client import generate_latest, CONTENT_TYPE_LATEST, REGISTRY
+from starlette.responses import JSONResponse, Response
+import os
+from prometheus_client import generate_latest, CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, multiprocess
 
 from core.database import get_async_db
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -11,6 +13,7 @@ from core.middlewares.role_verify_cookie import ROLE_VERIFY_COOKIE
 from core.event import ChannelEvent
 from app.modules.roles.models import Role
 from fastapi import HTTPException
+from core.services.readiness import readiness
 
 channel = ChannelEvent()
 
@@ -25,6 +28,12 @@ async def response():
     return {"result": "Ok!"}
 
 
+@api_router.get("/ready", include_in_schema=False)
+async def ready():
+    """Readiness probe: 503 until startup seeding (init_auth) has finished."""
+    return JSONResponse(readiness.status(), status_code=200 if readiness.ready else 503)
+
+
 # Prometheus - Protected metrics endpoint
 @api_router.get("/metrics", include_in_schema=False)
 async def metrics(
@@ -57,13 +66,24 @@ async def metrics(
             detail="Insufficient privileges to access metrics. Only owner and observer roles allowed."
         )
     
+    # Under cli.py serve every worker writes its samples to a shared directory
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return Response(generate_latest(registry), media_type=CONTENT_TYPE_LATEST)
+
     return Response(generate_latest(REGISTRY), media_type=CONTENT_TYPE_LATEST)
 
 
-routes = import_modules(api_router)
+with boot_profiler.phase("modules"):
+    routes = import_modules(api_router)
+
+with boot_profiler.phase("webhooks"):
+    # Automatic registration of inbound webhooks (no auth required)
+    import_webhooks(api_router, base_path="app/webhooks/in", prefix="/webhook")
 
-# Automatic registration of inbound webhooks (no auth required)
-import_webhooks(api_router, base_path="app/webhooks/in", prefix="/webhook")
+    # Ensure outbound subscribers are loaded
+    load_subscribers()
 
-# Ensure outbound subscribers are loaded
-load_subscribers()
+with boot_profiler.phase("jobs"):
+    load_jobs()
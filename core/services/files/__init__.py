@@ -2,3 +2,5 @@ from .delete_file import delete_file
 from .save_files import save_files
 # from .save_images import save_images
 from .save_temp_files import save_temp_files
+from .store_files import release_file, store_files
+from .stream_upload import SavedFile, UploadTooLarge, stream_upload
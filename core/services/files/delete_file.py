@@ -1,5 +1,7 @@
 import os
 
+from core.tasks import run_in_thread
+
 
 async def delete_file(path: str):
-    os.remove(path)
+    await run_in_thread(os.remove, path)
@@ -0,0 +1,45 @@
+import os
+import uuid
+from contextlib import suppress
+from typing import Any, Optional
+
+from core.config.globals import settings
+from .stream_upload import SavedFile, stream_upload
+
+
+def _extension(filename: Optional[str]) -> str:
+    # Client file names are untrusted, keep a short alphanumeric extension only
+    ext = os.path.splitext(filename or "")[1].lower()
+    return ext if 1 < len(ext) <= 10 and ext[1:].isalnum() else ""
+
+
+async def save_files(
+    file: Any, directory: Optional[str] = None, max_size: Optional[int] = None
+) -> SavedFile:
+    """
+    Streams an upload to ``directory`` (FILES_UPLOAD_DIR by default) under a
+    random name. The file only appears under its final name once complete.
+    """
+    directory = directory or settings.FILES_UPLOAD_DIR
+    os.makedirs(directory, exist_ok=True)
+
+    filename = f"{uuid.uuid4().hex}{_extension(getattr(file, 'filename', None))}"
+    path = os.path.join(directory, filename)
+    partial = f"{path}.part"
+
+    try:
+        with open(partial, "wb") as out:
+            size, sha256 = await stream_upload(file, out, max_size)
+        os.replace(partial, path)
+    except BaseException:
+        with suppress(FileNotFoundError):
+            os.remove(partial)
+        raise
+
+    return SavedFile(
+        path=path,
+        filename=filename,
+        size=size,
+        sha256=sha256,
+        content_type=getattr(file, "content_type", None),
+    )
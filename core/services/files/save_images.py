@@ -5,9 +5,9 @@
 # async def save_images(images: list[UploadFile], EmployeePhoto: Base, db: AsyncSession) -> None:
 #         try:
 #             for image in images:
-#                 _, filename = await save_files(image)
+#                 saved = await save_files(image)
 #                 db.add(EmployeePhoto(
-#                     imagen=filename,
+#                     imagen=saved.filename,
 #                     empleado=id
 #                 ))
 #         except ValueError as err:
@@ -1,10 +1,23 @@
 import tempfile
-from typing import Any, Callable
+from typing import Any, Callable, Optional
 
+from .stream_upload import stream_upload
 
-async def save_temp_files(file: Any, callback: Callable[[str], Any]):
+
+async def save_temp_files(
+    file: Any,
+    callback: Callable[[Any], Any],
+    max_size: Optional[int] = None,
+    handle: bool = False,
+):
+    """
+    Streams an upload to a temporary file and awaits ``callback`` with its
+    path, or with the open file rewound to the start when ``handle`` is
+    True. The file is deleted once the callback returns.
+    """
     with tempfile.NamedTemporaryFile(delete=True) as temp:
-        data = await file.read()
-        temp.write(data)
-        temp_path = temp.name
-        return await callback(temp_path)
+        await stream_upload(file, temp, max_size)
+        if handle:
+            temp.seek(0)
+            return await callback(temp)
+        return await callback(temp.name)
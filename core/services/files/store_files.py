@@ -0,0 +1,33 @@
+import os
+import tempfile
+from contextlib import suppress
+from typing import Any, Optional
+
+from core.storage import StoredObject, storage
+from .stream_upload import stream_upload
+
+
+async def store_files(file: Any, max_size: Optional[int] = None) -> StoredObject:
+    """
+    Streams an upload into content-addressed storage, keyed by its SHA-256.
+    Identical content is kept once; pair every call with ``release_file``.
+    """
+    with tempfile.NamedTemporaryFile(dir=storage.staging_dir, delete=False) as out:
+        staged = out.name
+        try:
+            size, digest = await stream_upload(file, out, max_size)
+        except BaseException:
+            out.close()
+            os.remove(staged)
+            raise
+
+    try:
+        return await storage.put(staged, digest, size, getattr(file, "content_type", None))
+    except BaseException:
+        with suppress(FileNotFoundError):
+            os.remove(staged)
+        raise
+
+
+async def release_file(digest: str) -> bool:
+    return await storage.release(digest)
@@ -0,0 +1,57 @@
+import hashlib
+from dataclasses import dataclass
+from typing import Any, BinaryIO, Optional, Tuple
+
+from core.config.globals import settings
+from core.tasks import run_in_thread
+
+
+class UploadTooLarge(ValueError):
+    def __init__(self, limit: int):
+        super().__init__(f"Upload exceeds the {limit} bytes limit")
+        self.limit = limit
+
+
+@dataclass
+class SavedFile:
+    path: str
+    filename: str
+    size: int
+    sha256: str
+    content_type: Optional[str] = None
+
+
+def _write_chunk(out: BinaryIO, digest, chunk: bytes) -> None:
+    digest.update(chunk)
+    out.write(chunk)
+
+
+async def stream_upload(
+    file: Any, out: BinaryIO, max_size: Optional[int] = None, chunk_size: Optional[int] = None
+) -> Tuple[int, str]:
+    """
+    Copies an upload into ``out`` one chunk at a time, hashing as it goes,
+    so memory stays at one chunk whatever the upload size. Hashing and
+    writing run on the task runner's threads. Returns (size, sha256).
+    """
+    limit = settings.FILES_MAX_UPLOAD_BYTES if max_size is None else max_size
+    chunk_size = chunk_size or settings.FILES_CHUNK_SIZE
+
+    # Starlette knows the size once the part is spooled, fail before copying
+    declared = getattr(file, "size", None)
+    if limit and declared is not None and declared > limit:
+        raise UploadTooLarge(limit)
+
+    digest = hashlib.sha256()
+    size = 0
+    while True:
+        chunk = await file.read(chunk_size)
+        if not chunk:
+            break
+        size += len(chunk)
+        if limit and size > limit:
+            raise UploadTooLarge(limit)
+        await run_in_thread(_write_chunk, out, digest, chunk)
+
+    await run_in_thread(out.flush)
+    return size, digest.hexdigest()
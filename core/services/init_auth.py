@@ -1,20 +1,106 @@
+import asyncio
+import hashlib
+from core.config.globals import settings
+from core.cache import cache
 from core.services.init_owner import initialize_owner
 from core.services.init_subscriber import initialize_subscriber
 from core.services.init_observer import initialize_observer
+from core.services.readiness import readiness
 from app.modules.permissions.services import create_permissions_api
+from app.modules.role_permissions.services import ensure_role_permissions_sync
 from typing import List, Dict, Any
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 
+# Transaction level advisory lock: one worker seeds, the others queue behind it
+INIT_AUTH_LOCK_KEY = int(hashlib.sha1(b"init_auth").hexdigest()[:15], 16)
+INIT_AUTH_MARKER = "init_auth:seeded:{fingerprint}"
+
+
+def seed_fingerprint(permissions_routes: List[Dict[str, Any]]) -> str:
+    """
+    Identifies what a seeding run produces; a deploy adding routes or changing
+    the seeded accounts gets a new fingerprint and seeds again.
+    """
+    names = sorted(
+        f"{permission_routes['type']}:{getattr(route, 'name', '')}"
+        for permission_routes in permissions_routes
+        for route in permission_routes["routes"]
+    )
+    names += [settings.OWNER_USER, settings.OBSERVER_USER]
+    return hashlib.sha1("\n".join(names).encode()).hexdigest()[:16]
+
+
+async def seed_auth(
+    permissions_routes: List[Dict[str, Any]], sessionMaker: async_sessionmaker[AsyncSession]
+):
+
+    with readiness.step("init_auth.role_permissions_sync"):
+        await ensure_role_permissions_sync(sessionMaker)
+
+    with readiness.step("init_auth.permissions"):
+        for permission_routes in permissions_routes:
+            await create_permissions_api(
+                permission_routes["routes"], sessionMaker, permission_routes["type"]
+            )
+    with readiness.step("init_auth.owner"):
+        await initialize_owner(sessionMaker)
+    with readiness.step("init_auth.subscriber"):
+        await initialize_subscriber(sessionMaker)
+    with readiness.step("init_auth.observer"):
+        await initialize_observer(sessionMaker)
+
+
 async def init_auth(
     permissions_routes: List[Dict[str, Any]], sessionMaker: async_sessionmaker[AsyncSession]
 ):
+    """
+    Seeds permissions and the built-in roles and users once per deploy.
+
+    Workers serialize on a Postgres advisory lock; whoever gets it first
+    seeds and leaves a marker, the rest find the marker and skip the work.
+    """
+    marker = INIT_AUTH_MARKER.format(fingerprint=seed_fingerprint(permissions_routes))
+
+    lock_session: AsyncSession = sessionMaker()
+    try:
+        with readiness.step("init_auth.lock"):
+            await lock_session.execute(
+                text("SELECT pg_advisory_xact_lock(:key)"), {"key": INIT_AUTH_LOCK_KEY}
+            )
 
+        if await cache.get(marker):
+            print("[init_auth] Already seeded by another worker")
+        else:
+            await seed_auth(permissions_routes, sessionMaker)
+            # Redis only takes str/bytes/numbers; Cache.set swallows the error
+            await cache.set(marker, "1", ttl=settings.INIT_AUTH_MARKER_TTL)
+            if not await cache.get(marker):
+                print("[init_auth] Warning: could not store the seeded marker, other workers will seed again")
+    finally:
+        # Ending the transaction releases the lock
+        await lock_session.rollback()
+        await lock_session.close()
 
-    for permission_routes in permissions_routes:
-        await create_permissions_api(
-            permission_routes["routes"], sessionMaker, permission_routes["type"]
-        )
-    await initialize_owner(sessionMaker)
-    await initialize_subscriber(sessionMaker)
-    await initialize_observer(sessionMaker)
+
+async def run_init_auth(
+    permissions_routes: List[Dict[str, Any]], sessionMaker: async_sessionmaker[AsyncSession]
+):
+    """
+    Runs init_auth in the background of the lifespan, retrying until it
+    succeeds, and flips the readiness gate when done.
+    """
+    while True:
+        try:
+            with readiness.step("init_auth"):
+                await init_auth(permissions_routes, sessionMaker)
+            readiness.mark_ready()
+            print(f"[init_auth] Ready: {readiness.steps}")
+            return
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            readiness.mark_failed(e)
+            print(f"[init_auth] Failed ({e}), retrying in {settings.INIT_AUTH_RETRY_SECONDS}s")
+            await asyncio.sleep(settings.INIT_AUTH_RETRY_SECONDS)
@@ -1,16 +1,13 @@
 from core.config.globals import settings
-from passlib.context import CryptContext # type: ignore
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.modules.permissions.models import Permission
 from app.modules.roles.models import Role
 from app.modules.users.models import User
-from app.modules.role_permissions.models import RolePermission
+from core.services.password_hasher import password_hasher
 
 
-hash_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 OBSERVER_USER = settings.OBSERVER_USER
 OBSERVER_EMAIL = settings.OBSERVER_EMAIL
 OBSERVER_PASS = settings.OBSERVER_PASS
@@ -45,25 +42,6 @@ async def initialize_observer_role(db: AsyncSession) -> Role:
         else:
             print("[v] Observer role already exists")
 
-        # Sync Pivot Table (RolePermission)
-        observer_role_id = observer_role.id
-        permission_ids = observer_role.permissions
-        for perm_id in permission_ids:
-            rp_query = await db.execute(
-                select(RolePermission).where(
-                    RolePermission.role_id == observer_role_id,
-                    RolePermission.permission_id == perm_id
-                )
-            )
-            if not rp_query.scalar_one_or_none():
-                await RolePermission(
-                    role_id=observer_role_id,
-                    permission_id=perm_id
-                ).save(db)
-
-        if permission_ids:
-            print(f"[v] Synced observer role permissions in pivot table")
-
         return observer_role
 
     except Exception as e:
@@ -94,7 +72,7 @@ async def initialize_observer_user(db: AsyncSession, observer_role_id: int) -> U
         # Create observer user
         observer_user = await User(
             username=OBSERVER_USER,
-            password=hash_context.hash(OBSERVER_PASS),
+            password=await password_hasher.hash(OBSERVER_PASS),
             email=f"{OBSERVER_EMAIL}",
             full_name="System Observer",
             role_ref=observer_role_id,
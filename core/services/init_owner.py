@@ -1,16 +1,14 @@
 from core.config.globals import settings
-from passlib.context import CryptContext  # type: ignore
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.modules.permissions.models import Permission
 from app.modules.roles.models import Role
 from app.modules.users.models import User
-from app.modules.role_permissions.models import RolePermission
+from core.services.password_hasher import password_hasher
+from app.modules.role_permissions.services import grant_permissions
 
 
-hash_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 OWNER_USER = settings.OWNER_USER
 OWNER_EMAIL = settings.OWNER_EMAIL
 OWNER_PASS = settings.OWNER_PASS
@@ -25,10 +23,9 @@ async def initialize_owner_role(db: AsyncSession) -> Role:
         Role: The owner role instance
     """
     try:
-        # Get all permissions first to ensure we have them for both array and pivot
-        result = await db.execute(select(Permission))
-        all_permissions = result.scalars().all()
-        permission_ids = [perm.id for perm in all_permissions]
+        # Get all permission ids first
+        result = await db.execute(select(Permission.id))
+        permission_ids = list(result.scalars().all())
 
         # Check if owner role already exists
         query = await Role.find_by_colunm(db, "name", "owner")
@@ -41,38 +38,22 @@ async def initialize_owner_role(db: AsyncSession) -> Role:
                 )
                 permission_ids = []
 
-            # Create owner role
+            # Create owner role (roles.permissions is filled by the pivot trigger)
             owner_role = await Role(
                 name="owner",
                 description="Owner role with full system access",
                 level=100,
-                permissions=permission_ids,
+                permissions=[],
                 disabled=False,
             ).save(db)
-            print(f"[v] Created owner role with {len(permission_ids)} permissions (array)")
+            print(f"[v] Created owner role")
         else:
             print("[v] Owner role already exists")
-            # Update array if needed (optional but good for consistency)
-            if set(owner_role.permissions) != set(permission_ids):
-                owner_role.permissions = permission_ids
-                await owner_role.save(db)
-                print(f"[v] Updated owner role permissions array")
-
-        # Sync Pivot Table (RolePermission)
-        owner_role_id = owner_role.id
-        for perm_id in permission_ids:
-            rp_query = await db.execute(
-                select(RolePermission).where(
-                    RolePermission.role_id == owner_role_id,
-                    RolePermission.permission_id == perm_id
-                )
-            )
-            if not rp_query.scalar_one_or_none():
-                await RolePermission(
-                    role_id=owner_role_id,
-                    permission_id=perm_id
-                ).save(db)
-        
+
+        # Grant every permission through the pivot table in a single statement
+        await grant_permissions(db, owner_role.id, permission_ids)
+        await db.refresh(owner_role)
+
         print(f"[v] Synced owner role permissions in pivot table")
         return owner_role
 
@@ -104,7 +85,7 @@ async def initialize_owner_user(db: AsyncSession, owner_role_id: int) -> User:
         # Create owner user
         owner_user = await User(
             username=OWNER_USER,
-            password=hash_context.hash(OWNER_PASS),
+            password=await password_hasher.hash(OWNER_PASS),
             email=f"{OWNER_EMAIL}",
             full_name="System Owner",
             role_ref=owner_role_id,
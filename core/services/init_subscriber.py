@@ -2,7 +2,6 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.modules.roles.models import Role
-from app.modules.role_permissions.models import RolePermission
 
 
 async def initialize_subscriber_role(db: AsyncSession) -> Role:
@@ -32,25 +31,6 @@ async def initialize_subscriber_role(db: AsyncSession) -> Role:
         else:
             print("[v] Subscriber role already exists")
 
-        # Sync Pivot Table (RolePermission)
-        subscriber_role_id = subscriber_role.id
-        permission_ids = subscriber_role.permissions
-        for perm_id in permission_ids:
-            rp_query = await db.execute(
-                select(RolePermission).where(
-                    RolePermission.role_id == subscriber_role_id,
-                    RolePermission.permission_id == perm_id
-                )
-            )
-            if not rp_query.scalar_one_or_none():
-                await RolePermission(
-                    role_id=subscriber_role_id,
-                    permission_id=perm_id
-                ).save(db)
-
-        if permission_ids:
-            print(f"[v] Synced subscriber role permissions in pivot table")
-
         return subscriber_role
 
     except Exception as e:
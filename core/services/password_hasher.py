@@ -0,0 +1,115 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Tuple, TypeVar
+
+import bcrypt
+from bcrypt import _bcrypt  # type: ignore
+from passlib.context import CryptContext  # type: ignore
+from prometheus_client import Gauge, Histogram
+
+from core.config.globals import settings
+
+# passlib still reads bcrypt.__about__, removed in bcrypt 4.1
+if not hasattr(bcrypt, "__about__"):
+    setattr(bcrypt, "__about__", type("About", (object,), {"__version__": _bcrypt.__version_ex__}))
+
+T = TypeVar("T")
+
+
+# Define Prometheus metrics
+PASSWORD_HASH_QUEUE_DEPTH = Gauge(
+    "password_hash_queue_depth",
+    "Password hash/verify operations waiting for a hasher slot",
+)
+
+PASSWORD_HASH_IN_FLIGHT = Gauge(
+    "password_hash_in_flight",
+    "Password hash/verify operations currently running",
+)
+
+PASSWORD_HASH_DURATION = Histogram(
+    "password_hash_duration_seconds",
+    "Duration of password operations, including the wait for a slot",
+    ["operation"],
+)
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt on a bounded thread pool so hashing never blocks the event
+    loop. bcrypt releases the GIL, so threads give real parallelism; the
+    semaphore caps concurrent work and makes the backlog observable.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(PasswordHasher, cls).__new__(cls)
+            cls._instance._initialize()
+        return cls._instance
+
+    def _initialize(self):
+        self.workers = max(1, settings.PASSWORD_HASH_WORKERS)
+        self.rehash_on_login = settings.PASSWORD_REHASH_ON_LOGIN
+        self.context = CryptContext(
+            schemes=["bcrypt"],
+            deprecated="auto",
+            bcrypt__rounds=settings.PASSWORD_HASH_ROUNDS,
+            # Hashes below the configured cost are reported by needs_update
+            bcrypt__min_rounds=settings.PASSWORD_HASH_ROUNDS,
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="password-hasher"
+        )
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def _run(self, operation: str, func: Callable[..., T], *args) -> T:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.workers)
+
+        started = time.perf_counter()
+        PASSWORD_HASH_QUEUE_DEPTH.inc()
+        try:
+            await self._semaphore.acquire()
+        finally:
+            PASSWORD_HASH_QUEUE_DEPTH.dec()
+
+        PASSWORD_HASH_IN_FLIGHT.inc()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, func, *args)
+        finally:
+            PASSWORD_HASH_IN_FLIGHT.dec()
+            self._semaphore.release()
+            PASSWORD_HASH_DURATION.labels(operation=operation).observe(
+                time.perf_counter() - started
+            )
+
+    async def hash(self, password: str) -> str:
+        return await self._run("hash", self.context.hash, password)
+
+    async def verify(self, password: str, hashed: str) -> bool:
+        return await self._run("verify", self.context.verify, password, hashed)
+
+    async def verify_and_update(
+        self, password: str, hashed: str
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        Verifies the password and, when the stored hash uses outdated
+        parameters (e.g. fewer rounds than PASSWORD_HASH_ROUNDS), returns
+        a fresh hash to persist. The new hash is None otherwise.
+        """
+        if not self.rehash_on_login:
+            return await self.verify(password, hashed), None
+        return await self._run(
+            "verify", self.context.verify_and_update, password, hashed
+        )
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False)
+
+
+# Singleton Instance
+password_hasher = PasswordHasher()
@@ -0,0 +1,71 @@
+import asyncio
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+from prometheus_client import Gauge
+
+from core.utils.boot_profile import boot_profiler
+
+
+# Define Prometheus metrics
+APP_READY = Gauge("app_ready", "1 once startup seeding finished in this worker")
+STARTUP_STEP_SECONDS = Gauge(
+    "app_startup_step_seconds", "Duration of the last run of each startup step", ["step"]
+)
+
+
+class Readiness:
+    """
+    Tracks whether this worker finished its startup work (init_auth).
+    Until then ``GET /ready`` answers 503 so load balancers keep traffic away.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(Readiness, cls).__new__(cls)
+            cls._instance._initialize()
+        return cls._instance
+
+    def _initialize(self):
+        self.ready = False
+        self.error: Optional[str] = None
+        self.steps: Dict[str, float] = {}
+        self._event: Optional[asyncio.Event] = None
+
+    @property
+    def event(self) -> asyncio.Event:
+        # Created lazily so it binds to the server loop
+        if self._event is None:
+            self._event = asyncio.Event()
+        return self._event
+
+    @contextmanager
+    def step(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        with boot_profiler.phase(name):
+            yield
+        elapsed = time.perf_counter() - started
+        self.steps[name] = round(elapsed * 1000, 2)
+        STARTUP_STEP_SECONDS.labels(step=name).set(elapsed)
+
+    def mark_ready(self) -> None:
+        self.ready = True
+        self.error = None
+        APP_READY.set(1)
+        self.event.set()
+
+    def mark_failed(self, error: Exception) -> None:
+        self.error = f"{error.__class__.__name__}: {error}"
+
+    async def wait(self) -> None:
+        await self.event.wait()
+
+    def status(self) -> Dict[str, Any]:
+        return {"ready": self.ready, "error": self.error, "steps_ms": self.steps}
+
+
+# Singleton Instance
+readiness = Readiness()
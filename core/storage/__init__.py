@@ -0,0 +1,117 @@
+from typing import Optional
+
+from fastapi import HTTPException
+from starlette.requests import Request
+from starlette.responses import RedirectResponse, Response
+
+from core.config.globals import settings
+
+# Import Backends
+from .base import BaseStorageBackend, StoredObject
+from .local import LocalStorageBackend
+from .response import StoredObjectResponse, parse_range
+
+
+class Storage:
+    """
+    Content-addressed file storage selected by STORAGE_BACKEND: "local"
+    (sharded directory) or "s3" (any S3-compatible bucket, e.g. MinIO via
+    STORAGE_S3_ENDPOINT_URL). Falls back to local when S3 is unusable.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(Storage, cls).__new__(cls)
+            cls._instance._initialize()
+        return cls._instance
+
+    def _initialize(self):
+        self.backend: Optional[BaseStorageBackend] = None
+
+        if settings.STORAGE_BACKEND == "s3":
+            try:
+                from .s3.backend import S3StorageBackend
+
+                self.backend = S3StorageBackend(
+                    bucket=settings.STORAGE_S3_BUCKET,
+                    prefix=settings.STORAGE_S3_PREFIX,
+                    endpoint_url=settings.STORAGE_S3_ENDPOINT_URL,
+                    region=settings.STORAGE_S3_REGION,
+                    access_key=settings.STORAGE_S3_ACCESS_KEY,
+                    secret_key=settings.STORAGE_S3_SECRET_KEY,
+                    presign_seconds=settings.STORAGE_S3_PRESIGN_SECONDS,
+                )
+            except Exception as e:
+                print(f"Storage Warning: Could not use S3 ({e}). Falling back to Local.")
+
+        if self.backend is None:
+            self.backend = LocalStorageBackend(settings.STORAGE_LOCAL_ROOT)
+
+    @property
+    def staging_dir(self) -> str:
+        return self.backend.staging_dir
+
+    async def put(
+        self, source: str, digest: str, size: int, content_type: Optional[str] = None
+    ) -> StoredObject:
+        return await self.backend.put(source, digest, size, content_type)
+
+    async def stat(self, digest: str) -> Optional[StoredObject]:
+        return await self.backend.stat(digest)
+
+    async def release(self, digest: str) -> bool:
+        return await self.backend.release(digest)
+
+    async def serve(self, request: Request, digest: str, filename: Optional[str] = None) -> Response:
+        """
+        Download response for a stored object, with ETag revalidation and
+        single byte ranges. Content never changes under a digest, so it is
+        cacheable forever.
+        """
+        try:
+            obj = await self.backend.stat(digest)
+        except ValueError:
+            obj = None
+        if obj is None:
+            raise HTTPException(status_code=404, detail="File not found")
+
+        url = await self.backend.url(digest, filename)
+        if url is not None:
+            return RedirectResponse(url, status_code=307)
+
+        etag = f'"{digest}"'
+        headers = {
+            "etag": etag,
+            "accept-ranges": "bytes",
+            "cache-control": "public, max-age=31536000, immutable",
+        }
+        if filename:
+            safe = "".join(c for c in filename if c.isprintable() and c not in '"\\')
+            headers["content-disposition"] = f'attachment; filename="{safe}"'
+
+        if_none_match = request.headers.get("if-none-match", "")
+        if if_none_match == "*" or etag in [tag.strip() for tag in if_none_match.split(",")]:
+            return Response(status_code=304, headers=headers)
+
+        range_header = request.headers.get("range")
+        if_range = request.headers.get("if-range")
+        if if_range and if_range != etag:
+            range_header = None
+
+        try:
+            byte_range = parse_range(range_header, obj.size)
+        except ValueError:
+            return Response(status_code=416, headers={**headers, "content-range": f"bytes */{obj.size}"})
+
+        if byte_range is None:
+            return StoredObjectResponse(obj, self.backend, 0, obj.size - 1, headers=headers)
+
+        start, end = byte_range
+        headers["content-range"] = f"bytes {start}-{end}/{obj.size}"
+        return StoredObjectResponse(obj, self.backend, start, end, status_code=206, headers=headers)
+
+
+# Singleton Instance
+storage = Storage()
@@ -0,0 +1,44 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import AsyncIterator, Optional
+
+
+@dataclass
+class StoredObject:
+    digest: str
+    size: int
+    content_type: Optional[str] = None
+    # Local file, when the backend has one (served with sendfile)
+    path: Optional[str] = None
+
+
+class BaseStorageBackend(ABC):
+    # Where uploads are staged before put(); same filesystem keeps put() a rename
+    staging_dir: str
+
+    @abstractmethod
+    async def put(
+        self, source: str, digest: str, size: int, content_type: Optional[str] = None
+    ) -> StoredObject:
+        """Takes ownership of the finished file at ``source`` and adds a reference."""
+        pass
+
+    @abstractmethod
+    async def stat(self, digest: str) -> Optional[StoredObject]:
+        pass
+
+    @abstractmethod
+    async def release(self, digest: str) -> bool:
+        """Drops a reference; True when that was the last one and the content is gone."""
+        pass
+
+    @abstractmethod
+    def iter_range(
+        self, digest: str, start: int, end: int, chunk_size: int
+    ) -> AsyncIterator[bytes]:
+        """Bytes ``start`` to ``end`` (inclusive) of the content."""
+        pass
+
+    async def url(self, digest: str, filename: Optional[str] = None) -> Optional[str]:
+        """Direct download URL that bypasses the application, if the backend has one."""
+        return None
@@ -0,0 +1,125 @@
+import json
+import os
+import threading
+from contextlib import contextmanager
+from typing import AsyncIterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process locking, single worker only
+    fcntl = None
+
+from core.tasks import run_in_thread
+from .base import BaseStorageBackend, StoredObject
+
+
+class LocalStorageBackend(BaseStorageBackend):
+    """
+    Content-addressed directory: ``root/ab/cd/<sha256>`` plus a JSON sidecar
+    with the reference count. Identical uploads share one file. Counts are
+    updated under a per-shard lock shared by every worker.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        self.staging_dir = os.path.join(root, "tmp")
+        os.makedirs(self.staging_dir, exist_ok=True)
+        self._thread_lock = threading.Lock()
+
+    def _paths(self, digest: str):
+        if len(digest) < 4 or not digest.isalnum():
+            raise ValueError(f"Invalid digest '{digest}'")
+        shard = os.path.join(self.root, digest[:2], digest[2:4])
+        return shard, os.path.join(shard, digest), os.path.join(shard, f"{digest}.json")
+
+    @contextmanager
+    def _locked(self, shard: str):
+        if fcntl is None:
+            with self._thread_lock:
+                yield
+            return
+        with open(os.path.join(shard, ".lock"), "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _read_meta(self, meta: str) -> Optional[dict]:
+        try:
+            with open(meta) as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def _write_meta(self, meta: str, state: dict) -> None:
+        partial = f"{meta}.part"
+        with open(partial, "w") as f:
+            json.dump(state, f)
+        os.replace(partial, meta)
+
+    def _put(self, source: str, digest: str, size: int, content_type: Optional[str]) -> StoredObject:
+        shard, path, meta = self._paths(digest)
+        os.makedirs(shard, exist_ok=True)
+        with self._locked(shard):
+            state = self._read_meta(meta)
+            if state is not None and os.path.exists(path):
+                state["refs"] += 1
+                os.remove(source)
+            else:
+                os.replace(source, path)
+                state = {"refs": 1, "size": size, "content_type": content_type}
+            self._write_meta(meta, state)
+        return StoredObject(digest, state["size"], state["content_type"], path)
+
+    async def put(
+        self, source: str, digest: str, size: int, content_type: Optional[str] = None
+    ) -> StoredObject:
+        return await run_in_thread(self._put, source, digest, size, content_type)
+
+    def _stat(self, digest: str) -> Optional[StoredObject]:
+        _, path, meta = self._paths(digest)
+        state = self._read_meta(meta)
+        if state is None or not os.path.exists(path):
+            return None
+        return StoredObject(digest, state["size"], state["content_type"], path)
+
+    async def stat(self, digest: str) -> Optional[StoredObject]:
+        return await run_in_thread(self._stat, digest)
+
+    def _release(self, digest: str) -> bool:
+        shard, path, meta = self._paths(digest)
+        if not os.path.isdir(shard):
+            return False
+        with self._locked(shard):
+            state = self._read_meta(meta)
+            if state is None:
+                return False
+            state["refs"] -= 1
+            if state["refs"] > 0:
+                self._write_meta(meta, state)
+                return False
+            for leftover in (path, meta):
+                if os.path.exists(leftover):
+                    os.remove(leftover)
+            return True
+
+    async def release(self, digest: str) -> bool:
+        return await run_in_thread(self._release, digest)
+
+    async def iter_range(
+        self, digest: str, start: int, end: int, chunk_size: int
+    ) -> AsyncIterator[bytes]:
+        _, path, _ = self._paths(digest)
+        f = await run_in_thread(open, path, "rb")
+        try:
+            await run_in_thread(f.seek, start)
+            remaining = end - start + 1
+            while remaining > 0:
+                chunk = await run_in_thread(f.read, min(chunk_size, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                yield chunk
+        finally:
+            await run_in_thread(f.close)
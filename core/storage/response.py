@@ -0,0 +1,81 @@
+from typing import Optional, Tuple
+
+from starlette.responses import Response
+from starlette.types import Receive, Scope, Send
+
+from .base import BaseStorageBackend, StoredObject
+
+
+def parse_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """
+    Single ``bytes=`` range as inclusive (start, end); None for the whole
+    content (no header, or several ranges, which may be answered in full).
+    Raises ValueError when the range can't be satisfied.
+    """
+    if not header or not header.startswith("bytes=") or "," in header:
+        return None
+    first, _, last = header[len("bytes="):].strip().partition("-")
+    try:
+        if not first:
+            length = int(last)
+            if length <= 0:
+                raise ValueError("Empty suffix range")
+            return max(0, size - length), size - 1
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+    except ValueError:
+        raise ValueError(f"Invalid range '{header}'")
+    if start >= size or end < start:
+        raise ValueError(f"Range '{header}' outside of {size} bytes")
+    return start, end
+
+
+class StoredObjectResponse(Response):
+    """
+    Streams (part of) a stored object. Local files go out with the server's
+    zero-copy sendfile when it offers the ``http.response.zerocopysend``
+    ASGI extension, otherwise in chunks read off the event loop.
+    """
+
+    chunk_size = 256 * 1024
+
+    def __init__(
+        self,
+        obj: StoredObject,
+        backend: BaseStorageBackend,
+        start: int,
+        end: int,
+        status_code: int = 200,
+        headers: Optional[dict] = None,
+    ):
+        super().__init__(
+            status_code=status_code,
+            headers=headers,
+            media_type=obj.content_type or "application/octet-stream",
+        )
+        self.obj = obj
+        self.backend = backend
+        self.start = start
+        self.end = end
+        self.headers["content-length"] = str(max(0, end - start + 1))
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+        if scope.get("method") == "HEAD" or self.end < self.start:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+            return
+
+        if self.obj.path and "http.response.zerocopysend" in scope.get("extensions", {}):
+            with open(self.obj.path, "rb") as f:
+                await send({
+                    "type": "http.response.zerocopysend",
+                    "file": f,
+                    "offset": self.start,
+                    "count": self.end - self.start + 1,
+                    "more_body": False,
+                })
+            return
+
+        async for chunk in self.backend.iter_range(self.obj.digest, self.start, self.end, self.chunk_size):
+            await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
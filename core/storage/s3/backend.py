@@ -0,0 +1,151 @@
+import os
+import tempfile
+import uuid
+from typing import AsyncIterator, Optional
+
+import boto3
+from botocore.exceptions import ClientError
+
+from core.tasks import run_in_thread
+from ..base import BaseStorageBackend, StoredObject
+
+
+class S3StorageBackend(BaseStorageBackend):
+    """
+    Content-addressed objects in an S3-compatible bucket (AWS, MinIO, ...).
+
+    Every reference is its own empty object under ``refs/<digest>/``, so
+    adding one never races another writer. A release racing a release can
+    only leave content behind. A release racing a put is narrowed from both
+    sides: the release lists the references again before deleting content,
+    and the put checks the content is still there once its reference exists.
+    """
+
+    def __init__(
+        self,
+        bucket: str,
+        prefix: str = "objects",
+        endpoint_url: Optional[str] = None,
+        region: Optional[str] = None,
+        access_key: Optional[str] = None,
+        secret_key: Optional[str] = None,
+        presign_seconds: int = 0,
+    ):
+        self.bucket = bucket
+        self.prefix = prefix.strip("/")
+        self.presign_seconds = presign_seconds
+        self.staging_dir = tempfile.gettempdir()
+        self._client = boto3.client(
+            "s3",
+            endpoint_url=endpoint_url or None,
+            region_name=region or None,
+            aws_access_key_id=access_key or None,
+            aws_secret_access_key=secret_key or None,
+        )
+        # Check the bucket, as the cache checks Redis: fail at boot
+        self._client.head_bucket(Bucket=bucket)
+
+    def _key(self, digest: str) -> str:
+        if len(digest) < 4 or not digest.isalnum():
+            raise ValueError(f"Invalid digest '{digest}'")
+        return f"{self.prefix}/{digest[:2]}/{digest[2:4]}/{digest}"
+
+    def _refs(self, digest: str) -> str:
+        return f"{self.prefix}/refs/{digest}/"
+
+    def _head(self, digest: str) -> Optional[dict]:
+        try:
+            return self._client.head_object(Bucket=self.bucket, Key=self._key(digest))
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return None
+            raise
+
+    def _put(self, source: str, digest: str, size: int, content_type: Optional[str]) -> StoredObject:
+        try:
+            # Reference first: a concurrent last release then keeps the content
+            self._client.put_object(
+                Bucket=self.bucket, Key=f"{self._refs(digest)}{uuid.uuid4().hex}", Body=b""
+            )
+            extra = {"ContentType": content_type} if content_type else {}
+            head = self._head(digest)
+            if head is None:
+                # Multipart for large files, read from disk part by part
+                self._client.upload_file(source, self.bucket, self._key(digest), ExtraArgs=extra)
+            else:
+                size = head["ContentLength"]
+                content_type = head.get("ContentType")
+                # A release that listed the references before ours was written
+                # may have deleted the content since; the source is still here
+                if self._head(digest) is None:
+                    self._client.upload_file(
+                        source, self.bucket, self._key(digest), ExtraArgs=extra
+                    )
+        finally:
+            os.remove(source)
+        return StoredObject(digest, size, content_type)
+
+    async def put(
+        self, source: str, digest: str, size: int, content_type: Optional[str] = None
+    ) -> StoredObject:
+        return await run_in_thread(self._put, source, digest, size, content_type)
+
+    async def stat(self, digest: str) -> Optional[StoredObject]:
+        head = await run_in_thread(self._head, digest)
+        if head is None:
+            return None
+        return StoredObject(digest, head["ContentLength"], head.get("ContentType"))
+
+    def _release(self, digest: str) -> bool:
+        listing = self._client.list_objects_v2(
+            Bucket=self.bucket, Prefix=self._refs(digest), MaxKeys=2
+        )
+        refs = listing.get("Contents", [])
+        if not refs:
+            return False
+        self._client.delete_object(Bucket=self.bucket, Key=refs[0]["Key"])
+        if len(refs) > 1:
+            return False
+        # A put may have added its reference since the first listing
+        listing = self._client.list_objects_v2(
+            Bucket=self.bucket, Prefix=self._refs(digest), MaxKeys=1
+        )
+        if listing.get("Contents"):
+            return False
+        self._client.delete_object(Bucket=self.bucket, Key=self._key(digest))
+        return True
+
+    async def release(self, digest: str) -> bool:
+        return await run_in_thread(self._release, digest)
+
+    async def iter_range(
+        self, digest: str, start: int, end: int, chunk_size: int
+    ) -> AsyncIterator[bytes]:
+        response = await run_in_thread(
+            self._client.get_object,
+            Bucket=self.bucket,
+            Key=self._key(digest),
+            Range=f"bytes={start}-{end}",
+        )
+        body = response["Body"]
+        try:
+            while True:
+                chunk = await run_in_thread(body.read, chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            body.close()
+
+    async def url(self, digest: str, filename: Optional[str] = None) -> Optional[str]:
+        if not self.presign_seconds:
+            return None
+        params = {"Bucket": self.bucket, "Key": self._key(digest)}
+        if filename:
+            params["ResponseContentDisposition"] = f'attachment; filename="{filename}"'
+        return await run_in_thread(
+            self._client.generate_presigned_url,
+            "get_object",
+            Params=params,
+            ExpiresIn=self.presign_seconds,
+        )
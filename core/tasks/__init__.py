@@ -0,0 +1,316 @@
+import asyncio
+import multiprocessing
+import os
+import time
+import uuid
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from prometheus_client import Counter, Gauge, Histogram
+
+from core.config.globals import settings
+
+T = TypeVar("T")
+
+
+# Define Prometheus metrics
+TASKS_QUEUE_DEPTH = Gauge(
+    "tasks_queue_depth",
+    "Tasks waiting for a free worker per pool",
+    ["pool"],
+)
+
+TASKS_BUSY = Gauge(
+    "tasks_busy_workers",
+    "Workers running a task per pool",
+    ["pool"],
+)
+
+TASKS_UTILIZATION = Gauge(
+    "tasks_pool_utilization",
+    "Busy workers over pool size",
+    ["pool"],
+)
+
+TASKS_TOTAL = Counter(
+    "tasks_total",
+    "Finished tasks per pool by result",
+    ["pool", "result"],
+)
+
+TASK_DURATION = Histogram(
+    "task_duration_seconds",
+    "Task duration per pool, including the wait for a worker",
+    ["pool"],
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+
+
+class TaskQueueFull(RuntimeError):
+    pass
+
+
+def _mp_context():
+    # forkserver children start from a clean interpreter instead of a copy of
+    # a threaded worker (open sockets, locks held by other threads)
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+def default_cpu_workers() -> int:
+    """
+    Process pool size of one web worker: the cores shared out between the
+    web workers, so the pools of every worker together match the machine.
+    """
+    cores = os.cpu_count() or 1
+    return max(1, cores // (settings.WEB_WORKERS or cores))
+
+
+class Pool:
+    """
+    Named executor with a bounded number of running tasks; callers beyond
+    that wait on the event loop, where the backlog is measurable.
+    """
+
+    def __init__(self, name: str, kind: str, workers: int):
+        if kind not in ("process", "thread"):
+            raise ValueError(f"Unknown pool kind '{kind}'")
+        self.name = name
+        self.kind = kind
+        self.workers = max(1, workers)
+        self.busy = 0
+        self._executor: Optional[Executor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    @property
+    def executor(self) -> Executor:
+        # Created on first use, so gunicorn workers never inherit the parent's pool
+        if self._executor is None:
+            if self.kind == "process":
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=_mp_context()
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix=f"tasks-{self.name}"
+                )
+        return self._executor
+
+    def _set_busy(self, delta: int) -> None:
+        self.busy += delta
+        TASKS_BUSY.labels(pool=self.name).set(self.busy)
+        TASKS_UTILIZATION.labels(pool=self.name).set(self.busy / self.workers)
+
+    def _finished(self) -> None:
+        self._set_busy(-1)
+        self._slots.release()
+
+    async def run(self, fn: Callable[..., T], args: tuple, kwargs: dict, timeout: Optional[float]) -> T:
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.workers)
+
+        started = time.perf_counter()
+        TASKS_QUEUE_DEPTH.labels(pool=self.name).inc()
+        try:
+            await self._slots.acquire()
+        finally:
+            TASKS_QUEUE_DEPTH.labels(pool=self.name).dec()
+
+        loop = asyncio.get_running_loop()
+        try:
+            future = self.executor.submit(fn, *args, **kwargs)
+        except BaseException:
+            self._slots.release()
+            raise
+        self._set_busy(1)
+
+        def done(_):
+            # The slot frees when the work really stops, not when the caller gives up
+            try:
+                loop.call_soon_threadsafe(self._finished)
+            except RuntimeError:
+                pass  # Loop already closed
+
+        future.add_done_callback(done)
+
+        result = "success"
+        try:
+            # Cancelling the wrapper cancels the task if it has not started yet
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except asyncio.TimeoutError:
+            result = "timeout"
+            raise
+        except asyncio.CancelledError:
+            result = "cancelled"
+            raise
+        except BrokenProcessPool:
+            # A worker died (e.g. OOM killed); the next task gets a fresh pool
+            result = "error"
+            self._executor = None
+            raise
+        except Exception:
+            result = "error"
+            raise
+        finally:
+            TASKS_TOTAL.labels(pool=self.name, result=result).inc()
+            TASK_DURATION.labels(pool=self.name).observe(time.perf_counter() - started)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+@dataclass
+class TaskRecord:
+    id: str
+    pool: str
+    name: str
+    status: str = "pending"  # pending, done, failed, timeout, cancelled
+    created_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+    result: Any = None
+    error: Optional[str] = None
+    task: Optional[asyncio.Task] = field(default=None, repr=False)
+
+
+class TaskRunner:
+    """
+    Offloads blocking work from the event loop to named pools: "cpu"
+    (processes, for pure-Python CPU work) and "threads" (for libraries that
+    release the GIL or block on I/O). Process pool functions and arguments
+    must be picklable, i.e. defined at module level.
+
+    Fire-and-forget tasks keep their result for TASKS_RESULT_TTL_SECONDS in
+    this process only; work that must run once across workers belongs in
+    core.jobs.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(TaskRunner, cls).__new__(cls)
+            cls._instance._initialize()
+        return cls._instance
+
+    def _initialize(self):
+        self.pools: Dict[str, Pool] = {}
+        self.records: Dict[str, TaskRecord] = {}
+        self.register_pool("cpu", "process", settings.TASKS_CPU_WORKERS or default_cpu_workers())
+        self.register_pool("threads", "thread", settings.TASKS_THREAD_WORKERS)
+
+    def register_pool(self, name: str, kind: str, workers: int) -> Pool:
+        if name in self.pools:
+            raise ValueError(f"Task pool '{name}' already registered")
+        self.pools[name] = Pool(name, kind, workers)
+        return self.pools[name]
+
+    def pool(self, name: str) -> Pool:
+        pool = self.pools.get(name)
+        if pool is None:
+            raise KeyError(f"Unknown task pool '{name}'")
+        return pool
+
+    async def run(
+        self, pool: str, fn: Callable[..., T], *args, timeout: Optional[float] = None, **kwargs
+    ) -> T:
+        return await self.pool(pool).run(fn, args, kwargs, timeout)
+
+    # --- Fire-and-forget ---
+
+    def submit(
+        self, pool: str, fn: Callable[..., Any], *args, timeout: Optional[float] = None, **kwargs
+    ) -> str:
+        """Schedules ``fn`` and returns a task id for ``status``/``result``/``cancel``."""
+        self._prune()
+        pending = sum(1 for record in self.records.values() if record.status == "pending")
+        if pending >= settings.TASKS_MAX_PENDING:
+            raise TaskQueueFull(f"{pending} tasks pending")
+
+        record = TaskRecord(
+            id=uuid.uuid4().hex,
+            pool=self.pool(pool).name,
+            name=getattr(fn, "__qualname__", repr(fn)),
+        )
+        record.task = asyncio.create_task(self._track(record, fn, args, kwargs, timeout))
+        record.task.add_done_callback(lambda task: self._settle(record, task))
+        self.records[record.id] = record
+        return record.id
+
+    async def _track(self, record: TaskRecord, fn, args, kwargs, timeout) -> Any:
+        try:
+            record.result = await self.pools[record.pool].run(fn, args, kwargs, timeout)
+            record.status = "done"
+            return record.result
+        except asyncio.TimeoutError:
+            record.status = "timeout"
+            raise
+        except asyncio.CancelledError:
+            record.status = "cancelled"
+            raise
+        except Exception as e:
+            record.status = "failed"
+            record.error = str(e)
+            raise
+        finally:
+            record.finished_at = time.time()
+
+    def _settle(self, record: TaskRecord, task: asyncio.Task) -> None:
+        if task.cancelled():
+            # Cancelled before _track started, it never saw the cancellation
+            if record.status == "pending":
+                record.status = "cancelled"
+                record.finished_at = time.time()
+            return
+        # Outcomes live in the record; don't warn about unretrieved exceptions
+        task.exception()
+
+    def _prune(self) -> None:
+        expired = time.time() - settings.TASKS_RESULT_TTL_SECONDS
+        for task_id in [
+            task_id
+            for task_id, record in self.records.items()
+            if record.finished_at is not None and record.finished_at < expired
+        ]:
+            del self.records[task_id]
+
+    def status(self, task_id: str) -> Optional[TaskRecord]:
+        return self.records.get(task_id)
+
+    async def result(self, task_id: str, timeout: Optional[float] = None) -> Any:
+        """Waits for the task (up to ``timeout``) and returns or raises its outcome."""
+        record = self.records.get(task_id)
+        if record is None:
+            raise KeyError(f"Unknown task '{task_id}'")
+        # Shielded: a caller giving up does not cancel the task
+        return await asyncio.wait_for(asyncio.shield(record.task), timeout)
+
+    def cancel(self, task_id: str) -> bool:
+        """Cancels a task; one already running in a worker runs to completion."""
+        record = self.records.get(task_id)
+        if record is None or record.task.done():
+            return False
+        return record.task.cancel()
+
+    def shutdown(self) -> None:
+        for record in self.records.values():
+            if record.task is not None and not record.task.done():
+                record.task.cancel()
+        for pool in self.pools.values():
+            pool.shutdown()
+
+
+# Singleton Instance
+task_runner = TaskRunner()
+
+
+async def run_cpu(fn: Callable[..., T], *args, timeout: Optional[float] = None, **kwargs) -> T:
+    """Runs a picklable, module-level function in the process pool."""
+    return await task_runner.run("cpu", fn, *args, timeout=timeout, **kwargs)
+
+
+async def run_in_thread(fn: Callable[..., T], *args, timeout: Optional[float] = None, **kwargs) -> T:
+    return await task_runner.run("threads", fn, *args, timeout=timeout, **kwargs)
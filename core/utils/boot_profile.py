@@ -0,0 +1,69 @@
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+class BootProfiler:
+    """
+    Wall-clock timings of the boot phases. Kept dependency free so main.py
+    can import it before anything heavy; ``python cli.py profile:startup``
+    reads it back together with the import times.
+
+    Linear top-level phases are delimited with ``begin``/``end``; nested
+    work is timed with the ``phase`` context manager.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(BootProfiler, cls).__new__(cls)
+            cls._instance._initialize()
+        return cls._instance
+
+    def _initialize(self):
+        self.origin = time.perf_counter()
+        self.records: List[Dict[str, Any]] = []
+        self._stack: List[str] = []
+        self._segment: Optional[Tuple[str, float]] = None
+
+    def _record(self, path: Tuple[str, ...], started: float) -> None:
+        self.records.append(
+            {
+                "phase": ";".join(path),
+                "start_ms": round((started - self.origin) * 1000, 3),
+                "duration_ms": round((time.perf_counter() - started) * 1000, 3),
+            }
+        )
+
+    def begin(self, name: str) -> None:
+        self.end()
+        self._stack.append(name)
+        self._segment = (name, time.perf_counter())
+
+    def end(self) -> None:
+        if self._segment is None:
+            return
+        name, started = self._segment
+        self._segment = None
+        path = tuple(self._stack)
+        self._stack.pop()
+        self._record(path, started)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        self._stack.append(name)
+        path = tuple(self._stack)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._stack.pop()
+            self._record(path, started)
+
+    def report(self) -> List[Dict[str, Any]]:
+        return sorted(self.records, key=lambda record: record["start_ms"])
+
+
+# Singleton Instance
+boot_profiler = BootProfiler()
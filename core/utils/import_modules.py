@@ -1,81 +1,112 @@
-import os
-from importlib import import_module
 from fastapi import APIRouter, Depends
 from core.middlewares.role_verify import ROLE_VERIFY
-import asyncio
+from core.middlewares.quota_verify import QUOTA_VERIFY
 from core.database import SessionAsync
-from app.modules.permissions.services import create_permissions_api
+from app.modules.permissions.services import create_permissions_api, grant_routes_to_role
+from app.modules.permissions.const import api_type
+from core.utils.module_registry import registry, lazy_modules
+
+
+def module_quotas(module, scope: str) -> list:
+    """
+    Controllers can declare ``QUOTAS = {"*": Quota(...), "<route name>": Quota(...)}``;
+    they are enforced ahead of the role check.
+    """
+    quotas = getattr(module, "QUOTAS", None)
+    if not quotas:
+        return []
+    return [Depends(QUOTA_VERIFY(scope, quotas))]
+
+
+def module_dependencies(module, module_name: str) -> list:
+    return [
+        *module_quotas(module, module_name),
+        *([Depends(ROLE_VERIFY())] if module_name != "auth" else []),
+    ]
+
+
+def _include_lazy(module_name: str, route_prefix: str):
+    """
+    Mounts a ``LAZY = True`` module on the application the first time one of
+    its routes is requested, once its permissions are created and granted to
+    the owner role.
+    """
+
+    async def include(module, app, mount_prefix: str):
+        router = APIRouter()
+        router.include_router(
+            module.router,
+            prefix=route_prefix,
+            dependencies=module_dependencies(module, module_name),
+        )
+        # Permissions exist and belong to the owner before the first request
+        # is routed, otherwise ROLE_VERIFY refuses it
+        await create_permissions_api(router.routes, SessionAsync, api_type)
+        await grant_routes_to_role(router.routes, SessionAsync, api_type, "owner")
+
+        app.include_router(router, prefix=mount_prefix)
+        app.openapi_schema = None
+
+    return include
 
 
 def import_modules(router: APIRouter, base_path: str = "app/modules", prefix: str = ""):
-    for root, dirs, files in os.walk(base_path):
-        if "controller.py" in files:
-            # Normalize path to use dots for Python indexing
-            normalized_root = root.replace("\\", "/").replace("/", ".")
-            normalized_base = base_path.replace("\\", "/").replace("/", ".")
-            
-            # Extract module name relative to base_path
-            if normalized_root.startswith(normalized_base):
-                # Remove base_path prefix and leading dot
-                module_name = normalized_root[len(normalized_base):].lstrip(".")
-                # Use the normalized path for import_module
-                module_import_path = normalized_root
-            else:
-                # Fallback: skip this directory if it doesn't match expected pattern
-                print(f"Skipping unexpected path: {root}")
-                continue
-            try:
-                module = import_module(f"{module_import_path}.controller")
-                route_prefix = f"{prefix}/{module_name.replace('.', '/')}"
-                router.include_router(
-                    module.router,
-                    prefix=route_prefix,
-                    dependencies=(
-                        [Depends(ROLE_VERIFY())] if module_name != "auth" else []
-                    ),
-                )
-                print(f"Importing API module: {module_name}")
-            except Exception as e:
-                print(f"Error importing API module {module_name}: {e}")
+    for entry in registry.discover(base_path, "controller.py"):
+        module_name = entry.name
+        route_prefix = f"{prefix}/{module_name.replace('.', '/')}"
+
+        if entry.lazy:
+            lazy_modules.register(route_prefix, entry, _include_lazy(module_name, route_prefix))
+            print(f"Deferring API module: {module_name}")
+            continue
+
+        try:
+            module = registry.load(entry)
+            router.include_router(
+                module.router,
+                prefix=route_prefix,
+                dependencies=module_dependencies(module, module_name),
+            )
+            print(f"Importing API module: {module_name}")
+        except Exception as e:
+            print(f"Error importing API module {module_name}: {e}")
 
     return [{"routes": router.routes.copy(), "type": "API"}]
 
 
 def import_webhooks(router: APIRouter, base_path: str = "app/webhooks/in", prefix: str = ""):
-    for root, dirs, files in os.walk(base_path):
-        if "controller.py" in files:
-            normalized_root = root.replace("\\", "/").replace("/", ".")
-            normalized_base = base_path.replace("\\", "/").replace("/", ".")
-            
-            if normalized_root.startswith(normalized_base):
-                module_name = normalized_root[len(normalized_base):].lstrip(".")
-                module_import_path = normalized_root
-            else:
-                continue
-            try:
-                module = import_module(f"{module_import_path}.controller")
-                route_prefix = f"{prefix}/{module_name.replace('.', '/')}"
-                router.include_router(
-                    module.router,
-                    prefix=route_prefix,
-                    dependencies=[], # No authentication for webhooks
-                )
-                print(f"Importing Webhook module: {module_name}")
-            except Exception as e:
-                print(f"Error importing Webhook module {module_name}: {e}")
+    for entry in registry.discover(base_path, "controller.py"):
+        module_name = entry.name
+        try:
+            module = registry.load(entry)
+            route_prefix = f"{prefix}/{module_name.replace('.', '/')}"
+            router.include_router(
+                module.router,
+                prefix=route_prefix,
+                # No authentication for webhooks
+                dependencies=module_quotas(module, f"webhook.{module_name}"),
+            )
+            print(f"Importing Webhook module: {module_name}")
+        except Exception as e:
+            print(f"Error importing Webhook module {module_name}: {e}")
 
     return [{"routes": router.routes.copy(), "type": "Webhook"}]
 
 
 def load_subscribers(base_path: str = "app/webhooks/out"):
-    for root, dirs, files in os.walk(base_path):
-        if "subscriber.py" in files:
-            # Use relative path from current working directory to calculate module path
-            rel_path = os.path.relpath(root, os.getcwd())
-            normalized_root = rel_path.replace("\\", "/").replace("/", ".")
-            module_path = f"{normalized_root}.subscriber"
-            try:
-                import_module(module_path)
-                print(f"Loaded webhook subscriber: {module_path}")
-            except Exception as e:
-                print(f"Error loading webhook subscriber {module_path}: {e}")
+    for entry in registry.discover(base_path, "subscriber.py"):
+        try:
+            registry.load(entry)
+            print(f"Loaded webhook subscriber: {entry.import_path}")
+        except Exception as e:
+            print(f"Error loading webhook subscriber {entry.import_path}: {e}")
+
+
+def load_jobs(base_path: str = "app/modules"):
+    # Importing a module's jobs.py registers its @scheduled functions
+    for entry in registry.discover(base_path, "jobs.py"):
+        try:
+            registry.load(entry)
+            print(f"Loaded jobs: {entry.import_path}")
+        except Exception as e:
+            print(f"Error loading jobs {entry.import_path}: {e}")
@@ -0,0 +1,278 @@
+import ast
+import asyncio
+import json
+import os
+import time
+from dataclasses import asdict, dataclass, field
+from importlib import import_module
+from types import ModuleType
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+
+MANIFEST_PATH = ".module_manifest.json"
+MANIFEST_VERSION = 1
+
+
+@dataclass
+class ModuleEntry:
+    name: str
+    import_path: str
+    file: str
+    imports: List[str] = field(default_factory=list)
+    lazy: bool = False
+
+
+def _to_dotted(path: str) -> str:
+    return os.path.normpath(path).replace("\\", "/").replace("/", ".")
+
+
+def _parse_entry(file: str) -> Tuple[List[str], bool]:
+    """
+    Reads the imports of an entry file and whether it declares
+    ``LAZY = True`` at top level, without importing it.
+    """
+    try:
+        with open(file, "rb") as f:
+            tree = ast.parse(f.read(), filename=file)
+    except (OSError, SyntaxError):
+        return [], False
+
+    imports: List[str] = []
+    lazy = False
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            imports.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+            imports.append(node.module)
+        elif isinstance(node, ast.Assign):
+            for target in node.targets:
+                if (
+                    isinstance(target, ast.Name)
+                    and target.id == "LAZY"
+                    and isinstance(node.value, ast.Constant)
+                ):
+                    lazy = bool(node.value.value)
+    return imports, lazy
+
+
+class ModuleRegistry:
+    """
+    Single place where the loaders (API modules, webhooks, subscribers,
+    admin templates, sockets and plugins) discover and import code.
+
+    Discovery results are kept in a manifest keyed by the mtimes of the
+    scanned directories and entry files, so a warm boot only stats paths
+    instead of walking trees and parsing files. Entries come back in
+    dependency order (from their imports) and every import is timed.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(ModuleRegistry, cls).__new__(cls)
+            cls._instance._initialize()
+        return cls._instance
+
+    def _initialize(self):
+        self._manifest: Dict[str, Any] = self._read_manifest()
+        self.timings: Dict[str, float] = {}
+        self.discovery_time = 0.0
+
+    # --- Manifest ---
+
+    def _read_manifest(self) -> Dict[str, Any]:
+        try:
+            with open(MANIFEST_PATH) as f:
+                manifest = json.load(f)
+            if manifest.get("version") == MANIFEST_VERSION:
+                return manifest
+        except (OSError, ValueError):
+            pass
+        return {"version": MANIFEST_VERSION, "scans": {}}
+
+    def _write_manifest(self) -> None:
+        try:
+            with open(MANIFEST_PATH, "w") as f:
+                json.dump(self._manifest, f)
+        except OSError as e:
+            print(f"[ModuleRegistry] Could not write manifest: {e}")
+
+    @staticmethod
+    def _is_fresh(mtimes: Dict[str, int]) -> bool:
+        try:
+            return all(os.stat(path).st_mtime_ns == mtime for path, mtime in mtimes.items())
+        except OSError:
+            return False
+
+    # --- Discovery ---
+
+    def _scan(
+        self, base_path: str, entry_file: str, recursive: bool
+    ) -> Tuple[List[ModuleEntry], Dict[str, int]]:
+        entries: List[ModuleEntry] = []
+        mtimes: Dict[str, int] = {}
+        if not os.path.isdir(base_path):
+            return entries, mtimes
+
+        base_dotted = _to_dotted(base_path)
+        for root, dirs, files in os.walk(base_path):
+            dirs[:] = sorted(d for d in dirs if d != "__pycache__")
+            mtimes[root] = os.stat(root).st_mtime_ns
+
+            if root != base_path and entry_file in files:
+                file = os.path.join(root, entry_file)
+                mtimes[file] = os.stat(file).st_mtime_ns
+                dotted = _to_dotted(root)
+                module = entry_file[:-3]
+                imports, lazy = _parse_entry(file)
+                entries.append(
+                    ModuleEntry(
+                        name=dotted[len(base_dotted):].lstrip("."),
+                        import_path=dotted if module == "__init__" else f"{dotted}.{module}",
+                        file=file,
+                        imports=imports,
+                        lazy=lazy,
+                    )
+                )
+
+            if not recursive:
+                # First level only: keep walking the children, not grandchildren
+                if root != base_path:
+                    dirs[:] = []
+
+        return entries, mtimes
+
+    def discover(
+        self, base_path: str, entry_file: str, recursive: bool = True
+    ) -> List[ModuleEntry]:
+        """
+        Returns the directories under ``base_path`` containing ``entry_file``,
+        ordered so that modules imported by others come first.
+        """
+        started = time.perf_counter()
+        key = f"{base_path}::{entry_file}::{int(recursive)}"
+        cached = self._manifest["scans"].get(key)
+
+        if cached is not None and self._is_fresh(cached["mtimes"]):
+            entries = [ModuleEntry(**entry) for entry in cached["entries"]]
+        else:
+            entries, mtimes = self._scan(base_path, entry_file, recursive)
+            self._manifest["scans"][key] = {
+                "mtimes": mtimes,
+                "entries": [asdict(entry) for entry in entries],
+            }
+            self._write_manifest()
+
+        ordered = self._order(entries, _to_dotted(base_path))
+        self.discovery_time += time.perf_counter() - started
+        return ordered
+
+    @staticmethod
+    def _order(entries: List[ModuleEntry], base_dotted: str) -> List[ModuleEntry]:
+        by_name = {entry.name: entry for entry in entries}
+        names = sorted(by_name, key=len, reverse=True)
+
+        def dependencies(entry: ModuleEntry) -> List[str]:
+            found = set()
+            for imported in entry.imports:
+                if not imported.startswith(f"{base_dotted}."):
+                    continue
+                relative = imported[len(base_dotted) + 1:]
+                # Longest module name owning the imported path
+                for name in names:
+                    if name != entry.name and (relative == name or relative.startswith(f"{name}.")):
+                        found.add(name)
+                        break
+            return sorted(found)
+
+        ordered: List[ModuleEntry] = []
+        state: Dict[str, int] = {}
+
+        def visit(name: str):
+            # 1 = visiting, 2 = done; cycles fall back to alphabetical order
+            if state.get(name):
+                return
+            state[name] = 1
+            for dependency in dependencies(by_name[name]):
+                visit(dependency)
+            state[name] = 2
+            ordered.append(by_name[name])
+
+        for name in sorted(by_name):
+            visit(name)
+        return ordered
+
+    # --- Import ---
+
+    def load(self, entry: ModuleEntry) -> ModuleType:
+        """Imports an entry, recording the (inclusive) import time."""
+        started = time.perf_counter()
+        try:
+            return import_module(entry.import_path)
+        finally:
+            self.timings[entry.import_path] = time.perf_counter() - started
+
+    def report(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        ordered = sorted(self.timings.items(), key=lambda item: item[1], reverse=True)
+        return [
+            {"module": path, "ms": round(seconds * 1000, 2)}
+            for path, seconds in ordered[:limit]
+        ]
+
+    def print_report(self, limit: int = 15) -> None:
+        total = sum(self.timings.values())
+        print(
+            f"[ModuleRegistry] {len(self.timings)} modules imported in {total * 1000:.1f}ms "
+            f"(discovery {self.discovery_time * 1000:.1f}ms)"
+        )
+        for row in self.report(limit):
+            print(f"  {row['ms']:>9.2f}ms  {row['module']}")
+
+
+class LazyModules:
+    """
+    Modules declaring ``LAZY = True`` are registered here instead of being
+    imported at boot; the first request under their prefix imports them.
+    """
+
+    def __init__(self):
+        self.pending: Dict[str, Tuple[ModuleEntry, Callable[[ModuleType, Any, str], Awaitable[None]]]] = {}
+        self._lock = asyncio.Lock()
+
+    def register(
+        self,
+        route_prefix: str,
+        entry: ModuleEntry,
+        include: Callable[[ModuleType, Any, str], Awaitable[None]],
+    ) -> None:
+        self.pending[route_prefix] = (entry, include)
+
+    def _match(self, path: str) -> Optional[str]:
+        for route_prefix in self.pending:
+            if path == route_prefix or path.startswith(f"{route_prefix}/"):
+                return route_prefix
+        return None
+
+    async def load_for(self, path: str, app: Any, mount_prefix: str) -> None:
+        if self._match(path) is None:
+            return
+        async with self._lock:
+            route_prefix = self._match(path)
+            if route_prefix is None:
+                return
+            entry, include = self.pending.pop(route_prefix)
+            try:
+                module = registry.load(entry)
+                await include(module, app, mount_prefix)
+                print(f"[ModuleRegistry] Lazily loaded {entry.import_path} "
+                      f"in {registry.timings[entry.import_path] * 1000:.1f}ms")
+            except Exception as e:
+                # Retried on the next request under the prefix
+                self.pending[route_prefix] = (entry, include)
+                print(f"[ModuleRegistry] Error lazily loading {entry.import_path}: {e}")
+
+
+# Singleton Instances
+registry = ModuleRegistry()
+lazy_modules = LazyModules()
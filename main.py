@@ -1,7 +1,12 @@
 try:
+    from core.utils.boot_profile import boot_profiler
+
+    boot_profiler.begin("imports")
+
     from core.config.globals import settings
     import asyncio
     import os
+    from contextlib import asynccontextmanager
 
     from app.sockets import init_sockets
     from core.plugins.base import plugin_manager
@@ -27,16 +32,24 @@ try:
     import core.jobs as jobs
 
     import core.middlewares as middlewares
-    from admin.templates import init_admin
+    from admin.templates import init_admin, run_admin_startup
 
     from core.database import BaseAsync, BaseSync, SessionAsync, engineSync, get_async_db
 
     from core.routes import api_router, routes
 
-    from core.services.init_auth import init_auth
+    from core.services.init_auth import run_init_auth
+
+    from app.modules.auth.revocation import revocation_store
 
     from starlette.responses import Response
 
+    from core.utils.module_registry import registry
+
+    from core.assets import assets
+
+    boot_profiler.begin("app")
+
     version = "1.0.0"
     api_version = "v1"
 
@@ -51,13 +64,41 @@ try:
         openapi_url = "/openapi.json"
 
 
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        # Mirror revoked token ids and follow revocations from other workers
+        await revocation_store.start()
+
+        # Import-time work that needs the serving loop (workers import main
+        # before their loop starts, so nothing may be scheduled at import)
+        await BaseAsync.create_pending_views()
+
+        # Seeding runs in the background; /ready answers 503 until it is done.
+        # The admin menu is seeded and warmed once the roles exist
+        async def boot():
+            await run_init_auth([*routes, *admin_routes], SessionAsync)
+            await run_admin_startup()
+
+        init_auth_task = asyncio.create_task(boot())
+
+        # Every worker joins the election, the leader runs the scheduled jobs
+        await jobs.start()
+
+        async with plugin_manager.manage_lifespan(app):
+            yield
+
+        await jobs.stop()
+        init_auth_task.cancel()
+        await revocation_store.stop()
+
+
     app = FastAPI(
         title="FastAPI Template",
         version=version,
         docs_url=docs_url,
         redoc_url=redoc_url,
         openapi_url=openapi_url,
-        lifespan=plugin_manager.manage_lifespan,
+        lifespan=lifespan,
     )
 
 
@@ -110,11 +151,10 @@ try:
     app = middlewares.initialazer(app)
 
 
-    app = jobs.set_jobs(app)
-
-
     # Socket io (sio) create a Socket.IO server
 
+    boot_profiler.begin("sockets")
+
     socket_app = init_sockets(app)
     app.mount("/sio", socket_app)
 
@@ -122,9 +162,10 @@ try:
     app.mount("/public", StaticFiles(directory="app/public"))
 
 
-    # Node modules
+    # Fingerprinted assets used by the templates (node_modules is not exposed)
 
-    app.mount("/node_modules", StaticFiles(directory="node_modules"), name="node_modules")
+    assets.load()
+    app.mount(settings.STATIC_ASSETS_PREFIX, assets.app, name="assets")
 
 
     # Static files
@@ -134,18 +175,28 @@ try:
 
     # Jinja2 templates for admin panel
 
+    boot_profiler.begin("views")
+
     templates = Jinja2Templates(directory="admin/src")
+    templates.env.globals["asset"] = assets.url
 
     admin_routes = init_admin(templates, app)
 
     app.include_router(api_router, prefix=f"/api/{api_version}")
 
+    # Modules declaring LAZY = True are imported on their first request
+    app.add_middleware(middlewares.LazyModuleMiddleware, prefix=f"/api/{api_version}")
+
     # Database initialization models (Deprecated in favor of Alembic)
+    boot_profiler.begin("create_all")
     BaseSync.metadata.create_all(engineSync)
     BaseAsync.metadata.create_all(engineSync)
 
 
-    asyncio.ensure_future(init_auth([*routes, *admin_routes], SessionAsync))
+    boot_profiler.end()
+
+    # Startup profile: slowest module imports
+    registry.print_report()
 
 
 except Exception as e:
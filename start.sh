@@ -9,4 +9,12 @@ cd $DIR
 
 ls
 
-exec uvicorn main:app --host 0.0.0.0 --port  8000 --reload
+if [ "$MODE" = "DEVELOPMENT" ]; then
+    exec uvicorn main:app --host 0.0.0.0 --port  8000 --reload
+fi
+
+# Production: fingerprinted, precompressed assets (see cli.py static:build)
+python cli.py static:build
+
+# Production: gunicorn master with one uvicorn worker per CPU (see cli.py serve)
+exec python cli.py serve
@@ -0,0 +1,35 @@
+import asyncio
+
+from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+
+import core.jobs
+from core.jobs import scheduled
+
+
+@scheduled("interval", id="tests.keep_schedule", minutes=10)
+async def keep_schedule():
+    pass
+
+
+def test_new_leader_keeps_the_stored_next_run_time(monkeypatch, tmp_path):
+    url = f"sqlite:///{tmp_path / 'jobs.sqlite'}"
+
+    async def lead() -> object:
+        # A fresh scheduler over the shared store, as in another process
+        monkeypatch.setattr(
+            core.jobs, "scheduler", AsyncIOScheduler(jobstores={"default": SQLAlchemyJobStore(url=url)})
+        )
+        await core.jobs._on_leadership(True)
+        next_run_time = core.jobs.scheduler.get_job("tests.keep_schedule").next_run_time
+        core.jobs.scheduler.shutdown(wait=False)
+        return next_run_time
+
+    async def scenario():
+        first = await lead()
+        await asyncio.sleep(0.2)
+        return first, await lead()
+
+    first, second = asyncio.run(scenario())
+
+    assert second == first
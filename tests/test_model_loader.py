@@ -0,0 +1,70 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from core.database.drivers.postgres.loader import ModelLoader
+from core.database.exceptions import DatabaseQueryError
+
+
+class FakeModel:
+    __tablename__ = "fake"
+    rows = {i: SimpleNamespace(id=i, uid=f"uid-{i}") for i in range(1, 21)}
+    queries: list = []
+
+    @classmethod
+    async def find_many(cls, db, ids):
+        cls.queries.append(list(ids))
+        found = [cls.rows[int(str(id))] for id in ids if int(str(id)) in cls.rows]
+        return found, []
+
+
+class FakeSession:
+    def __init__(self):
+        self.info = {}
+
+
+@pytest.fixture(autouse=True)
+def reset_queries():
+    FakeModel.queries = []
+
+
+def test_concurrent_loads_issue_one_query():
+    async def scenario():
+        loader = ModelLoader.for_session(FakeSession())
+        return await asyncio.gather(*(loader.load(FakeModel, i) for i in range(1, 11)))
+
+    rows = asyncio.run(scenario())
+
+    assert [row.id for row in rows] == list(range(1, 11))
+    assert len(FakeModel.queries) == 1
+    assert sorted(FakeModel.queries[0]) == list(range(1, 11))
+
+
+def test_loaded_rows_come_from_the_identity_map():
+    async def scenario():
+        db = FakeSession()
+        first = await ModelLoader.for_session(db).load(FakeModel, 3)
+        # Same session, same loader: by id and by uid without a new query
+        again = await ModelLoader.for_session(db).load(FakeModel, "3")
+        by_uid = await ModelLoader.for_session(db).load(FakeModel, "uid-3")
+        return first, again, by_uid
+
+    first, again, by_uid = asyncio.run(scenario())
+
+    assert first is again is by_uid
+    assert len(FakeModel.queries) == 1
+
+
+def test_missing_rows_fail_only_their_own_load():
+    async def scenario():
+        loader = ModelLoader.for_session(FakeSession())
+        return await asyncio.gather(
+            loader.load(FakeModel, 1), loader.load(FakeModel, 99), return_exceptions=True
+        )
+
+    found, missing = asyncio.run(scenario())
+
+    assert found.id == 1
+    assert isinstance(missing, DatabaseQueryError)
+    assert len(FakeModel.queries) == 1
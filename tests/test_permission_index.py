@@ -0,0 +1,73 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.modules.permissions import bitset
+from app.modules.permissions.bitset import PermissionIndex
+from core.cache.memory import InMemoryCacheBackend
+
+
+class FakeSession:
+    """Answers the index query with the current rows of ``permissions``."""
+
+    def __init__(self, permissions):
+        self.permissions = permissions
+        self.queries = 0
+
+    async def execute(self, _query):
+        self.queries += 1
+        return [
+            SimpleNamespace(id=id, name=name, action=action, type=type)
+            for id, (name, action, type) in self.permissions.items()
+        ]
+
+
+def worker_index() -> PermissionIndex:
+    # A separate instance per simulated worker, bypassing the singleton
+    index = object.__new__(PermissionIndex)
+    index._initialize()
+    return index
+
+
+@pytest.fixture(autouse=True)
+def shared_cache(monkeypatch):
+    monkeypatch.setattr(bitset, "cache", InMemoryCacheBackend())
+    monkeypatch.setattr(bitset, "_GENERATION_CHECK_INTERVAL", 0.0)
+
+
+def test_invalidation_reaches_other_workers():
+    permissions = {1: ("users", "GET", "ENDPOINT"), 2: ("roles", "GET", "ENDPOINT")}
+    db = FakeSession(permissions)
+    first, second = worker_index(), worker_index()
+
+    async def scenario():
+        assert await first.resolve(db, "users", "GET", "ENDPOINT") == 1
+        assert await second.resolve(db, "users", "GET", "ENDPOINT") == 1
+
+        # Renamed through the first worker
+        permissions[1] = ("accounts", "GET", "ENDPOINT")
+        await first.invalidate()
+
+        return (
+            await second.resolve(db, "users", "GET", "ENDPOINT"),
+            await second.resolve(db, "accounts", "GET", "ENDPOINT"),
+        )
+
+    stale, renamed = asyncio.run(scenario())
+
+    assert stale is None
+    assert renamed == 1
+
+
+def test_unchanged_generation_keeps_the_snapshot():
+    db = FakeSession({1: ("users", "GET", "ENDPOINT")})
+    index = worker_index()
+
+    async def scenario():
+        for _ in range(5):
+            await index.resolve(db, "users", "GET", "ENDPOINT")
+
+    asyncio.run(scenario())
+
+    assert db.queries == 1
@@ -0,0 +1,37 @@
+import time
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from core.database.profiling import QueryProfiler
+
+
+@pytest.fixture
+def profiled():
+    # A separate instance, bypassing the singleton
+    profiler = object.__new__(QueryProfiler)
+    profiler._initialize()
+    recorded = []
+    profiler.record = lambda statement, parameters, duration: recorded.append((statement, duration))
+
+    engine = create_engine("sqlite://")
+    profiler.install(engine)
+    yield engine, recorded
+    engine.dispose()
+
+
+def test_failed_statements_leave_no_start_time_behind(profiled):
+    engine, recorded = profiled
+
+    with engine.connect() as conn:
+        with pytest.raises(OperationalError):
+            conn.execute(text("SELECT * FROM missing_table"))
+        # Nothing of the failed statement stays on the pooled connection
+        assert not conn.info.get("query_start_time")
+        time.sleep(0.05)
+        conn.execute(text("SELECT 1"))
+
+    # Only the successful statement, timed from its own start
+    assert [statement for statement, _ in recorded] == ["SELECT 1"]
+    assert recorded[0][1] < 0.05